@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
+import contextlib
 import hashlib
+import io
 import os
 import subprocess
 import sys
@@ -41,9 +43,32 @@ def relpath_from_cwd(path: str) -> str:
 def main() -> int:
     if len(sys.argv) < 2:
         print("Usage: python tools/seal_file.py <path-to-file>")
+        print("       python tools/seal_file.py --server")
         return 2
 
-    target = sys.argv[1]
+    if sys.argv[1] == "--server":
+        return serve()
+    return seal_path(sys.argv[1])
+
+
+def serve() -> int:
+    # One path per stdin line; one "OK <output>" / "ERR <output>" line back
+    for line in sys.stdin:
+        target = line.rstrip("\n")
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                code = seal_path(target)
+        except Exception as e:
+            code = 1
+            output.write(f"ERROR: {e}")
+        status = "ERR" if code else "OK"
+        sys.stdout.write(f"{status} {' '.join(output.getvalue().split())}\n")
+        sys.stdout.flush()
+    return 0
+
+
+def seal_path(target: str) -> int:
     if not os.path.exists(target) or not os.path.isfile(target):
         print(f"ERROR: file not found: {target}")
         return 2
@@ -0,0 +1,194 @@
+"""
+Model Mesh JIT: Optional Numba Scoring Kernel
+
+For very large catalogs (e.g. a gateway aggregating many providers) the
+per-model Python scoring loop in ModelMeshRouter dominates selection
+time. This module fuses filtering, normalization, weighting and argmax
+into a single compiled pass over column arrays of the catalog.
+
+Design Principles:
+- Optional: numba/numpy are not required (pip install .[jit]); the router
+  falls back to its pure-Python path when they are missing
+- Identical scoring: same formula, clamping and tie-breaking as
+  ModelMeshRouter._score_model, compiled without fastmath so the
+  floating point arithmetic is not reordered
+- Compile outside the hot path: warm_up() is called when arrays are built
+"""
+
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Below this size the pure-Python loop beats the array setup overhead
+JIT_MIN_CATALOG_SIZE = 256
+
+# Weight vector layout expected by score_all()
+WEIGHT_ORDER = ("cost", "latency", "quality", "privacy")
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def score_all(
+        cost_in, cost_out, latency_scores, privacy, quality, mask,
+        weights, in_tok, out_tok, cost_scale, cost_offset
+    ):
+        """
+        Score every masked model in one pass and return the best.
+
+        Returns:
+            (index, score) of the highest-scoring model, or (-1, 0.0) if
+            the mask is empty. The first model wins on ties.
+        """
+        best_idx = -1
+        best_score = 0.0
+        for i in range(cost_in.shape[0]):
+            if not mask[i]:
+                continue
+
+            cost = in_tok * cost_in[i] + out_tok * cost_out[i]
+            cost_norm = min(1.0, max(0.0, cost * cost_scale + cost_offset))
+
+            score = (
+                weights[0] * (1.0 - cost_norm) +
+                weights[1] * latency_scores[i] +
+                weights[2] * quality[i] +
+                weights[3] * privacy[i]
+            )
+            score = min(1.0, max(0.0, score))
+
+            if best_idx < 0 or score > best_score:
+                best_idx = i
+                best_score = score
+
+        return best_idx, best_score
+
+
+_warmed_up = False
+
+
+def warm_up() -> None:
+    """
+    Trigger kernel compilation with a tiny dummy call.
+
+    Safe to call repeatedly; only the first call does any work.
+    """
+    global _warmed_up
+    if _warmed_up or not NUMBA_AVAILABLE:
+        return
+
+    one = np.ones(1, dtype=np.float64)
+    score_all(one, one, one, one, one, np.ones(1, dtype=np.bool_),
+              np.ones(4, dtype=np.float64), 1, 1, 1.0, 0.0)
+    _warmed_up = True
+
+
+class CatalogArrays:
+    """
+    Column-array view of a router catalog, laid out for score_all().
+
+    Rebuilt by the router whenever its catalog changes.
+    """
+
+    def __init__(
+        self,
+        catalog: Sequence[Any],
+        cost_in_per_tok: Sequence[float],
+        cost_out_per_tok: Sequence[float],
+        latency_scores: Sequence[float]
+    ):
+        """
+        Build column arrays from a catalog and its precomputed columns.
+
+        Args:
+            catalog: Sequence of ModelInfo
+            cost_in_per_tok: Per-token input price for each model
+            cost_out_per_tok: Per-token output price for each model
+            latency_scores: Precomputed latency score for each model
+        """
+        self.catalog = catalog
+        self.cost_in = np.asarray(cost_in_per_tok, dtype=np.float64)
+        self.cost_out = np.asarray(cost_out_per_tok, dtype=np.float64)
+        self.latency_scores = np.asarray(latency_scores, dtype=np.float64)
+        self.privacy = np.array([m.privacy_rating for m in catalog], dtype=np.float64)
+        self.max_tokens = np.array([m.max_tokens for m in catalog], dtype=np.int64)
+        self.available = np.array([m.available for m in catalog], dtype=np.bool_)
+        self.on_premise = np.array([m.on_premise for m in catalog], dtype=np.bool_)
+
+        # Per agent type: available & capable mask, and quality column
+        self._capable: Dict[str, Any] = {}
+        self._quality: Dict[str, Any] = {}
+
+        warm_up()
+
+    def candidate_mask(self, agent_type: str, restricted: bool, required_window: int) -> Any:
+        """
+        Boolean mask of models passing the router's hard constraints.
+
+        Args:
+            agent_type: Required capability tag
+            restricted: Whether only on-premise models are allowed
+            required_window: Minimum context window a candidate must have
+                (the task's estimated input + output tokens)
+
+        Returns:
+            numpy bool array, one entry per catalog model
+        """
+        capable = self._capable.get(agent_type)
+        if capable is None:
+            tags = np.array(
+                [agent_type in m.capability_tags for m in self.catalog], dtype=np.bool_
+            )
+            capable = self._capable[agent_type] = tags & self.available
+
+        mask = capable & (self.max_tokens >= required_window)
+        if restricted:
+            mask &= self.on_premise
+        return mask
+
+    def quality(self, agent_type: str, score_fn: Callable[[Any], float]) -> Any:
+        """
+        Quality column for an agent type, computed once per type.
+
+        Args:
+            agent_type: Agent type the quality scores are for
+            score_fn: Returns the quality score of a single model
+
+        Returns:
+            numpy float array, one entry per catalog model
+        """
+        column = self._quality.get(agent_type)
+        if column is None:
+            column = self._quality[agent_type] = np.array(
+                [score_fn(m) for m in self.catalog], dtype=np.float64
+            )
+        return column
+
+    def select(
+        self,
+        mask: Any,
+        quality: Any,
+        weights: Dict[str, float],
+        in_tok: int,
+        out_tok: int,
+        cost_scale: float,
+        cost_offset: float
+    ) -> Tuple[int, float]:
+        """
+        Run the fused kernel over the masked catalog.
+
+        Returns:
+            (index, score) of the best model, or (-1, 0.0) if none qualify
+        """
+        weight_vec = np.array([weights[k] for k in WEIGHT_ORDER], dtype=np.float64)
+        idx, score = score_all(
+            self.cost_in, self.cost_out, self.latency_scores, self.privacy,
+            quality, mask, weight_vec, in_tok, out_tok, cost_scale, cost_offset
+        )
+        return int(idx), float(score)
@@ -1,563 +1,705 @@
-"""
-The Model Mesh Router: Dynamic Multi-Dimensional Model Selection
-
-This implements intelligent model routing based on:
-- Cost efficiency (tokens/dollar)
-- Latency (response time)
-- Quality (capability match, benchmarks)
-- Privacy (data residency, on-premise)
-
-Design Principles:
-- Multi-Dimensional Scoring: Weighted combination of factors
-- Adaptive: Can learn from outcomes (future)
-- Fallback: Graceful degradation on failures
-- Transparent: Scoring is auditable
-"""
-
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
-import math
-
-
-@dataclass
-class ModelInfo:
-    """
-    Metadata about an available model.
-    
-    This catalog drives routing decisions.
-    """
-    name: str                          # e.g., "gpt-4-turbo", "claude-3-opus"
-    provider: str                      # e.g., "openai", "anthropic", "azure"
-    
-    # Cost factors
-    cost_per_1k_input_tokens: float    # USD per 1K input tokens
-    cost_per_1k_output_tokens: float   # USD per 1K output tokens
-    
-    # Performance factors
-    avg_latency_ms: float              # Average response latency
-    max_tokens: int                    # Context window size
-    
-    # Quality factors
-    capability_tags: List[str]         # e.g., ["coding", "reasoning", "multimodal"]
-    benchmark_scores: Dict[str, float] # e.g., {"mmlu": 0.89, "humaneval": 0.85}
-    
-    # Privacy factors
-    on_premise: bool                   # Can run locally/air-gapped
-    data_residency: str                # e.g., "us", "eu", "china", "global"
-    privacy_rating: float              # 0.0 (public cloud) to 1.0 (local-only)
-    
-    # Availability
-    available: bool = True             # Currently available
-    rate_limit_rpm: Optional[int] = None  # Requests per minute
-
-
-@dataclass
-class TaskMetadata:
-    """
-    Metadata about a task used for routing.
-    
-    Extracted from SwarmTask for routing decisions.
-    """
-    agent_type: str                    # Specialist type
-    task_type: str                     # More specific categorization
-    estimated_input_tokens: int
-    estimated_output_tokens: int
-    priority: str                      # "low", "medium", "high", "critical"
-    privacy_requirement: str           # "public", "confidential", "restricted"
-    latency_sensitivity: str           # "batch", "interactive", "realtime"
-
-
-class ModelMeshRouter:
-    """
-    The Model Mesh Router: Intelligent Model Selection
-    
-    Core Algorithm:
-    1. Filter models by hard constraints (availability, capability)
-    2. Score remaining models on multiple dimensions
-    3. Select highest-scoring model
-    4. Fallback if score below threshold
-    
-    Scoring Dimensions:
-    - Cost: Lower is better (normalized)
-    - Latency: Lower is better (normalized)
-    - Quality: Higher is better (embedding similarity + benchmarks)
-    - Privacy: Higher is better (based on requirements)
-    
-    Future Enhancements:
-    - Learn from outcomes (fine-tune weights)
-    - Auto-discover new models
-    - Agentic negotiation for complex decisions
-    """
-
-    def __init__(
-        self,
-        model_catalog: List[ModelInfo],
-        default_weights: Optional[Dict[str, float]] = None,
-        min_score_threshold: float = 0.5
-    ):
-        """
-        Initialize the router with a model catalog.
-        
-        Args:
-            model_catalog: List of available models
-            default_weights: Default scoring weights
-            min_score_threshold: Minimum score to accept (else trigger fallback)
-        """
-        self.catalog = model_catalog
-        self.min_score_threshold = min_score_threshold
-        
-        # Default weights: cost, latency, quality, privacy
-        self.default_weights = default_weights or {
-            "cost": 0.3,
-            "latency": 0.3,
-            "quality": 0.3,
-            "privacy": 0.1
-        }
-        
-        # Precompute normalization ranges for scoring
-        self._compute_normalization_ranges()
-    
-    def select_model(self, task: Any) -> str:
-        """
-        Select the optimal model for a task.
-        
-        This is the main entry point called by the scheduler.
-        
-        Args:
-            task: SwarmTask (must have agent_type and payload)
-            
-        Returns:
-            The name of the selected model
-        """
-        # Extract task metadata
-        metadata = self._extract_task_metadata(task)
-        
-        # Get adaptive weights based on task requirements
-        weights = self._get_adaptive_weights(metadata)
-        
-        # Filter models by hard constraints
-        candidates = self._filter_candidates(metadata)
-        
-        if not candidates:
-            # No models meet constraints - return fallback
-            return self._get_fallback_model()
-        
-        # Score each candidate
-        scored_models = []
-        for model in candidates:
-            score = self._score_model(model, metadata, weights)
-            scored_models.append((model, score))
-        
-        # Sort by score (descending)
-        scored_models.sort(key=lambda x: x[1], reverse=True)
-        
-        best_model, best_score = scored_models[0]
-        
-        # Check if score meets threshold
-        if best_score < self.min_score_threshold:
-            # Score too low - may trigger agentic negotiation (future)
-            # For now, return best available or fallback
-            if best_score > 0:
-                return best_model.name
-            else:
-                return self._get_fallback_model()
-        
-        return best_model.name
-    
-    def _extract_task_metadata(self, task: Any) -> TaskMetadata:
-        """
-        Extract routing metadata from a SwarmTask.
-        
-        Args:
-            task: SwarmTask object
-            
-        Returns:
-            TaskMetadata for routing
-        """
-        payload = task.payload if isinstance(task.payload, dict) else {}
-        
-        # Estimate token counts (rough heuristic)
-        input_text = str(payload.get("instruction", "") + payload.get("query", ""))
-        estimated_input = max(100, len(input_text) // 4)  # ~4 chars per token
-        estimated_output = payload.get("max_tokens", 1000)
-        
-        return TaskMetadata(
-            agent_type=task.agent_type,
-            task_type=payload.get("task_type", task.agent_type),
-            estimated_input_tokens=estimated_input,
-            estimated_output_tokens=estimated_output,
-            priority=payload.get("priority", "medium"),
-            privacy_requirement=payload.get("privacy", "public"),
-            latency_sensitivity=payload.get("latency", "interactive")
-        )
-    
-    def _get_adaptive_weights(self, metadata: TaskMetadata) -> Dict[str, float]:
-        """
-        Adjust scoring weights based on task requirements.
-        
-        Examples:
-        - High privacy requirement: boost privacy weight
-        - Critical priority: boost latency weight
-        - Batch processing: boost cost weight
-        
-        Args:
-            metadata: Task metadata
-            
-        Returns:
-            Adjusted weights dict
-        """
-        weights = self.default_weights.copy()
-        
-        # Privacy boost
-        if metadata.privacy_requirement in ["confidential", "restricted"]:
-            weights["privacy"] = 0.4
-            weights["cost"] = 0.2
-            weights["latency"] = 0.2
-            weights["quality"] = 0.2
-        
-        # Latency boost
-        if metadata.latency_sensitivity == "realtime":
-            weights["latency"] = 0.5
-            weights["cost"] = 0.1
-            weights["quality"] = 0.3
-            weights["privacy"] = 0.1
-        
-        # Cost boost
-        if metadata.priority == "low" or metadata.latency_sensitivity == "batch":
-            weights["cost"] = 0.5
-            weights["latency"] = 0.1
-            weights["quality"] = 0.3
-            weights["privacy"] = 0.1
-        
-        # Normalize to sum to 1.0
-        total = sum(weights.values())
-        return {k: v / total for k, v in weights.items()}
-    
-    def _filter_candidates(self, metadata: TaskMetadata) -> List[ModelInfo]:
-        """
-        Filter models by hard constraints.
-        
-        Constraints:
-        - Model must be available
-        - Must have required capabilities
-        - Must meet privacy requirements
-        - Must have sufficient context window
-        
-        Args:
-            metadata: Task metadata
-            
-        Returns:
-            List of candidate models
-        """
-        candidates = []
-        
-        for model in self.catalog:
-            # Must be available
-            if not model.available:
-                continue
-            
-            # Must have capability for this agent type
-            if metadata.agent_type not in model.capability_tags:
-                continue
-            
-            # Privacy constraint
-            if metadata.privacy_requirement == "restricted" and not model.on_premise:
-                continue
-            
-            # Context window constraint
-            total_tokens = metadata.estimated_input_tokens + metadata.estimated_output_tokens
-            if model.max_tokens < total_tokens:
-                continue
-            
-            candidates.append(model)
-        
-        return candidates
-    
-    def _score_model(
-        self,
-        model: ModelInfo,
-        metadata: TaskMetadata,
-        weights: Dict[str, float]
-    ) -> float:
-        """
-        Compute multi-dimensional score for a model.
-        
-        Each dimension is normalized to [0, 1] where higher is better.
-        
-        Args:
-            model: The model to score
-            metadata: Task metadata
-            weights: Scoring weights
-            
-        Returns:
-            Overall score (0.0 to 1.0)
-        """
-        # 1. Cost score (lower cost = higher score)
-        cost = self._estimate_cost(model, metadata)
-        cost_score = 1.0 - self._normalize(
-            cost,
-            self.norm_ranges["cost"]["min"],
-            self.norm_ranges["cost"]["max"]
-        )
-        
-        # 2. Latency score (lower latency = higher score)
-        latency_score = 1.0 - self._normalize(
-            model.avg_latency_ms,
-            self.norm_ranges["latency"]["min"],
-            self.norm_ranges["latency"]["max"]
-        )
-        
-        # 3. Quality score (higher quality = higher score)
-        quality_score = self._compute_quality_score(model, metadata)
-        
-        # 4. Privacy score
-        privacy_score = model.privacy_rating
-        
-        # Weighted combination
-        total_score = (
-            weights["cost"] * cost_score +
-            weights["latency"] * latency_score +
-            weights["quality"] * quality_score +
-            weights["privacy"] * privacy_score
-        )
-        
-        return max(0.0, min(1.0, total_score))  # Clamp to [0, 1]
-    
-    def _estimate_cost(self, model: ModelInfo, metadata: TaskMetadata) -> float:
-        """
-        Estimate total cost for this task on this model.
-        
-        Args:
-            model: The model
-            metadata: Task metadata
-            
-        Returns:
-            Estimated cost in USD
-        """
-        input_cost = (metadata.estimated_input_tokens / 1000) * model.cost_per_1k_input_tokens
-        output_cost = (metadata.estimated_output_tokens / 1000) * model.cost_per_1k_output_tokens
-        return input_cost + output_cost
-    
-    def _compute_quality_score(self, model: ModelInfo, metadata: TaskMetadata) -> float:
-        """
-        Compute quality score based on benchmarks and capabilities.
-        
-        Future: Use embedding similarity between task and model capabilities.
-        
-        Args:
-            model: The model
-            metadata: Task metadata
-            
-        Returns:
-            Quality score (0.0 to 1.0)
-        """
-        # Simple heuristic: average relevant benchmark scores
-        relevant_benchmarks = []
-        
-        if metadata.agent_type == "coder":
-            relevant_benchmarks = ["humaneval", "mbpp"]
-        elif metadata.agent_type == "researcher":
-            relevant_benchmarks = ["mmlu", "drop"]
-        elif metadata.agent_type == "critic":
-            relevant_benchmarks = ["mmlu", "truthfulqa"]
-        else:
-            relevant_benchmarks = ["mmlu"]  # General fallback
-        
-        scores = [
-            model.benchmark_scores.get(bench, 0.5)
-            for bench in relevant_benchmarks
-        ]
-        
-        if scores:
-            return sum(scores) / len(scores)
-        else:
-            return 0.5  # Default to median
-    
-    def _normalize(self, value: float, min_val: float, max_val: float) -> float:
-        """
-        Normalize a value to [0, 1] range.
-        
-        Args:
-            value: The value to normalize
-            min_val: Minimum value in range
-            max_val: Maximum value in range
-            
-        Returns:
-            Normalized value (0.0 to 1.0)
-        """
-        if max_val == min_val:
-            return 0.5
-        
-        normalized = (value - min_val) / (max_val - min_val)
-        return max(0.0, min(1.0, normalized))
-    
-    def _compute_normalization_ranges(self) -> None:
-        """
-        Precompute min/max ranges for normalization.
-        
-        This is called once during initialization.
-        """
-        if not self.catalog:
-            self.norm_ranges = {
-                "cost": {"min": 0.0, "max": 1.0},
-                "latency": {"min": 0.0, "max": 1000.0}
-            }
-            return
-        
-        # Compute cost range (estimate for median task)
-        median_task_tokens = 2000  # 1K input + 1K output
-        costs = []
-        for model in self.catalog:
-            cost = (1 * model.cost_per_1k_input_tokens + 1 * model.cost_per_1k_output_tokens)
-            costs.append(cost)
-        
-        # Compute latency range
-        latencies = [m.avg_latency_ms for m in self.catalog]
-        
-        self.norm_ranges = {
-            "cost": {"min": min(costs), "max": max(costs)},
-            "latency": {"min": min(latencies), "max": max(latencies)}
-        }
-    
-    def _get_fallback_model(self) -> str:
-        """
-        Get fallback model when routing fails.
-        
-        Returns:
-            Name of fallback model
-        """
-        # Find cheapest available model
-        available = [m for m in self.catalog if m.available]
-        if available:
-            cheapest = min(
-                available,
-                key=lambda m: m.cost_per_1k_input_tokens + m.cost_per_1k_output_tokens
-            )
-            return cheapest.name
-        
-        return "default-model"  # Ultimate fallback
-
-
-# --- Example Model Catalog ---
-
-def create_example_catalog() -> List[ModelInfo]:
-    """
-    Create an example model catalog for demonstration.
-    
-    Returns:
-        List of ModelInfo objects
-    """
-    return [
-        ModelInfo(
-            name="gpt-4-turbo",
-            provider="openai",
-            cost_per_1k_input_tokens=0.01,
-            cost_per_1k_output_tokens=0.03,
-            avg_latency_ms=2000,
-            max_tokens=128000,
-            capability_tags=["coder", "researcher", "critic", "planner"],
-            benchmark_scores={"mmlu": 0.86, "humaneval": 0.67},
-            on_premise=False,
-            data_residency="us",
-            privacy_rating=0.3,
-            available=True,
-            rate_limit_rpm=500
-        ),
-        ModelInfo(
-            name="claude-3-opus",
-            provider="anthropic",
-            cost_per_1k_input_tokens=0.015,
-            cost_per_1k_output_tokens=0.075,
-            avg_latency_ms=3000,
-            max_tokens=200000,
-            capability_tags=["coder", "researcher", "critic", "planner"],
-            benchmark_scores={"mmlu": 0.89, "humaneval": 0.84},
-            on_premise=False,
-            data_residency="us",
-            privacy_rating=0.3,
-            available=True,
-            rate_limit_rpm=400
-        ),
-        ModelInfo(
-            name="gemini-pro-1.5",
-            provider="google",
-            cost_per_1k_input_tokens=0.0025,
-            cost_per_1k_output_tokens=0.0075,
-            avg_latency_ms=1500,
-            max_tokens=1000000,
-            capability_tags=["researcher", "critic", "planner"],
-            benchmark_scores={"mmlu": 0.81, "drop": 0.82},
-            on_premise=False,
-            data_residency="global",
-            privacy_rating=0.2,
-            available=True,
-            rate_limit_rpm=1000
-        ),
-        ModelInfo(
-            name="llama-3-70b-local",
-            provider="meta",
-            cost_per_1k_input_tokens=0.0,  # Free if self-hosted
-            cost_per_1k_output_tokens=0.0,
-            avg_latency_ms=5000,
-            max_tokens=8192,
-            capability_tags=["coder", "researcher"],
-            benchmark_scores={"mmlu": 0.79, "humaneval": 0.62},
-            on_premise=True,
-            data_residency="local",
-            privacy_rating=1.0,
-            available=True,
-            rate_limit_rpm=None
-        ),
-    ]
-
-
-# --- Usage Example ---
-
-if __name__ == "__main__":
-    from collections import namedtuple
-    
-    # Create router with example catalog
-    catalog = create_example_catalog()
-    router = ModelMeshRouter(catalog)
-    
-    # Create mock task
-    MockTask = namedtuple('MockTask', ['agent_type', 'payload'])
-    
-    # Test 1: Cost-sensitive research task
-    task1 = MockTask(
-        agent_type='researcher',
-        payload={
-            "query": "What is quantum computing?",
-            "priority": "low",
-            "latency": "batch"
-        }
-    )
-    
-    selected = router.select_model(task1)
-    print(f"Cost-sensitive research task: {selected}")
-    
-    # Test 2: High-privacy coding task
-    task2 = MockTask(
-        agent_type='coder',
-        payload={
-            "instruction": "Implement encryption algorithm",
-            "privacy": "restricted",
-            "requires_llm": True
-        }
-    )
-    
-    selected = router.select_model(task2)
-    print(f"High-privacy coding task: {selected}")
-    
-    # Test 3: Realtime critical task
-    task3 = MockTask(
-        agent_type='critic',
-        payload={
-            "artifact": "security code",
-            "priority": "critical",
-            "latency": "realtime"
-        }
-    )
-    
-    selected = router.select_model(task3)
-    print(f"Realtime critical task: {selected}")
+"""
+The Model Mesh Router: Dynamic Multi-Dimensional Model Selection
+
+This implements intelligent model routing based on:
+- Cost efficiency (tokens/dollar)
+- Latency (response time)
+- Quality (capability match, benchmarks)
+- Privacy (data residency, on-premise)
+
+Design Principles:
+- Multi-Dimensional Scoring: Weighted combination of factors
+- Adaptive: Can learn from outcomes (future)
+- Fallback: Graceful degradation on failures
+- Transparent: Scoring is auditable
+"""
+
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, replace
+from operator import itemgetter
+import functools
+import math
+
+try:
+    from agents import model_mesh_jit
+except ImportError:  # run as a script from agents/
+    import model_mesh_jit  # type: ignore[no-redef]
+
+
+# Weight profiles for _get_adaptive_weights. Each already sums to 1.0, so
+# they are returned as-is without a per-call copy or normalization pass.
+_WEIGHTS_PRIVACY = {"cost": 0.2, "latency": 0.2, "quality": 0.2, "privacy": 0.4}
+_WEIGHTS_REALTIME = {"cost": 0.1, "latency": 0.5, "quality": 0.3, "privacy": 0.1}
+_WEIGHTS_COST = {"cost": 0.5, "latency": 0.1, "quality": 0.3, "privacy": 0.1}
+
+# Selection relies on the profiles being pre-normalized; catch a bad edit
+# at import rather than as silently skewed scores
+assert all(
+    math.isclose(sum(weights.values()), 1.0)
+    for weights in (_WEIGHTS_PRIVACY, _WEIGHTS_REALTIME, _WEIGHTS_COST)
+), "adaptive weight profiles must each sum to 1.0"
+
+
+def _safe_len(value: Any) -> int:
+    """Length of a string payload field; non-strings count as empty."""
+    return len(value) if isinstance(value, str) else 0
+
+
+@dataclass(slots=True, frozen=True)
+class ModelInfo:
+    """
+    Metadata about an available model.
+    
+    This catalog drives routing decisions. Instances are immutable so one
+    catalog can be shared between routers; use
+    ModelMeshRouter.update_availability() to toggle a model.
+    """
+    name: str                          # e.g., "gpt-4-turbo", "claude-3-opus"
+    provider: str                      # e.g., "openai", "anthropic", "azure"
+    
+    # Cost factors
+    cost_per_1k_input_tokens: float    # USD per 1K input tokens
+    cost_per_1k_output_tokens: float   # USD per 1K output tokens
+    
+    # Performance factors
+    avg_latency_ms: float              # Average response latency
+    max_tokens: int                    # Context window size
+    
+    # Quality factors
+    capability_tags: List[str]         # e.g., ["coding", "reasoning", "multimodal"]
+    benchmark_scores: Dict[str, float] # e.g., {"mmlu": 0.89, "humaneval": 0.85}
+    
+    # Privacy factors
+    on_premise: bool                   # Can run locally/air-gapped
+    data_residency: str                # e.g., "us", "eu", "china", "global"
+    privacy_rating: float              # 0.0 (public cloud) to 1.0 (local-only)
+    
+    # Availability
+    available: bool = True             # Currently available
+    rate_limit_rpm: Optional[int] = None  # Requests per minute
+
+
+@dataclass(slots=True, frozen=True)
+class TaskMetadata:
+    """
+    Metadata about a task used for routing.
+    
+    Extracted from SwarmTask for routing decisions.
+    """
+    agent_type: str                    # Specialist type
+    task_type: str                     # More specific categorization
+    estimated_input_tokens: int
+    estimated_output_tokens: int
+    priority: str                      # "low", "medium", "high", "critical"
+    privacy_requirement: str           # "public", "confidential", "restricted"
+    latency_sensitivity: str           # "batch", "interactive", "realtime"
+
+
+class ModelMeshRouter:
+    """
+    The Model Mesh Router: Intelligent Model Selection
+    
+    Core Algorithm:
+    1. Filter models by hard constraints (availability, capability)
+    2. Score remaining models on multiple dimensions
+    3. Select highest-scoring model
+    4. Fallback if score below threshold
+    
+    Scoring Dimensions:
+    - Cost: Lower is better (normalized)
+    - Latency: Lower is better (normalized)
+    - Quality: Higher is better (embedding similarity + benchmarks)
+    - Privacy: Higher is better (based on requirements)
+    
+    Future Enhancements:
+    - Learn from outcomes (fine-tune weights)
+    - Auto-discover new models
+    - Agentic negotiation for complex decisions
+    """
+
+    def __init__(
+        self,
+        model_catalog: List[ModelInfo],
+        default_weights: Optional[Dict[str, float]] = None,
+        min_score_threshold: float = 0.5
+    ):
+        """
+        Initialize the router with a model catalog.
+        
+        Args:
+            model_catalog: List of available models
+            default_weights: Default scoring weights
+            min_score_threshold: Minimum score to accept (else trigger fallback)
+        """
+        self.catalog = model_catalog
+        self.min_score_threshold = min_score_threshold
+        
+        # Default weights: cost, latency, quality, privacy
+        self.default_weights = default_weights or {
+            "cost": 0.3,
+            "latency": 0.3,
+            "quality": 0.3,
+            "privacy": 0.1
+        }
+        
+        # Normalize default weights once so selection never has to
+        total = sum(self.default_weights.values())
+        self._default_weights = {k: v / total for k, v in self.default_weights.items()}
+        
+        # Precompute catalog lookups and normalization ranges for scoring
+        self._build_indices()
+    
+    def update_availability(self, name: str, available: bool) -> None:
+        """
+        Mark a catalog model as available or unavailable.
+        
+        ModelInfo is frozen, so the entry is replaced rather than mutated
+        and the precomputed catalog lookups are rebuilt.
+        
+        Args:
+            name: Model name as listed in the catalog
+            available: New availability flag
+        """
+        if name not in self._catalog_names:
+            raise KeyError(f"Unknown model: {name}")
+        
+        self.catalog = [
+            replace(m, available=available) if m.name == name else m
+            for m in self.catalog
+        ]
+        self._build_indices()
+    
+    def _build_indices(self) -> None:
+        """
+        Precompute catalog-derived lookups used on every selection.
+        
+        Must be re-run whenever self.catalog is replaced or reordered.
+        """
+        # Index -> name, in catalog order
+        self._catalog_names = tuple(m.name for m in self.catalog)
+        
+        # Capability tag -> indices of available models with that tag
+        by_capability: Dict[str, List[int]] = {}
+        for idx, model in enumerate(self.catalog):
+            if model.available:
+                for tag in model.capability_tags:
+                    by_capability.setdefault(tag, []).append(idx)
+        self._by_capability = {tag: tuple(idxs) for tag, idxs in by_capability.items()}
+        
+        # Per-token cost coefficients (catalog prices are per 1K tokens)
+        self._cost_in_per_tok = tuple(
+            m.cost_per_1k_input_tokens / 1000.0 for m in self.catalog
+        )
+        self._cost_out_per_tok = tuple(
+            m.cost_per_1k_output_tokens / 1000.0 for m in self.catalog
+        )
+        
+        self._compute_normalization_ranges()
+        
+        # Fallback is static for a given catalog - resolve it once
+        self._fallback_model_name = self._compute_fallback_model()
+        
+        # Fused Numba kernel for very large catalogs (optional)
+        self._jit_arrays = None
+        if (model_mesh_jit.NUMBA_AVAILABLE and
+                len(self.catalog) >= model_mesh_jit.JIT_MIN_CATALOG_SIZE):
+            self._jit_arrays = model_mesh_jit.CatalogArrays(
+                self.catalog,
+                self._cost_in_per_tok,
+                self._cost_out_per_tok,
+                self._latency_scores
+            )
+    
+    def select_model(self, task: Any) -> str:
+        """
+        Select the optimal model for a task.
+        
+        This is the main entry point called by the scheduler.
+        
+        Args:
+            task: SwarmTask (must have agent_type and payload)
+            
+        Returns:
+            The name of the selected model
+        """
+        # Extract task metadata
+        metadata = self._extract_task_metadata(task)
+        
+        if self._jit_arrays is not None:
+            weights = self._get_adaptive_weights(metadata)
+            best_idx, best_score = self._select_jit(metadata, weights)
+            if best_idx < 0:
+                # No models meet constraints - return fallback
+                return self._get_fallback_model()
+        else:
+            # Filter models by hard constraints
+            candidates = self._filter_candidates(metadata)
+            
+            if not candidates:
+                # No models meet constraints - return fallback
+                return self._get_fallback_model()
+            
+            # Get adaptive weights based on task requirements
+            weights = self._get_adaptive_weights(metadata)
+            
+            if len(candidates) == 1:
+                # Nothing to rank, but the score still decides the fallback
+                best_idx = candidates[0]
+                best_score = self._score_model(best_idx, metadata, weights)
+            else:
+                # Score each candidate
+                scored_models = []
+                for idx in candidates:
+                    score = self._score_model(idx, metadata, weights)
+                    scored_models.append((idx, score))
+                
+                # Pick the highest score (first wins on ties)
+                best_idx, best_score = max(scored_models, key=itemgetter(1))
+        
+        # Check if score meets threshold
+        if best_score < self.min_score_threshold:
+            # Score too low - may trigger agentic negotiation (future)
+            # For now, return best available or fallback
+            if best_score > 0:
+                return self._catalog_names[best_idx]
+            else:
+                return self._get_fallback_model()
+        
+        return self._catalog_names[best_idx]
+    
+    def _select_jit(
+        self,
+        metadata: TaskMetadata,
+        weights: Dict[str, float]
+    ) -> Tuple[int, float]:
+        """
+        Filter and score the whole catalog with the fused Numba kernel.
+        
+        Equivalent to _filter_candidates + _score_model + max().
+        
+        Args:
+            metadata: Task metadata
+            weights: Scoring weights
+            
+        Returns:
+            (catalog index, score) of the best model, or (-1, 0.0) if none
+        """
+        arrays = self._jit_arrays
+        assert arrays is not None
+        mask = arrays.candidate_mask(
+            metadata.agent_type,
+            metadata.privacy_requirement == "restricted",
+            metadata.estimated_input_tokens + metadata.estimated_output_tokens
+        )
+        quality = arrays.quality(
+            metadata.agent_type,
+            lambda model: self._compute_quality_score(model, metadata)
+        )
+        return arrays.select(
+            mask,
+            quality,
+            weights,
+            metadata.estimated_input_tokens,
+            metadata.estimated_output_tokens,
+            self._cost_scale,
+            self._cost_offset
+        )
+    
+    def _extract_task_metadata(self, task: Any) -> TaskMetadata:
+        """
+        Extract routing metadata from a SwarmTask.
+        
+        Args:
+            task: SwarmTask object
+            
+        Returns:
+            TaskMetadata for routing
+        """
+        payload = task.payload if isinstance(task.payload, dict) else {}
+        
+        # Estimate token counts (rough heuristic, no concatenation of prompts)
+        input_chars = _safe_len(payload.get("instruction")) + _safe_len(payload.get("query"))
+        estimated_input = max(100, input_chars // 4)  # ~4 chars per token
+        estimated_output = payload.get("max_tokens", 1000)
+        
+        return TaskMetadata(
+            agent_type=task.agent_type,
+            task_type=payload.get("task_type", task.agent_type),
+            estimated_input_tokens=estimated_input,
+            estimated_output_tokens=estimated_output,
+            priority=payload.get("priority", "medium"),
+            privacy_requirement=payload.get("privacy", "public"),
+            latency_sensitivity=payload.get("latency", "interactive")
+        )
+    
+    def _get_adaptive_weights(self, metadata: TaskMetadata) -> Dict[str, float]:
+        """
+        Adjust scoring weights based on task requirements.
+        
+        Examples:
+        - High privacy requirement: boost privacy weight
+        - Critical priority: boost latency weight
+        - Batch processing: boost cost weight
+        
+        Args:
+            metadata: Task metadata
+            
+        Returns:
+            Adjusted weights dict (shared, normalized - do not mutate)
+        """
+        # Checked in precedence order: cost, then latency, then privacy
+        if metadata.priority == "low" or metadata.latency_sensitivity == "batch":
+            return _WEIGHTS_COST
+        
+        if metadata.latency_sensitivity == "realtime":
+            return _WEIGHTS_REALTIME
+        
+        if metadata.privacy_requirement in ("confidential", "restricted"):
+            return _WEIGHTS_PRIVACY
+        
+        return self._default_weights
+    
+    def _filter_candidates(self, metadata: TaskMetadata) -> List[int]:
+        """
+        Filter models by hard constraints.
+        
+        Constraints:
+        - Model must be available
+        - Must have required capabilities
+        - Must meet privacy requirements
+        - Must have sufficient context window
+        
+        Args:
+            metadata: Task metadata
+            
+        Returns:
+            Catalog indices of candidate models
+        """
+        candidates = []
+        total_tokens = metadata.estimated_input_tokens + metadata.estimated_output_tokens
+        
+        # Capability index only holds available models with this tag
+        for idx in self._by_capability.get(metadata.agent_type, ()):
+            model = self.catalog[idx]
+            
+            # Privacy constraint
+            if metadata.privacy_requirement == "restricted" and not model.on_premise:
+                continue
+            
+            # Context window constraint
+            if model.max_tokens < total_tokens:
+                continue
+            
+            candidates.append(idx)
+        
+        return candidates
+    
+    def _score_model(
+        self,
+        idx: int,
+        metadata: TaskMetadata,
+        weights: Dict[str, float]
+    ) -> float:
+        """
+        Compute multi-dimensional score for a model.
+        
+        Each dimension is normalized to [0, 1] where higher is better.
+        
+        Args:
+            idx: Catalog index of the model to score
+            metadata: Task metadata
+            weights: Scoring weights
+            
+        Returns:
+            Overall score (0.0 to 1.0)
+        """
+        model = self.catalog[idx]
+        
+        # 1. Cost score (lower cost = higher score)
+        cost = self._estimate_cost(idx, metadata)
+        cost_score = 1.0 - min(1.0, max(0.0, cost * self._cost_scale + self._cost_offset))
+        
+        # 2. Latency score (lower latency = higher score, task-independent)
+        latency_score = self._latency_scores[idx]
+        
+        # 3. Quality score (higher quality = higher score)
+        quality_score = self._compute_quality_score(model, metadata)
+        
+        # 4. Privacy score
+        privacy_score = model.privacy_rating
+        
+        # Weighted combination
+        total_score = (
+            weights["cost"] * cost_score +
+            weights["latency"] * latency_score +
+            weights["quality"] * quality_score +
+            weights["privacy"] * privacy_score
+        )
+        
+        return max(0.0, min(1.0, total_score))  # Clamp to [0, 1]
+    
+    def _estimate_cost(self, idx: int, metadata: TaskMetadata) -> float:
+        """
+        Estimate total cost for this task on this model.
+        
+        Args:
+            idx: Catalog index of the model
+            metadata: Task metadata
+            
+        Returns:
+            Estimated cost in USD
+        """
+        return (
+            metadata.estimated_input_tokens * self._cost_in_per_tok[idx] +
+            metadata.estimated_output_tokens * self._cost_out_per_tok[idx]
+        )
+    
+    def _compute_quality_score(self, model: ModelInfo, metadata: TaskMetadata) -> float:
+        """
+        Compute quality score based on benchmarks and capabilities.
+        
+        Future: Use embedding similarity between task and model capabilities.
+        
+        Args:
+            model: The model
+            metadata: Task metadata
+            
+        Returns:
+            Quality score (0.0 to 1.0)
+        """
+        # Simple heuristic: average relevant benchmark scores
+        relevant_benchmarks = []
+        
+        if metadata.agent_type == "coder":
+            relevant_benchmarks = ["humaneval", "mbpp"]
+        elif metadata.agent_type == "researcher":
+            relevant_benchmarks = ["mmlu", "drop"]
+        elif metadata.agent_type == "critic":
+            relevant_benchmarks = ["mmlu", "truthfulqa"]
+        else:
+            relevant_benchmarks = ["mmlu"]  # General fallback
+        
+        scores = [
+            model.benchmark_scores.get(bench, 0.5)
+            for bench in relevant_benchmarks
+        ]
+        
+        if scores:
+            return sum(scores) / len(scores)
+        else:
+            return 0.5  # Default to median
+    
+    @staticmethod
+    def _affine_coefficients(value_range: Dict[str, float]) -> Tuple[float, float]:
+        """
+        Fold a min/max range into (scale, offset) for normalization.
+        
+        value * scale + offset maps the range onto [0, 1] (before clamping).
+        A degenerate range yields scale 0.0 and offset 0.5, so every value
+        normalizes to the midpoint without a per-call branch.
+        
+        Args:
+            value_range: Dict with "min" and "max" keys
+            
+        Returns:
+            (scale, offset) tuple
+        """
+        span = value_range["max"] - value_range["min"]
+        if span == 0:
+            return 0.0, 0.5
+        
+        scale = 1.0 / span
+        return scale, -value_range["min"] * scale
+    
+    def _compute_normalization_ranges(self) -> None:
+        """
+        Precompute min/max ranges for normalization.
+        
+        This is called once during initialization.
+        """
+        if not self.catalog:
+            self.norm_ranges = {
+                "cost": {"min": 0.0, "max": 1.0},
+                "latency": {"min": 0.0, "max": 1000.0}
+            }
+        else:
+            # Compute cost range (estimate for median task)
+            median_task_tokens = 2000  # 1K input + 1K output
+            costs = []
+            for model in self.catalog:
+                cost = (1 * model.cost_per_1k_input_tokens + 1 * model.cost_per_1k_output_tokens)
+                costs.append(cost)
+            
+            # Compute latency range
+            latencies = [m.avg_latency_ms for m in self.catalog]
+            
+            self.norm_ranges = {
+                "cost": {"min": min(costs), "max": max(costs)},
+                "latency": {"min": min(latencies), "max": max(latencies)}
+            }
+        
+        self._cost_scale, self._cost_offset = self._affine_coefficients(self.norm_ranges["cost"])
+        
+        # Latency does not depend on the task, so score each model up front
+        latency_scale, latency_offset = self._affine_coefficients(self.norm_ranges["latency"])
+        self._latency_scores = tuple(
+            1.0 - min(1.0, max(0.0, m.avg_latency_ms * latency_scale + latency_offset))
+            for m in self.catalog
+        )
+    
+    def _get_fallback_model(self) -> str:
+        """
+        Get fallback model when routing fails.
+        
+        Returns:
+            Name of fallback model
+        """
+        return self._fallback_model_name
+    
+    def _compute_fallback_model(self) -> str:
+        """
+        Resolve the fallback model for the current catalog.
+        
+        This is called once during initialization.
+        
+        Returns:
+            Name of the cheapest available model
+        """
+        # Find cheapest available model
+        available = [m for m in self.catalog if m.available]
+        if available:
+            cheapest = min(
+                available,
+                key=lambda m: m.cost_per_1k_input_tokens + m.cost_per_1k_output_tokens
+            )
+            return cheapest.name
+        
+        return "default-model"  # Ultimate fallback
+
+
+# --- Example Model Catalog ---
+
+@functools.lru_cache(maxsize=1)
+def create_example_catalog() -> Tuple[ModelInfo, ...]:
+    """
+    Create an example model catalog for demonstration.
+    
+    Built once and shared; wrap in list() if you need to modify it.
+    
+    Returns:
+        Tuple of ModelInfo objects
+    """
+    return (
+        ModelInfo(
+            name="gpt-4-turbo",
+            provider="openai",
+            cost_per_1k_input_tokens=0.01,
+            cost_per_1k_output_tokens=0.03,
+            avg_latency_ms=2000,
+            max_tokens=128000,
+            capability_tags=["coder", "researcher", "critic", "planner"],
+            benchmark_scores={"mmlu": 0.86, "humaneval": 0.67},
+            on_premise=False,
+            data_residency="us",
+            privacy_rating=0.3,
+            available=True,
+            rate_limit_rpm=500
+        ),
+        ModelInfo(
+            name="claude-3-opus",
+            provider="anthropic",
+            cost_per_1k_input_tokens=0.015,
+            cost_per_1k_output_tokens=0.075,
+            avg_latency_ms=3000,
+            max_tokens=200000,
+            capability_tags=["coder", "researcher", "critic", "planner"],
+            benchmark_scores={"mmlu": 0.89, "humaneval": 0.84},
+            on_premise=False,
+            data_residency="us",
+            privacy_rating=0.3,
+            available=True,
+            rate_limit_rpm=400
+        ),
+        ModelInfo(
+            name="gemini-pro-1.5",
+            provider="google",
+            cost_per_1k_input_tokens=0.0025,
+            cost_per_1k_output_tokens=0.0075,
+            avg_latency_ms=1500,
+            max_tokens=1000000,
+            capability_tags=["researcher", "critic", "planner"],
+            benchmark_scores={"mmlu": 0.81, "drop": 0.82},
+            on_premise=False,
+            data_residency="global",
+            privacy_rating=0.2,
+            available=True,
+            rate_limit_rpm=1000
+        ),
+        ModelInfo(
+            name="llama-3-70b-local",
+            provider="meta",
+            cost_per_1k_input_tokens=0.0,  # Free if self-hosted
+            cost_per_1k_output_tokens=0.0,
+            avg_latency_ms=5000,
+            max_tokens=8192,
+            capability_tags=["coder", "researcher"],
+            benchmark_scores={"mmlu": 0.79, "humaneval": 0.62},
+            on_premise=True,
+            data_residency="local",
+            privacy_rating=1.0,
+            available=True,
+            rate_limit_rpm=None
+        ),
+    )
+
+
+# --- Usage Example ---
+
+if __name__ == "__main__":
+    from collections import namedtuple
+    
+    # Create router with example catalog
+    catalog = list(create_example_catalog())
+    router = ModelMeshRouter(catalog)
+    
+    # Create mock task
+    MockTask = namedtuple('MockTask', ['agent_type', 'payload'])
+    
+    # Test 1: Cost-sensitive research task
+    task1 = MockTask(
+        agent_type='researcher',
+        payload={
+            "query": "What is quantum computing?",
+            "priority": "low",
+            "latency": "batch"
+        }
+    )
+    
+    selected = router.select_model(task1)
+    print(f"Cost-sensitive research task: {selected}")
+    
+    # Test 2: High-privacy coding task
+    task2 = MockTask(
+        agent_type='coder',
+        payload={
+            "instruction": "Implement encryption algorithm",
+            "privacy": "restricted",
+            "requires_llm": True
+        }
+    )
+    
+    selected = router.select_model(task2)
+    print(f"High-privacy coding task: {selected}")
+    
+    # Test 3: Realtime critical task
+    task3 = MockTask(
+        agent_type='critic',
+        payload={
+            "artifact": "security code",
+            "priority": "critical",
+            "latency": "realtime"
+        }
+    )
+    
+    selected = router.select_model(task3)
+    print(f"Realtime critical task: {selected}")
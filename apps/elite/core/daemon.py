@@ -8,16 +8,19 @@ import sys
 import json
 import time
 import signal
-import hashlib
+import heapq
 import logging
 import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Tuple
 from dataclasses import dataclass, field
 import yaml
 
+from core.models import integrity_digest
+
 # Systemd watchdog support
 try:
     import systemd.daemon as sd_daemon
@@ -36,6 +39,8 @@ class DaemonConfig:
     mode: str = "production"  # production, development, test
     watchdog_enabled: bool = True
     watchdog_interval_sec: int = 60
+    heartbeat_persist_interval_sec: int = 120  # Max age of on-disk heartbeat (plus one watchdog tick)
+    state_fsync: bool = False  # fsync state file writes (durability vs. throughput)
     max_runtime_hours: int = 24
     health_check_interval_sec: int = 30
     auto_restart_on_failure: bool = True
@@ -73,6 +78,39 @@ class DaemonConfig:
 # DAEMON STATE
 # ═══════════════════════════════════════════════════════════════════
 
+def _write_state_file(path: str, payload: bytes, fsync: bool = False) -> None:
+    """
+    Atomically replace path with payload.
+    
+    The bytes go to a temp file in the same directory, which os.replace()
+    then moves over path, so a crash never leaves a truncated state file.
+    Unchanged heartbeats are already skipped by Watchdog._should_persist.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+# Parent directories already created by _ensure_parent_dir
+_ensured_dirs: set = set()
+
+
+def _ensure_parent_dir(path: str) -> None:
+    """mkdir -p the parent of path, once per process"""
+    parent = os.path.dirname(os.path.abspath(path))
+    if parent not in _ensured_dirs:
+        Path(parent).mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(parent)
+
+
 @dataclass
 class DaemonState:
     """Persistent daemon state"""
@@ -83,6 +121,9 @@ class DaemonState:
     last_error: str = ""
     state_hash: str = ""
     
+    # (cache key, dict) from the last update_heartbeat, reused by save()
+    _cached_dict: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "start_time": self.start_time,
@@ -93,11 +134,17 @@ class DaemonState:
             "state_hash": self.state_hash
         }
     
-    def save(self, path: str) -> None:
+    def save(self, path: str, fsync: bool = False) -> None:
         """Save state to file"""
-        Path(path).parent.mkdir(parents=True, exist_ok=True)
-        with open(path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        _ensure_parent_dir(path)
+        payload = json.dumps(self._current_dict(), indent=2).encode()
+        try:
+            _write_state_file(path, payload, fsync=fsync)
+        except FileNotFoundError:
+            # Directory removed since it was ensured - recreate and retry
+            _ensured_dirs.discard(os.path.dirname(os.path.abspath(path)))
+            _ensure_parent_dir(path)
+            _write_state_file(path, payload, fsync=fsync)
     
     @classmethod
     def load(cls, path: str) -> 'DaemonState':
@@ -109,12 +156,31 @@ class DaemonState:
         except FileNotFoundError:
             return cls()
     
+    def content_key(self) -> tuple:
+        """State content excluding heartbeat bookkeeping (for change detection)"""
+        return (
+            self.start_time,
+            self.restart_count,
+            tuple(self.components_active),
+            self.last_error
+        )
+    
+    def _cache_key(self) -> tuple:
+        return (self.content_key(), self.last_heartbeat, self.state_hash)
+    
+    def _current_dict(self) -> Dict[str, Any]:
+        """to_dict(), reusing the heartbeat's dict if nothing changed since"""
+        if self._cached_dict is not None and self._cached_dict[0] == self._cache_key():
+            return self._cached_dict[1]
+        return self.to_dict()
+    
     def update_heartbeat(self) -> None:
         """Update heartbeat timestamp"""
         self.last_heartbeat = datetime.utcnow().isoformat()
-        self.state_hash = hashlib.sha256(
-            json.dumps(self.to_dict(), sort_keys=True).encode()
-        ).hexdigest()[:12]
+        data = self.to_dict()
+        self.state_hash = integrity_digest(data, digest_size=6)
+        data["state_hash"] = self.state_hash
+        self._cached_dict = (self._cache_key(), data)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -122,69 +188,198 @@ class DaemonState:
 # ═══════════════════════════════════════════════════════════════════
 
 class ComponentRegistry:
-    """Registry of daemon components"""
+    """
+    Registry of daemon components
     
-    def __init__(self):
-        self.components: Dict[str, Callable] = {}
-        self.running: Dict[str, bool] = {}
-        self.threads: Dict[str, threading.Thread] = {}
+    Components are periodic jobs. Instead of one sleeping thread per
+    component, a single scheduler thread keeps a min-heap of due times,
+    runs whichever component is due and reschedules it.
     
-    def register(self, name: str, component: Callable) -> None:
-        """Register a component"""
-        self.components[name] = component
-        self.running[name] = False
+    A component is a factory: calling it performs any setup and returns the
+    tick callable that the scheduler invokes every interval_sec.
+    """
+    
+    def __init__(self):
+        self.components: Dict[str, Callable[[], Callable[[], None]]] = {}
+        self.intervals: Dict[str, float] = {}
+        self.last_run: Dict[str, float] = {}  # time.monotonic() of last tick
+        self._ticks: Dict[str, Callable[[], None]] = {}
+        self._next_run: Dict[str, float] = {}  # Running components -> next due time
+        self._heap: List[tuple] = []  # (next_run_monotonic, name)
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # get_status() cache: rebuilt when the schedule changes or when a
+        # running component may have gone overdue since the last build
+        self._status: Dict[str, Any] = {}
+        self._status_dirty = True
+        self._status_expires = 0.0
+    
+    def register(
+        self,
+        name: str,
+        component: Callable[[], Callable[[], None]],
+        interval_sec: float
+    ) -> None:
+        """Register a component factory to run every interval_sec"""
+        with self._cond:
+            self.components[name] = component
+            self.intervals[name] = interval_sec
+            self._status_dirty = True
     
     def start(self, name: str) -> bool:
-        """Start a component"""
+        """Start a component (runs its setup, first tick is due immediately)"""
         if name not in self.components:
             return False
         
-        if self.running.get(name, False):
+        if name in self._next_run:
             return True  # Already running
         
         try:
-            thread = threading.Thread(
-                target=self.components[name],
-                name=f"component-{name}",
-                daemon=True
-            )
-            thread.start()
-            self.threads[name] = thread
-            self.running[name] = True
-            return True
+            tick = self.components[name]()
         except Exception as e:
             logging.error(f"Failed to start component {name}: {e}")
             return False
+        
+        with self._cond:
+            now = time.monotonic()
+            self._ticks[name] = tick
+            self.last_run[name] = now
+            self._schedule(name, now)
+            self._ensure_scheduler()
+        return True
     
     def stop(self, name: str) -> bool:
         """Stop a component"""
-        if name not in self.running:
+        if name not in self.components:
             return False
         
-        self.running[name] = False
-        # Thread will exit on next iteration check
+        with self._cond:
+            self._unschedule(name)
         return True
     
     def stop_all(self) -> None:
-        """Stop all components"""
-        for name in list(self.running.keys()):
+        """Stop all components and the scheduler thread"""
+        for name in list(self.components):
             self.stop(name)
+        
+        with self._cond:
+            self._stop_event.set()
+            self._cond.notify()
+        if self._thread:
+            self._thread.join(timeout=5)
     
     def is_healthy(self, name: str) -> bool:
-        """Check if component is healthy"""
-        if name not in self.threads:
+        """Check if component is healthy (running and not overdue)"""
+        if name not in self._next_run:
             return False
-        return self.threads[name].is_alive()
+        return self.last_run[name] > time.monotonic() - 2 * self.intervals[name]
     
     def get_status(self) -> Dict[str, Any]:
-        """Get status of all components"""
-        return {
-            name: {
-                "running": self.running.get(name, False),
-                "healthy": self.is_healthy(name)
-            }
-            for name in self.components.keys()
-        }
+        """
+        Get status of all components
+        
+        The returned dict is shared between calls until something changes;
+        treat it as read-only.
+        """
+        with self._cond:
+            now = time.monotonic()
+            if self._status_dirty or now >= self._status_expires:
+                self._rebuild_status(now)
+            return self._status
+    
+    def _rebuild_status(self, now: float) -> None:
+        """Recompute the status cache in one pass (caller holds self._cond)"""
+        status = {}
+        expires = float("inf")
+        for name in self.components:
+            running = name in self._next_run
+            healthy = False
+            if running:
+                overdue_at = self.last_run[name] + 2 * self.intervals[name]
+                healthy = overdue_at > now
+                if healthy and overdue_at < expires:
+                    expires = overdue_at
+            status[name] = {"running": running, "healthy": healthy}
+        
+        self._status = status
+        self._status_dirty = False
+        self._status_expires = expires
+    
+    def _schedule(self, name: str, when: float) -> None:
+        """Queue a component's next tick (caller holds self._cond)"""
+        self._next_run[name] = when
+        heapq.heappush(self._heap, (when, name))
+        self._status_dirty = True
+        self._cond.notify()
+    
+    def _unschedule(self, name: str) -> None:
+        """Drop a component from the schedule (caller holds self._cond)"""
+        self._next_run.pop(name, None)
+        self._ticks.pop(name, None)
+        self._status_dirty = True
+        # Stale heap entries are discarded when popped
+        self._cond.notify()
+    
+    def _ensure_scheduler(self) -> None:
+        """Start the scheduler thread if needed (caller holds self._cond)"""
+        self._stop_event.clear()
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run_scheduler,
+                name="component-scheduler",
+                daemon=True
+            )
+            self._thread.start()
+    
+    def _next_due(self) -> Optional[tuple]:
+        """Block until a component is due; returns (name, tick, due) or None on stop"""
+        with self._cond:
+            while not self._stop_event.is_set():
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                
+                due, name = self._heap[0]
+                if self._next_run.get(name) != due:
+                    heapq.heappop(self._heap)  # Stopped or rescheduled
+                    continue
+                
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                
+                heapq.heappop(self._heap)
+                return name, self._ticks[name], due
+        
+        return None
+    
+    def _run_scheduler(self) -> None:
+        """Scheduler thread main loop"""
+        while True:
+            job = self._next_due()
+            if job is None:
+                return
+            
+            name, tick, due = job
+            
+            try:
+                tick()
+            except Exception as e:
+                # Leave it unscheduled so the watchdog sees it unhealthy
+                logging.error(f"Component {name} failed: {e}")
+                with self._cond:
+                    if self._next_run.get(name) == due:
+                        self._unschedule(name)
+                continue
+            
+            with self._cond:
+                now = time.monotonic()
+                self.last_run[name] = now
+                if self._next_run.get(name) == due:
+                    # Fixed rate, but never queue a backlog of missed ticks
+                    self._schedule(name, max(due + self.intervals[name], now))
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -204,31 +399,36 @@ class Watchdog:
         self.config = config
         self.registry = registry
         self.state = state
-        self.running = False
         self.start_time = datetime.utcnow()
         self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._last_save_monotonic: Optional[float] = None
+        self._last_saved_key: Optional[tuple] = None
     
     def start(self) -> None:
         """Start watchdog thread"""
-        self.running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._run, name="watchdog", daemon=True)
         self._thread.start()
         logging.info("Watchdog started")
     
     def stop(self) -> None:
         """Stop watchdog"""
-        self.running = False
+        self._stop_event.set()  # Wakes the interval wait immediately
         if self._thread:
             self._thread.join(timeout=5)
         logging.info("Watchdog stopped")
     
     def _run(self) -> None:
         """Watchdog main loop"""
-        while self.running:
+        while not self._stop_event.is_set():
             try:
-                # Update heartbeat
+                # Update heartbeat (in memory), persist only when worthwhile
                 self.state.update_heartbeat()
-                self.state.save(self.config.state_file)
+                if self._should_persist():
+                    self.state.save(self.config.state_file, fsync=self.config.state_fsync)
+                    self._last_save_monotonic = time.monotonic()
+                    self._last_saved_key = self.state.content_key()
                 
                 # Notify systemd
                 if SYSTEMD_AVAILABLE:
@@ -242,8 +442,13 @@ class Watchdog:
                     break
                 
                 # Check component health
-                status = self.registry.get_status()
-                unhealthy = [name for name, s in status.items() if not s["healthy"]]
+                unhealthy = []
+                active = []
+                for name, s in self.registry.get_status().items():
+                    if not s["healthy"]:
+                        unhealthy.append(name)
+                    if s["running"]:
+                        active.append(name)
                 
                 if unhealthy and self.config.auto_restart_on_failure:
                     for name in unhealthy:
@@ -251,15 +456,33 @@ class Watchdog:
                         self.registry.start(name)
                 
                 # Update active components
-                self.state.components_active = [
-                    name for name, s in status.items() if s["running"]
-                ]
+                self.state.components_active = active
                 
             except Exception as e:
                 logging.error(f"Watchdog error: {e}")
                 self.state.last_error = str(e)
             
-            time.sleep(self.config.watchdog_interval_sec)
+            self._stop_event.wait(self.config.watchdog_interval_sec)
+    
+    def _should_persist(self) -> bool:
+        """
+        Rate-limit state file writes, like systemd's watchdog_runtime_wait.
+        
+        Persist when the state content changed and at least half a watchdog
+        interval has passed, or when the on-disk heartbeat would otherwise
+        exceed heartbeat_persist_interval_sec.
+        """
+        if self._last_save_monotonic is None:
+            return True
+        
+        elapsed = max(0.0, time.monotonic() - self._last_save_monotonic)
+        if elapsed >= self.config.heartbeat_persist_interval_sec:
+            return True
+        
+        return (
+            elapsed >= self.config.watchdog_interval_sec / 2
+            and self.state.content_key() != self._last_saved_key
+        )
     
     def _trigger_graceful_shutdown(self) -> None:
         """Trigger graceful shutdown"""
@@ -289,6 +512,9 @@ class SanctuaryDaemon:
         self.registry = ComponentRegistry()
         self.watchdog: Optional[Watchdog] = None
         self.running = False
+        self._shutdown_event = threading.Event()
+        self._wakeup_fds: Optional[Tuple[int, int]] = None
+        self._wakeup_thread: Optional[threading.Thread] = None
         
         # Setup logging
         self._setup_logging()
@@ -297,9 +523,69 @@ class SanctuaryDaemon:
         signal.signal(signal.SIGTERM, self._handle_sigterm)
         signal.signal(signal.SIGINT, self._handle_sigint)
     
+    def _install_wakeup_fd(self) -> None:
+        """
+        Route signal delivery through a self-pipe.
+        
+        The C-level handler writes the signal number to the pipe as soon as
+        the signal arrives, so shutdown is triggered by a blocking read on
+        another thread even while the main thread is stuck outside the
+        interpreter loop. Only possible on the main thread; elsewhere the
+        Python signal handlers alone set the shutdown event.
+        """
+        on_main_thread = threading.current_thread() is threading.main_thread()
+        if self._wakeup_fds is not None or not on_main_thread:
+            return
+        
+        r, w = os.pipe()
+        os.set_blocking(w, False)
+        signal.set_wakeup_fd(w)
+        self._wakeup_fds = (r, w)
+        
+        self._wakeup_thread = threading.Thread(
+            target=self._wait_for_signal,
+            args=(r,),
+            name="signal-wakeup",
+            daemon=True
+        )
+        self._wakeup_thread.start()
+    
+    def _remove_wakeup_fd(self) -> None:
+        """
+        Detach and close the wakeup pipe (main thread only; safe to repeat).
+        
+        Closing the write end ends the reader thread, after which the read
+        end is closed too.
+        """
+        on_main_thread = threading.current_thread() is threading.main_thread()
+        if self._wakeup_fds is None or not on_main_thread:
+            return
+        
+        r, w = self._wakeup_fds
+        signal.set_wakeup_fd(-1)
+        os.close(w)
+        if self._wakeup_thread is not None:
+            self._wakeup_thread.join(timeout=1.0)
+            self._wakeup_thread = None
+        os.close(r)
+        self._wakeup_fds = None
+    
+    def _wait_for_signal(self, fd: int) -> None:
+        """Block on the wakeup pipe until a shutdown signal arrives"""
+        shutdown_signals = (signal.SIGTERM, signal.SIGINT)
+        try:
+            while True:
+                data = os.read(fd, 1)
+                if not data:
+                    return
+                if data[0] in shutdown_signals:
+                    self._shutdown_event.set()
+        except OSError:
+            pass
+    
     def _setup_logging(self) -> None:
         """Configure logging"""
-        Path(self.config.log_file).parent.mkdir(parents=True, exist_ok=True)
+        _ensure_parent_dir(self.config.log_file)
         
         logging.basicConfig(
             level=getattr(logging, self.config.log_level),
@@ -313,16 +599,16 @@ class SanctuaryDaemon:
     def _handle_sigterm(self, signum, frame) -> None:
         """Handle SIGTERM for graceful shutdown"""
         logging.info("Received SIGTERM, initiating graceful shutdown")
-        self.stop()
+        self._shutdown_event.set()
     
     def _handle_sigint(self, signum, frame) -> None:
         """Handle SIGINT (Ctrl+C)"""
         logging.info("Received SIGINT, initiating graceful shutdown")
-        self.stop()
+        self._shutdown_event.set()
     
     def _write_pid_file(self) -> None:
         """Write PID file"""
-        Path(self.config.pid_file).parent.mkdir(parents=True, exist_ok=True)
+        _ensure_parent_dir(self.config.pid_file)
         with open(self.config.pid_file, 'w') as f:
             f.write(str(os.getpid()))
     
@@ -340,53 +626,62 @@ class SanctuaryDaemon:
         if self.config.enable_grant_pipeline:
             from automations.grant_pipeline import create_default_pipeline
             
-            def grant_pipeline_loop():
+            def grant_pipeline_component():
                 pipeline = create_default_pipeline()
-                while self.registry.running.get("grant_pipeline", False):
+                
+                def tick():
                     # Generate daily sprint at configured time
                     sprint = pipeline.generate_daily_sprint()
-                    logging.debug(f"Grant pipeline sprint: {sprint['summary']}")
-                    time.sleep(3600)  # Check hourly
+                    logging.debug("Grant pipeline sprint: %s", sprint['summary'])
+                
+                return tick
             
-            self.registry.register("grant_pipeline", grant_pipeline_loop)
+            # Check hourly
+            self.registry.register("grant_pipeline", grant_pipeline_component, 3600)
         
         if self.config.enable_runway_tracker:
             from automations.runway_tracker import create_default_runway
             
-            def runway_tracker_loop():
+            def runway_tracker_component():
                 runway = create_default_runway()
-                while self.registry.running.get("runway_tracker", False):
+                
+                def tick():
                     report = runway.generate_report()
                     alerts = runway.generate_alerts()
                     for alert in alerts:
                         logging.warning(f"Runway alert: {alert['message']}")
-                    time.sleep(3600)
+                
+                return tick
             
-            self.registry.register("runway_tracker", runway_tracker_loop)
+            self.registry.register("runway_tracker", runway_tracker_component, 3600)
         
         if self.config.enable_decision_matrix:
             from automations.decision_matrix import DecisionMatrixEngine
             
-            def decision_matrix_loop():
+            def decision_matrix_component():
                 engine = DecisionMatrixEngine()
-                while self.registry.running.get("decision_matrix", False):
+                
+                def tick():
                     status = engine.get_status()
-                    logging.debug(f"Decision matrix: {status['current_state']}")
-                    time.sleep(300)  # Check every 5 minutes
+                    logging.debug("Decision matrix: %s", status['current_state'])
+                
+                return tick
             
-            self.registry.register("decision_matrix", decision_matrix_loop)
+            # Check every 5 minutes
+            self.registry.register("decision_matrix", decision_matrix_component, 300)
         
         if self.config.enable_daily_sprint:
             from automations.daily_sprint import create_48h_execution_sprint
             
-            def daily_sprint_loop():
-                while self.registry.running.get("daily_sprint", False):
+            def daily_sprint_component():
+                def tick():
                     sprint = create_48h_execution_sprint()
                     logging.info(f"Daily sprint generated: {sprint.sprint_id}")
-                    # Sleep until next day
-                    time.sleep(86400)
+                
+                return tick
             
-            self.registry.register("daily_sprint", daily_sprint_loop)
+            # Once a day
+            self.registry.register("daily_sprint", daily_sprint_component, 86400)
     
     def start(self) -> None:
         """Start the daemon"""
@@ -395,22 +690,28 @@ class SanctuaryDaemon:
         logging.info("═" * 60)
         
         self.running = True
+        self._install_wakeup_fd()
         self._write_pid_file()
         
         # Update state
         self.state.start_time = datetime.utcnow().isoformat()
         self.state.restart_count += 1
-        self.state.save(self.config.state_file)
+        self.state.save(self.config.state_file, fsync=self.config.state_fsync)
         
         # Register components
         self._register_components()
         
-        # Start components
-        for name in self.registry.components.keys():
-            if self.registry.start(name):
-                logging.info(f"Started component: {name}")
-            else:
-                logging.error(f"Failed to start component: {name}")
+        # Start components concurrently so boot costs the slowest factory,
+        # not the sum of them; the pool is torn down once they are up
+        names = list(self.registry.components)
+        if names:
+            with ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="component-start") as pool:
+                results = list(pool.map(self.registry.start, names))
+            for name, started in zip(names, results):
+                if started:
+                    logging.info(f"Started component: {name}")
+                else:
+                    logging.error(f"Failed to start component: {name}")
         
         # Start watchdog
         if self.config.watchdog_enabled:
@@ -423,14 +724,15 @@ class SanctuaryDaemon:
         
         logging.info("Daemon started successfully")
         
-        # Main loop
+        # Main loop: idle until a signal (or stop()) sets the shutdown event
         try:
-            while self.running:
-                time.sleep(1)
+            self._shutdown_event.wait()
         except KeyboardInterrupt:
             pass
         finally:
             self.stop()
+            # stop() may have run on another thread, which cannot detach it
+            self._remove_wakeup_fd()
     
     def stop(self) -> None:
         """Stop the daemon"""
@@ -439,6 +741,7 @@ class SanctuaryDaemon:
         
         logging.info("Stopping daemon...")
         self.running = False
+        self._shutdown_event.set()
         
         # Notify systemd stopping
         if SYSTEMD_AVAILABLE:
@@ -452,11 +755,14 @@ class SanctuaryDaemon:
         self.registry.stop_all()
         
         # Save final state
-        self.state.save(self.config.state_file)
+        self.state.save(self.config.state_file, fsync=self.config.state_fsync)
         
         # Remove PID file
         self._remove_pid_file()
         
+        # Detach and close the wakeup pipe (deferred to start() off the main thread)
+        self._remove_wakeup_fd()
+        
         logging.info("Daemon stopped")
 
 
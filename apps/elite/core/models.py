@@ -8,8 +8,52 @@ from datetime import datetime, date
 from enum import Enum
 from typing import Optional, List, Dict, Any
 import json
+import time
 import hashlib
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def canonical_json(obj: Any) -> bytes:
+    """
+    Compact, key-sorted JSON bytes for integrity hashing.
+    
+    The stdlib fallback uses the same separators and UTF-8 output as
+    orjson, so hashes agree across both backends (floats that need
+    exponent notation, e.g. 1e-07 vs 1e-7, are the one exception).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return _CANONICAL_ENCODER.encode(obj).encode()
+
+
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def integrity_digest(obj: Any, digest_size: int = 8) -> str:
+    """BLAKE2b hex digest of canonical_json(obj)."""
+    return hashlib.blake2b(canonical_json(obj), digest_size=digest_size).hexdigest()
+
+
+# date.today() is cached briefly so serializing many grants costs one
+# local-time lookup instead of several per grant
+_TODAY_TTL_SEC = 1.0
+_today_cache: Dict[str, Any] = {"date": None, "monotonic": 0.0}
+
+
+def _today() -> date:
+    """Current local date, refreshed at most once per _TODAY_TTL_SEC"""
+    now = time.monotonic()
+    if _today_cache["date"] is None or now - _today_cache["monotonic"] >= _TODAY_TTL_SEC:
+        _today_cache["date"] = date.today()
+        _today_cache["monotonic"] = now
+    today: date = _today_cache["date"]
+    return today
+
 
 class GrantStatus(Enum):
     """Grant pipeline status states"""
@@ -38,7 +82,14 @@ class SueloClassification(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Member -> value tables for the to_dict hot paths; a dict lookup is cheaper
+# than going through the Enum.value descriptor on every serialization
+_GRANT_STATUS_VALUE = {m: m.value for m in GrantStatus}
+_DECISION_STATE_VALUE = {m: m.value for m in DecisionState}
+_SUELO_VALUE = {m: m.value for m in SueloClassification}
+
+
+@dataclass(slots=True)
 class PropertyData:
     """Property meeting extraction data model"""
     referencia_catastral: str = ""  # 14-digit code
@@ -49,25 +100,29 @@ class PropertyData:
     house_a_m2: float = 0.0
     house_b_m2: float = 0.0
     total_area_m2: float = 5900.0
-    extraction_timestamp: datetime = field(default_factory=datetime.now)
+    extraction_timestamp: Optional[datetime] = None  # Defaults to now()
+    
+    def __post_init__(self) -> None:
+        # Only read the clock when the caller did not supply a timestamp
+        if self.extraction_timestamp is None:
+            self.extraction_timestamp = datetime.now()
     
     def to_dict(self) -> Dict[str, Any]:
         return {
             "referencia_catastral": self.referencia_catastral,
-            "suelo_classification": self.suelo_classification.value,
-            "monthly_opex_eur": self.monthly_opex_eur,
+            "suelo_classification": _SUELO_VALUE[self.suelo_classification],
+            "monthly_opex_eur": float(self.monthly_opex_eur),
             "cedula_habitabilidad": self.cedula_habitabilidad,
             "permit_issues": self.permit_issues,
-            "house_a_m2": self.house_a_m2,
-            "house_b_m2": self.house_b_m2,
-            "total_area_m2": self.total_area_m2,
-            "extraction_timestamp": self.extraction_timestamp.isoformat()
+            "house_a_m2": float(self.house_a_m2),
+            "house_b_m2": float(self.house_b_m2),
+            "total_area_m2": float(self.total_area_m2),
+            "extraction_timestamp": self.extraction_timestamp.isoformat() if self.extraction_timestamp else None
         }
     
     def integrity_hash(self) -> str:
         """Generate cryptographic hash for data integrity verification"""
-        data_str = json.dumps(self.to_dict(), sort_keys=True)
-        return hashlib.sha256(data_str.encode()).hexdigest()[:16]
+        return integrity_digest(self.to_dict())
     
     def validate(self) -> List[str]:
         """Validate property data completeness"""
@@ -81,7 +136,7 @@ class PropertyData:
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class Grant:
     """Grant pipeline entry"""
     id: str
@@ -98,7 +153,7 @@ class Grant:
     
     @property
     def days_until_deadline(self) -> int:
-        return (self.deadline - date.today()).days
+        return (self.deadline - _today()).days
     
     @property
     def is_urgent(self) -> bool:
@@ -109,22 +164,23 @@ class Grant:
         return self.days_until_deadline <= 3
     
     def to_dict(self) -> Dict[str, Any]:
+        days = self.days_until_deadline  # Computed once for all three fields
         return {
             "id": self.id,
             "name": self.name,
             "funder": self.funder,
-            "amount_eur": self.amount_eur,
+            "amount_eur": float(self.amount_eur),
             "deadline": self.deadline.isoformat(),
-            "status": self.status.value,
+            "status": _GRANT_STATUS_VALUE[self.status],
             "owner": self.owner,
             "priority": self.priority,
-            "days_until_deadline": self.days_until_deadline,
-            "is_urgent": self.is_urgent,
-            "is_critical": self.is_critical
+            "days_until_deadline": days,
+            "is_urgent": days <= 7,
+            "is_critical": days <= 3
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RunwayWeek:
     """Weekly runway projection"""
     week_label: str
@@ -141,14 +197,14 @@ class RunwayWeek:
         return {
             "week": self.week_label,
             "week_start": self.week_start.isoformat(),
-            "cash_in": self.cash_in,
-            "cash_out": self.cash_out,
-            "net": self.net,
+            "cash_in": float(self.cash_in),
+            "cash_out": float(self.cash_out),
+            "net": float(self.net),
             "is_projected": self.is_projected
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RunwayTracker:
     """Financial runway tracking"""
     starting_balance: float
@@ -157,7 +213,7 @@ class RunwayTracker:
     
     def calculate_cumulative(self) -> List[Dict[str, Any]]:
         """Calculate cumulative runway with projections"""
-        cumulative = self.starting_balance
+        cumulative = float(self.starting_balance)
         results = []
         for week in self.weeks:
             cumulative += week.net
@@ -188,7 +244,7 @@ class RunwayTracker:
         return "🟢 HEALTHY"
 
 
-@dataclass
+@dataclass(slots=True)
 class UrbanismoSubmission:
     """Urbanismo consulta tracking"""
     registro_number: str = ""
@@ -202,7 +258,7 @@ class UrbanismoSubmission:
     @property
     def days_since_submission(self) -> Optional[int]:
         if self.submission_date:
-            return (date.today() - self.submission_date).days
+            return (_today() - self.submission_date).days
         return None
     
     def to_dict(self) -> Dict[str, Any]:
@@ -210,14 +266,14 @@ class UrbanismoSubmission:
             "registro_number": self.registro_number,
             "submission_date": self.submission_date.isoformat() if self.submission_date else None,
             "referencia_catastral": self.referencia_catastral,
-            "status": self.status.value,
+            "status": _DECISION_STATE_VALUE[self.status],
             "response_date": self.response_date.isoformat() if self.response_date else None,
             "conditions": self.conditions,
             "days_since_submission": self.days_since_submission
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionCheckpoint:
     """48-hour execution checkpoint tracking"""
     checkpoint_id: str
@@ -230,7 +286,7 @@ class ExecutionCheckpoint:
         self.completed = True
         self.completion_timestamp = datetime.now()
         if evidence:
-            self.evidence_hash = hashlib.sha256(evidence.encode()).hexdigest()[:16]
+            self.evidence_hash = hashlib.blake2b(evidence.encode(), digest_size=8).hexdigest()
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -242,58 +298,84 @@ class ExecutionCheckpoint:
         }
 
 
-@dataclass
+# Victory Condition Checkpoints as (checkpoint_id, description) templates.
+# Kept immutable so marking a checkpoint complete can never leak into the
+# defaults handed to the next SanctuaryState.
+_CHECKPOINT_SPECS = (
+    ("REF_CAT", "Referencia Catastral extracted (14 digits)"),
+    ("SUELO", "Suelo classification confirmed"),
+    ("OPEX", "Monthly OpEx number captured"),
+    ("CEDULA", "Cédula habitabilidad status confirmed"),
+    ("AIRTABLE", "Airtable base live with grants + runway"),
+    ("URBANISMO", "Urbanismo consulta filed with registro #"),
+)
+
+
+def default_checkpoints() -> List[ExecutionCheckpoint]:
+    """Fresh, independent copies of the victory condition checkpoints"""
+    return [ExecutionCheckpoint(cid, desc) for cid, desc in _CHECKPOINT_SPECS]
+
+
+@dataclass(slots=True)
 class SanctuaryState:
     """Master state container for Sovereign Sanctuary operations"""
     property_data: PropertyData = field(default_factory=PropertyData)
     grants: List[Grant] = field(default_factory=list)
-    runway: RunwayTracker = field(default_factory=lambda: RunwayTracker(starting_balance=37000))
+    runway: RunwayTracker = field(default_factory=lambda: RunwayTracker(starting_balance=37000.0))
     urbanismo: UrbanismoSubmission = field(default_factory=UrbanismoSubmission)
-    checkpoints: List[ExecutionCheckpoint] = field(default_factory=list)
+    checkpoints: List[ExecutionCheckpoint] = field(default_factory=default_checkpoints)
     decision_state: DecisionState = DecisionState.PENDING
-    last_updated: datetime = field(default_factory=datetime.now)
+    last_updated: Optional[datetime] = None  # Defaults to now()
     
-    def state_hash(self) -> str:
-        """Generate cryptographic hash of entire state for integrity verification"""
-        state_dict = {
+    def __post_init__(self) -> None:
+        # Only read the clock when the caller did not supply a timestamp
+        if self.last_updated is None:
+            self.last_updated = datetime.now()
+    
+    def _integrity_dict(self) -> Dict[str, Any]:
+        """State fields covered by state_hash"""
+        return {
             "property": self.property_data.to_dict(),
             "grants": [g.to_dict() for g in self.grants],
             "runway": self.runway.calculate_cumulative(),
             "urbanismo": self.urbanismo.to_dict(),
             "checkpoints": [c.to_dict() for c in self.checkpoints],
-            "decision_state": self.decision_state.value
+            "decision_state": _DECISION_STATE_VALUE[self.decision_state]
         }
-        return hashlib.sha256(json.dumps(state_dict, sort_keys=True).encode()).hexdigest()[:16]
+    
+    @staticmethod
+    def _hash_integrity_dict(state_dict: Dict[str, Any]) -> str:
+        return integrity_digest(state_dict)
+    
+    def state_hash(self) -> str:
+        """Generate cryptographic hash of entire state for integrity verification"""
+        return self._hash_integrity_dict(self._integrity_dict())
     
     def to_json(self, indent: int = 2) -> str:
         """Export state to JSON"""
-        return json.dumps({
-            "property": self.property_data.to_dict(),
-            "grants": [g.to_dict() for g in self.grants],
-            "runway": self.runway.calculate_cumulative(),
-            "urbanismo": self.urbanismo.to_dict(),
-            "checkpoints": [c.to_dict() for c in self.checkpoints],
-            "decision_state": self.decision_state.value,
-            "last_updated": self.last_updated.isoformat(),
-            "state_hash": self.state_hash()
-        }, indent=indent)
+        # Build the state once and hash that, rather than rebuilding it
+        data = self._integrity_dict()
+        state_hash = self._hash_integrity_dict(data)
+        data["last_updated"] = self.last_updated.isoformat() if self.last_updated else None
+        data["state_hash"] = state_hash
+        if ORJSON_AVAILABLE and indent == 2:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(data, indent=indent)
     
     @classmethod
     def from_json(cls, json_str: str) -> 'SanctuaryState':
         """Load state from JSON"""
-        data = json.loads(json_str)
+        data = orjson.loads(json_str) if ORJSON_AVAILABLE else json.loads(json_str)
         # Implementation for full deserialization
-        state = cls()
+        # Restore timestamps up front so construction skips datetime.now()
+        property_ts = data.get("property", {}).get("extraction_timestamp")
+        last_updated = data.get("last_updated")
+        state = cls(
+            property_data=PropertyData(
+                extraction_timestamp=datetime.fromisoformat(property_ts) if property_ts else None
+            ),
+            last_updated=datetime.fromisoformat(last_updated) if last_updated else None
+        )
         # ... populate from data
         return state
 
-
-# Victory Condition Checkpoints
-DEFAULT_CHECKPOINTS = [
-    ExecutionCheckpoint("REF_CAT", "Referencia Catastral extracted (14 digits)"),
-    ExecutionCheckpoint("SUELO", "Suelo classification confirmed"),
-    ExecutionCheckpoint("OPEX", "Monthly OpEx number captured"),
-    ExecutionCheckpoint("CEDULA", "Cédula habitabilidad status confirmed"),
-    ExecutionCheckpoint("AIRTABLE", "Airtable base live with grants + runway"),
-    ExecutionCheckpoint("URBANISMO", "Urbanismo consulta filed with registro #"),
-]
@@ -14,25 +14,85 @@ Version: 1.0.0
 Author: Manus AI for Architect
 """
 
-import mailbox
+import email
 import json
 import re
 import sys
+import os
+import mmap
 import hashlib
+import multiprocessing
 from pathlib import Path
 from datetime import datetime
 from email.utils import parsedate_to_datetime
-from typing import Dict, List, Any, Optional
-from collections import defaultdict
+from typing import Dict, List, Any, Optional, Iterator
+from array import array
+from contextlib import ExitStack
+from itertools import islice
 
-# Legal search keywords
-LEGAL_KEYWORDS = [
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Legal search keywords (frozen; matched against lowercased message text)
+LEGAL_KEYWORDS = (
     "contract", "agreement", "nda", "confidential", "legal", "claim",
     "invoice", "payment", "evidence", "proof", "witness", "court",
     "solicitor", "lawyer", "attorney", "dispute", "settlement",
     "sovereign", "sanctuary", "fortress", "trading", "investment",
     "property", "tenerife", "vera de erques", "urbanismo",
-]
+)
+_LEGAL_KEYWORDS_LOWER = tuple(kw.lower() for kw in LEGAL_KEYWORDS)
+_LEGAL_KEYWORDS_SET = frozenset(_LEGAL_KEYWORDS_LOWER)
+
+
+def _build_keyword_scanner():
+    """
+    Build a single-pass matcher for LEGAL_KEYWORDS.
+    
+    Uses an Aho-Corasick automaton when pyahocorasick is installed,
+    otherwise one compiled alternation. The regex alternative is wrapped in
+    a lookahead so overlapping keywords are all reported, like `kw in text`.
+    
+    Text containing none of the keywords' first letters (empty bodies,
+    non-Latin scripts) is rejected by one character-class search first.
+    """
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for kw in _LEGAL_KEYWORDS_SET:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+        
+        def scan(text):
+            return {kw for _, kw in automaton.iter(text)}
+    else:
+        # One match per position: relies on no keyword being a prefix of another
+        alternation = "|".join(re.escape(kw) for kw in sorted(_LEGAL_KEYWORDS_SET))
+        pattern = re.compile(f"(?=({alternation}))")
+        
+        def scan(text):
+            return set(pattern.findall(text))
+    
+    first_chars = "".join(sorted({kw[0] for kw in _LEGAL_KEYWORDS_SET}))
+    prefilter = re.compile(f"[{re.escape(first_chars)}]")
+    return lambda text: scan(text) if prefilter.search(text) else set()
+
+
+_scan_keywords = _build_keyword_scanner()
+
+# Messages handed to each pool worker per round trip
+PARSE_CHUNKSIZE = 64
+
+# mbox "From " separator lines (line starts only), compiled once
+_FROM_RE = re.compile(rb"^From ", re.MULTILINE)
 
 
 def sha256_string(data: str) -> str:
@@ -40,9 +100,45 @@ def sha256_string(data: str) -> str:
     return hashlib.sha256(data.encode("utf-8", errors="ignore")).hexdigest()
 
 
+def _hash_email_id(message_id, subject, date_str) -> str:
+    """
+    SHA-256 of message_id + subject + date, without building the joined string.
+    
+    Equal to sha256_string(f"{message_id}{subject}{date_str}"); str() covers
+    compat32 Header values.
+    """
+    h = hashlib.sha256()
+    h.update(str(message_id).encode("utf-8", errors="ignore"))
+    h.update(str(subject).encode("utf-8", errors="ignore"))
+    h.update(str(date_str).encode("utf-8", errors="ignore"))
+    return h.hexdigest()
+
+
+# Preview length in characters, and the most UTF-8 bytes that many can take
+PREVIEW_CHARS = 500
+_PREVIEW_BYTES = PREVIEW_CHARS * 4
+
+
+def _decode_preview(payload: bytes) -> str:
+    """
+    First PREVIEW_CHARS characters of a UTF-8 payload.
+    
+    Decodes only the leading bytes rather than the whole (possibly
+    multi-MB) body. Falls back to a full decode when dropped invalid bytes
+    leave the slice short, so the result matches decoding everything.
+    """
+    preview = payload[:_PREVIEW_BYTES].decode("utf-8", errors="ignore")
+    if len(preview) < PREVIEW_CHARS and len(payload) > _PREVIEW_BYTES:
+        preview = payload.decode("utf-8", errors="ignore")
+    return preview[:PREVIEW_CHARS]
+
+
 def extract_email_metadata(message) -> Optional[Dict[str, Any]]:
-    """Extract metadata from an email message"""
+    """Extract metadata from an email message (a Message or raw bytes)"""
     try:
+        if isinstance(message, bytes):
+            message = email.message_from_bytes(message)
+        
         # Get basic headers
         subject = message.get("Subject", "(No Subject)")
         from_addr = message.get("From", "")
@@ -57,31 +153,33 @@ def extract_email_metadata(message) -> Optional[Dict[str, Any]]:
         except Exception:
             date_iso = date_str
         
-        # Get body preview
+        # Get body preview and attachments in a single pass over the parts
         body_preview = ""
+        attachments = []
         if message.is_multipart():
+            have_preview = False
             for part in message.walk():
-                if part.get_content_type() == "text/plain":
+                filename = part.get_filename()
+                if filename:
+                    attachments.append(filename)
+                
+                if not have_preview and part.get_content_type() == "text/plain":
                     payload = part.get_payload(decode=True)
                     if payload:
-                        body_preview = payload.decode("utf-8", errors="ignore")[:500]
-                        break
+                        body_preview = _decode_preview(payload)
+                        have_preview = True
         else:
             payload = message.get_payload(decode=True)
             if payload:
-                body_preview = payload.decode("utf-8", errors="ignore")[:500]
-        
-        # Check for legal relevance
-        full_text = f"{subject} {from_addr} {to_addr} {body_preview}".lower()
-        legal_matches = [kw for kw in LEGAL_KEYWORDS if kw in full_text]
+                body_preview = _decode_preview(payload)
         
-        # Get attachments
-        attachments = []
-        if message.is_multipart():
-            for part in message.walk():
-                filename = part.get_filename()
-                if filename:
-                    attachments.append(filename)
+        # Check for legal relevance. Lowering the fields separately skips the
+        # large mixed intermediate string; str() covers compat32 Header values.
+        full_text = " ".join((
+            str(subject).lower(), str(from_addr).lower(), str(to_addr).lower(), body_preview.lower()
+        ))
+        found = _scan_keywords(full_text)
+        legal_matches = [kw for kw in _LEGAL_KEYWORDS_LOWER if kw in found]
         
         return {
             "message_id": message_id,
@@ -93,17 +191,146 @@ def extract_email_metadata(message) -> Optional[Dict[str, Any]]:
             "attachments": attachments,
             "legal_keywords": legal_matches,
             "legal_priority": 1 if legal_matches else 5,
-            "hash": sha256_string(f"{message_id}{subject}{date_str}"),
+            "hash": _hash_email_id(message_id, subject, date_str),
         }
     except Exception as e:
         return None
 
 
-def parse_mbox(mbox_path: str) -> Dict[str, Any]:
-    """Parse MBOX file and build index"""
-    print(f"Parsing: {mbox_path}")
+def iter_raw_messages(mbox_path: str) -> Iterator[bytes]:
+    """
+    Stream raw messages out of an MBOX file.
+    
+    Splits on "From " separator lines the same way mailbox.mbox does, but
+    finds them with one precompiled regex over a memory map of the file,
+    so multi-GB Takeout archives are neither indexed up front nor read
+    line by line. Only the current message is copied out.
+    """
+    with open(mbox_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # mmap rejects empty files
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = None
+            for match in _FROM_RE.finditer(mm):
+                if start is not None:
+                    yield _message_bytes(mm, start, match.start())
+                start = match.start()
+            
+            if start is not None:
+                yield _message_bytes(mm, start, len(mm))
+
+
+def _message_bytes(mm: mmap.mmap, start: int, end: int) -> bytes:
+    """
+    Message following the From_ line at start, up to the separator at end.
+    
+    Drops the From_ line itself and the blank line that precedes the next
+    separator, as mailbox.mbox does.
+    """
+    body = mm.find(b"\n", start, end) + 1
+    if body == 0:
+        return b""
+    
+    if mm[end - 1:end] == b"\n":
+        if end - body == 1 or mm[end - 2:end - 1] == b"\n":
+            end -= 1
+        elif mm[end - 2:end - 1] == b"\r" and (end - body == 2 or mm[end - 3:end - 2] == b"\n"):
+            end -= 2
+    return mm[body:end]
+
+
+def _json_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize to JSON bytes, stringifying unknown types (orjson when available)
+    
+    orjson writes raw UTF-8 instead of ASCII escapes; both read back the same.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, default=str, indent=2 if indent else None).encode()
+
+
+def _bounded_imap(pool, func, items: Iterator[Any], window: int) -> Iterator[Any]:
+    """
+    Ordered pool.imap over items, pulling at most `window` items at a time.
+    
+    Pool.imap drains its input eagerly, which would load the whole mailbox
+    into memory; feeding it fixed-size windows keeps the streaming bounded.
+    """
+    while True:
+        batch = list(islice(items, window))
+        if not batch:
+            return
+        yield from pool.imap(func, batch, chunksize=PARSE_CHUNKSIZE)
+
+
+class _GroupedIndex:
+    """
+    Inverted index built as columns, grouped into lists in one post-pass.
+    
+    Keys are interned to small ints in first-seen order and each
+    (key, message) pair is stored in two compact array('I') columns,
+    instead of growing one Python list per key during parsing.
+    """
     
-    mbox = mailbox.mbox(mbox_path)
+    __slots__ = ("_key_ids", "_group_ids", "_msg_ids")
+    
+    def __init__(self):
+        self._key_ids: Dict[str, int] = {}
+        self._group_ids = array("I")
+        self._msg_ids = array("I")
+    
+    def add(self, key: str, msg: int) -> None:
+        key_id = self._key_ids.get(key)
+        if key_id is None:
+            key_id = self._key_ids[key] = len(self._key_ids)
+        self._group_ids.append(key_id)
+        self._msg_ids.append(msg)
+    
+    def to_dict(self) -> Dict[str, List[int]]:
+        """{key: [message, ...]} in first-seen key order and message order"""
+        groups: List[List[int]] = [[] for _ in self._key_ids]
+        for key_id, msg in zip(self._group_ids, self._msg_ids):
+            groups[key_id].append(msg)
+        return dict(zip(self._key_ids, groups))
+
+
+def _index_message(index: Dict[str, Any], i: int, metadata: Dict[str, Any]) -> None:
+    """Add one message's metadata to the inverted indexes under mailbox position i"""
+    index["metadata"]["total_messages"] += 1
+    
+    # Index by sender (str() as compat32 may return Header objects)
+    sender = str(metadata["from"])
+    index["by_sender"].add(sender, i)
+    
+    # Index by legal keyword
+    for kw in metadata["legal_keywords"]:
+        index["by_keyword"].add(kw, i)
+    
+    # Track legal priority 1
+    if metadata["legal_priority"] == 1:
+        index["legal_priority_1"].append(i)
+        index["metadata"]["legal_relevant"] += 1
+
+
+def parse_mbox(
+    mbox_path: str,
+    workers: Optional[int] = None,
+    messages_path: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Parse MBOX file and build index
+    
+    Message parsing and keyword scanning run on a process pool (workers
+    defaults to the CPU count); indexing stays in this process. Results
+    are consumed in mailbox order, so the index is deterministic.
+    
+    If messages_path is given, per-message records are streamed there as
+    JSON lines instead of being kept in index["messages"], so memory stays
+    flat regardless of archive size.
+    """
+    print(f"Parsing: {mbox_path}")
     
     index = {
         "metadata": {
@@ -113,36 +340,40 @@ def parse_mbox(mbox_path: str) -> Dict[str, Any]:
             "legal_relevant": 0,
         },
         "messages": [],
-        "by_sender": defaultdict(list),
-        "by_keyword": defaultdict(list),
+        "by_sender": _GroupedIndex(),
+        "by_keyword": _GroupedIndex(),
         "legal_priority_1": [],
     }
     
-    for i, message in enumerate(mbox):
-        if i % 100 == 0:
-            print(f"  Processing message {i}...")
+    if messages_path:
+        index["metadata"]["messages_file"] = str(messages_path)
+        del index["messages"]
+    
+    workers = workers or os.cpu_count() or 1
+    with ExitStack() as stack:
+        messages_file = None
+        if messages_path:
+            messages_file = stack.enter_context(open(messages_path, "wb"))
+        pool = stack.enter_context(multiprocessing.Pool(workers))
         
-        metadata = extract_email_metadata(message)
-        if metadata:
-            index["messages"].append(metadata)
-            index["metadata"]["total_messages"] += 1
-            
-            # Index by sender
-            sender = metadata["from"]
-            index["by_sender"][sender].append(i)
-            
-            # Index by legal keyword
-            for kw in metadata["legal_keywords"]:
-                index["by_keyword"][kw].append(i)
+        results = _bounded_imap(
+            pool, extract_email_metadata, iter_raw_messages(mbox_path),
+            window=workers * PARSE_CHUNKSIZE * 4
+        )
+        for i, metadata in enumerate(results):
+            if i % 100 == 0:
+                print(f"  Processing message {i}...")
             
-            # Track legal priority 1
-            if metadata["legal_priority"] == 1:
-                index["legal_priority_1"].append(i)
-                index["metadata"]["legal_relevant"] += 1
+            if metadata:
+                if messages_file:
+                    messages_file.write(_json_bytes(metadata) + b"\n")
+                else:
+                    index["messages"].append(metadata)
+                _index_message(index, i, metadata)
     
-    # Convert defaultdicts
-    index["by_sender"] = dict(index["by_sender"])
-    index["by_keyword"] = dict(index["by_keyword"])
+    # Materialize the grouped lists
+    index["by_sender"] = index["by_sender"].to_dict()
+    index["by_keyword"] = index["by_keyword"].to_dict()
     
     return index
 
@@ -169,13 +400,14 @@ def main():
     print("GMAIL EXPORT PARSER - LEGAL SEARCH INDEX")
     print("=" * 60)
     
-    # Parse MBOX
-    index = parse_mbox(mbox_path)
+    # Parse MBOX, streaming message records to a JSON-lines sidecar
+    messages_path = Path(mbox_path).with_suffix(".messages.jsonl")
+    index = parse_mbox(mbox_path, messages_path=str(messages_path))
     
     # Save index
     output_path = Path(mbox_path).with_suffix(".legal_index.json")
-    with open(output_path, "w") as f:
-        json.dump(index, f, indent=2, default=str)
+    with open(output_path, "wb") as f:
+        f.write(_json_bytes(index, indent=True))
     
     # Print summary
     print("\n" + "-" * 60)
@@ -184,6 +416,7 @@ def main():
     print(f"  Legal Relevant: {index['metadata']['legal_relevant']}")
     print(f"  Unique Senders: {len(index['by_sender'])}")
     print(f"  Index saved to: {output_path}")
+    print(f"  Messages saved to: {messages_path}")
     
     # Show top legal keywords
     if index["by_keyword"]:
@@ -4,17 +4,50 @@ Deterministic deployment with cryptographic verification and webhook triggers
 """
 
 import os
+import re
 import sys
 import json
+import shlex
+import mmap
+import hmac
 import hashlib
 import subprocess
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator, Pattern, Tuple, Union, FrozenSet
 from dataclasses import dataclass, field
 import yaml
 
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Manifests are a deployment integrity check, not a commitment to an
+# adversary, so the fastest available digest is the default. Verification
+# always uses the algorithm recorded in the manifest being checked.
+DEFAULT_HASH_ALGORITHM = "blake3" if BLAKE3_AVAILABLE else "sha256"
+
+
+def write_manifest_file(path: Path, manifest: Dict[str, Any]) -> None:
+    """Write a manifest as 2-space indented JSON (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(manifest, indent=2).encode()
+    with open(path, 'wb') as f:
+        f.write(data)
+
 
 # ═══════════════════════════════════════════════════════════════════
 # CONFIGURATION
@@ -42,11 +75,12 @@ class PushConfig:
     # Integrity verification
     verify_before_push: bool = True
     verify_after_push: bool = True
-    hash_algorithm: str = "sha256"
+    hash_algorithm: str = DEFAULT_HASH_ALGORITHM
     
     # Paths
     source_dir: str = "/opt/sovereign-sanctuary"
     manifest_file: str = "MANIFEST.json"
+    manifest_cache_file: str = ".manifest.cache.json"  # Local hash cache, never committed
     
     @classmethod
     def from_yaml(cls, path: str) -> 'PushConfig':
@@ -59,51 +93,176 @@ class PushConfig:
 # INTEGRITY VERIFICATION
 # ═══════════════════════════════════════════════════════════════════
 
+DEFAULT_EXCLUDES = ('.git', '__pycache__', '*.pyc', '.env')
+
+
+@lru_cache(maxsize=32)
+def _compile_exclusions(patterns: Tuple[str, ...]) -> Tuple[Pattern, FrozenSet[str]]:
+    """
+    Compile exclusion patterns into (substring_regex, excluded_suffixes).
+    
+    "*.ext" patterns match the file suffix (as Path.suffix); any other
+    pattern matches as a substring of the path. Substring patterns also
+    prune whole directories, since every path below contains the match.
+    """
+    substrings = [re.escape(p) for p in patterns if not p.startswith('*')]
+    suffixes = frozenset(p[1:] for p in patterns if p.startswith('*'))
+    return re.compile('|'.join(substrings) or r'(?!)'), suffixes
+
+
+def _path_suffix(name: str) -> str:
+    """Path(name).suffix without building a Path"""
+    i = name.rfind('.')
+    return name[i:] if 0 < i < len(name) - 1 else ''
+
+
+def _iter_files(
+    directory: str, substring_re: Pattern, suffixes: FrozenSet[str]
+) -> Iterator[os.DirEntry]:
+    """
+    Yield non-excluded file entries under directory in sorted path order.
+    
+    Symlinked directories are not followed (same as Path.rglob).
+    """
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    
+    for entry in entries:
+        if substring_re.search(entry.path):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_files(entry.path, substring_re, suffixes)
+        elif entry.is_file() and _path_suffix(entry.name) not in suffixes:
+            yield entry
+
+
 class IntegrityVerifier:
     """
     Cryptographic integrity verification for file pushes
     Ensures deterministic, tamper-evident deployments
     """
     
-    def __init__(self, algorithm: str = "sha256"):
+    def __init__(self, algorithm: str = DEFAULT_HASH_ALGORITHM, cache_path: Optional[Path] = None):
+        """
+        Args:
+            algorithm: "blake3" or any hashlib algorithm name
+            cache_path: Optional file persisting the (size, mtime_ns) -> digest
+                cache between runs; the file itself is never hashed
+        """
+        if algorithm == "blake3":
+            if not BLAKE3_AVAILABLE:
+                raise ValueError("blake3 hashing requires the 'blake3' package")
+        elif algorithm not in hashlib.algorithms_available:
+            raise ValueError(f"Unsupported hash algorithm: {algorithm}")
         self.algorithm = algorithm
-    
-    def hash_file(self, path: Path) -> str:
-        """Compute hash of a single file"""
-        h = hashlib.new(self.algorithm)
+        self.cache_path = Path(cache_path) if cache_path else None
+        # File path -> (st_size, st_mtime_ns, digest) from the last hash
+        self._stat_cache: Dict[str, Tuple[int, int, str]] = self._load_stat_cache()
+    
+    def _load_stat_cache(self) -> Dict[str, Tuple[int, int, str]]:
+        """Read the persisted digest cache, ignoring it if unusable"""
+        if not self.cache_path:
+            return {}
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+            if data.get("algorithm") != self.algorithm:
+                return {}
+            return {path: tuple(entry) for path, entry in data["files"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return {}
+    
+    def _save_stat_cache(self) -> None:
+        """Persist the digest cache atomically"""
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({"algorithm": self.algorithm, "files": self._stat_cache}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass  # The cache is an optimization only
+    
+    def _new_hash(self):
+        """Fresh hash object for the configured algorithm"""
+        if self.algorithm == "blake3":
+            return blake3.blake3()
+        return hashlib.new(self.algorithm)
+    
+    def hash_file(self, path: Union[str, Path]) -> str:
+        """
+        Compute hash of a single file
+        
+        BLAKE3 hashes a memory map of the file directly. hashlib digests use
+        hashlib.file_digest (Python 3.11+), which reads into one reused
+        buffer; older interpreters hash an mmap of the file in a single call.
+        """
+        if self.algorithm == "blake3":
+            h = blake3.blake3()
+            h.update_mmap(path)
+            return h.hexdigest()
+        
         with open(path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                h.update(chunk)
-        return h.hexdigest()
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, self.algorithm).hexdigest()
+            
+            h = hashlib.new(self.algorithm)
+            if os.fstat(f.fileno()).st_size:  # mmap rejects empty files
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    h.update(mm)
+            return h.hexdigest()
     
     def hash_directory(self, directory: Path, exclude: List[str] = None) -> Dict[str, str]:
-        """Compute hashes for all files in directory"""
-        exclude = exclude or ['.git', '__pycache__', '*.pyc', '.env']
-        hashes = {}
-        
-        for path in sorted(directory.rglob('*')):
-            if path.is_file():
-                # Check exclusions
-                skip = False
-                for pattern in exclude:
-                    if pattern.startswith('*'):
-                        if path.suffix == pattern[1:]:
-                            skip = True
-                            break
-                    elif pattern in str(path):
-                        skip = True
-                        break
-                
-                if not skip:
-                    rel_path = str(path.relative_to(directory))
-                    hashes[rel_path] = self.hash_file(path)
+        """
+        Compute hashes for all files in directory
+        
+        Files whose (size, mtime_ns) match the digest cache are not re-read,
+        so repeated scans (commit then pre-push verify) only hash changes.
+        The rest are hashed on a thread pool (hashlib releases the GIL on
+        large buffers). The result keeps sorted path order.
+        """
+        substring_re, suffixes = _compile_exclusions(tuple(exclude or DEFAULT_EXCLUDES))
+        root = os.path.join(str(directory), '')
         
-        return hashes
+        # Only the cache file itself is skipped, not same-named files deeper down
+        skip_path = None
+        if self.cache_path:
+            cache_rel = os.path.relpath(os.path.abspath(self.cache_path), os.path.abspath(directory))
+            if not cache_rel.startswith(os.pardir):
+                skip_path = root + cache_rel
+        
+        files = []
+        for entry in _iter_files(str(directory), substring_re, suffixes):
+            if entry.path != skip_path:
+                st = entry.stat()
+                files.append((entry.path, (st.st_size, st.st_mtime_ns)))
+        
+        cache = self._stat_cache
+        misses = [(path, stamp) for path, stamp in files if cache.get(path, ())[:2] != stamp]
+        if misses:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                digests = pool.map(self.hash_file, [path for path, _ in misses])
+                for (path, stamp), digest in zip(misses, digests):
+                    cache[path] = (*stamp, digest)
+        
+        # Forget files under this directory that no longer exist
+        seen = {path for path, _ in files}
+        stale = [path for path in cache if path.startswith(root) and path not in seen]
+        for path in stale:
+            del cache[path]
+        
+        if self.cache_path and (misses or stale):
+            self._save_stat_cache()
+        
+        return {path[len(root):]: cache[path][2] for path, _ in files}
     
     def compute_manifest_hash(self, hashes: Dict[str, str]) -> str:
         """Compute hash of the manifest itself"""
+        # Stays on stdlib json: its ", "/": " separators are part of every
+        # recorded manifest_hash, and orjson cannot reproduce them
         manifest_str = json.dumps(hashes, sort_keys=True)
-        return hashlib.new(self.algorithm, manifest_str.encode()).hexdigest()
+        h = self._new_hash()
+        h.update(manifest_str.encode())
+        return h.hexdigest()
     
     def generate_manifest(self, directory: Path) -> Dict[str, Any]:
         """Generate complete manifest for directory"""
@@ -121,6 +280,14 @@ class IntegrityVerifier:
     
     def verify_manifest(self, directory: Path, manifest: Dict[str, Any]) -> Dict[str, Any]:
         """Verify directory against manifest"""
+        algorithm = manifest.get("algorithm", self.algorithm)
+        if algorithm != self.algorithm:
+            try:
+                verifier = IntegrityVerifier(algorithm)
+            except ValueError as e:
+                return {"valid": False, "error": str(e)}
+            return verifier.verify_manifest(directory, manifest)
+        
         current_hashes = self.hash_directory(directory)
         expected_hashes = manifest.get("files", {})
         
@@ -164,10 +331,35 @@ class GitPushHandler:
             text=True
         )
     
+    def _porcelain_status(self) -> bytes:
+        """Raw NUL-separated `git status --porcelain -z` output (not decoded)"""
+        return subprocess.run(
+            ['git', 'status', '--porcelain', '-z'],
+            cwd=self.source_dir,
+            capture_output=True
+        ).stdout
+    
+    def has_changes(self) -> bool:
+        """Whether there are staged, unstaged or untracked changes"""
+        return bool(self._porcelain_status())
+    
+    def get_changes(self) -> List[str]:
+        """Changed paths as "XY path" (renames and copies: "XY orig -> path")"""
+        fields = iter(self._porcelain_status().split(b'\0'))
+        changes = []
+        for entry in fields:
+            if not entry:
+                continue
+            status, path = entry[:2], entry[3:]
+            if b'R' in status or b'C' in status:
+                # With -z the source path follows as its own field
+                path = next(fields, b'') + b' -> ' + path
+            changes.append((status + b' ' + path).decode('utf-8', errors='replace'))
+        return changes
+    
     def get_status(self) -> Dict[str, Any]:
         """Get git status"""
-        result = self._run_git('status', '--porcelain')
-        changes = result.stdout.strip().split('\n') if result.stdout.strip() else []
+        changes = self.get_changes()
         
         return {
             "has_changes": len(changes) > 0,
@@ -181,11 +373,10 @@ class GitPushHandler:
         manifest = self.verifier.generate_manifest(self.source_dir)
         manifest_path = self.source_dir / self.config.manifest_file
         
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
+        write_manifest_file(manifest_path, manifest)
         
         # Stage all changes
-        self._run_git('add', '-A')
+        self._run_git('add', '-A', '--', '.', f':(exclude){self.config.manifest_cache_file}')
         
         # Create commit
         full_message = f"{self.config.commit_prefix} {message}\n\nManifest hash: {manifest['manifest_hash']}"
@@ -197,9 +388,8 @@ class GitPushHandler:
             "manifest_hash": manifest['manifest_hash']
         }
     
-    def push(self) -> Dict[str, Any]:
-        """Push to remote"""
-        # Pre-push verification
+    def verify_before_push(self) -> Optional[Dict[str, Any]]:
+        """Pre-push verification; returns the failed push result, or None if OK"""
         if self.config.verify_before_push:
             manifest_path = self.source_dir / self.config.manifest_file
             if manifest_path.exists():
@@ -213,6 +403,15 @@ class GitPushHandler:
                         "error": "Pre-push verification failed",
                         "verification": verification
                     }
+        return None
+    
+    def push(self, verify: bool = True) -> Dict[str, Any]:
+        """Push to remote (verify=False when verify_before_push() already ran)"""
+        # Pre-push verification
+        if verify:
+            failure = self.verify_before_push()
+            if failure:
+                return failure
         
         # Execute push
         result = self._run_git('push', self.config.git_remote, self.config.git_branch)
@@ -260,18 +459,32 @@ class RsyncPushHandler:
         self.verifier = verifier
         self.source_dir = Path(config.source_dir)
     
-    def push_to_target(self, target: str) -> Dict[str, Any]:
-        """Push to a single rsync target"""
-        # Generate manifest before push
+    def write_manifest(self) -> Dict[str, Any]:
+        """Generate the source manifest and write it into the tree"""
         manifest = self.verifier.generate_manifest(self.source_dir)
         manifest_path = self.source_dir / self.config.manifest_file
         
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-        
-        # Execute rsync
-        cmd = f"rsync {self.config.rsync_options} {self.source_dir}/ {target}/"
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        write_manifest_file(manifest_path, manifest)
+        return manifest
+    
+    def _rsync(self, target: str, manifest: Dict[str, Any]) -> Dict[str, Any]:
+        """Run rsync for one target (argv list, no shell)"""
+        # The local hash cache (and its temp file) stays on this host
+        cache_file = self.config.manifest_cache_file
+        cmd = [
+            'rsync', *shlex.split(self.config.rsync_options),
+            f"--exclude=/{cache_file}", f"--exclude=/{cache_file}.tmp",
+            f"{self.source_dir}/", f"{target}/"
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        except OSError as e:  # e.g. rsync not installed
+            return {
+                "target": target,
+                "success": False,
+                "message": str(e),
+                "manifest_hash": manifest['manifest_hash']
+            }
         
         return {
             "target": target,
@@ -280,12 +493,26 @@ class RsyncPushHandler:
             "manifest_hash": manifest['manifest_hash']
         }
     
-    def push_all(self) -> List[Dict[str, Any]]:
-        """Push to all configured targets"""
-        results = []
-        for target in self.config.rsync_targets:
-            results.append(self.push_to_target(target))
-        return results
+    def push_to_target(self, target: str) -> Dict[str, Any]:
+        """Push to a single rsync target"""
+        # Generate manifest before push
+        return self._rsync(target, self.write_manifest())
+    
+    def push_all(self, manifest: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Push to all configured targets
+        
+        The manifest is written once (unless already written and passed in),
+        then targets are synced concurrently.
+        """
+        targets = self.config.rsync_targets
+        if not targets:
+            return []
+        
+        if manifest is None:
+            manifest = self.write_manifest()
+        with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+            return list(pool.map(lambda target: self._rsync(target, manifest), targets))
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -297,19 +524,31 @@ class WebhookHandler:
     Webhook triggers for deployment notifications
     """
     
+    # Upper bound on concurrent deliveries (and pooled connections per host)
+    MAX_CONCURRENT = 16
+    
     def __init__(self, config: PushConfig):
         self.config = config
+        self._secret_bytes = config.webhook_secret.encode() if config.webhook_secret else None
+        
+        # One keep-alive session so repeat targets skip the TCP/TLS handshake
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.MAX_CONCURRENT, pool_maxsize=self.MAX_CONCURRENT
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def _sign_payload(self, payload: str) -> str:
-        """Sign payload with webhook secret"""
-        if not self.config.webhook_secret:
+        """
+        Sign payload with webhook secret (HMAC-SHA256, hex)
+        
+        Receivers should compare signatures with hmac.compare_digest.
+        """
+        if not self._secret_bytes:
             return ""
         
-        return hashlib.hmac(
-            self.config.webhook_secret.encode(),
-            payload.encode(),
-            hashlib.sha256
-        ).hexdigest()
+        return hmac.new(self._secret_bytes, payload.encode(), hashlib.sha256).hexdigest()
     
     def trigger(self, event: str, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Trigger webhooks for an event"""
@@ -331,23 +570,30 @@ class WebhookHandler:
             "X-Sanctuary-Signature": signature
         }
         
-        results = []
-        for url in self.config.webhook_urls:
-            try:
-                response = requests.post(url, json=payload, headers=headers, timeout=10)
-                results.append({
-                    "url": url,
-                    "success": response.status_code < 400,
-                    "status_code": response.status_code
-                })
-            except Exception as e:
-                results.append({
-                    "url": url,
-                    "success": False,
-                    "error": str(e)
-                })
+        urls = self.config.webhook_urls
+        if not urls:
+            return []
         
-        return results
+        # Send the exact bytes that were signed
+        body = payload_str.encode()
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT, len(urls))) as pool:
+            return list(pool.map(lambda url: self._post_one(url, body, headers), urls))
+    
+    def _post_one(self, url: str, body: bytes, headers: Dict[str, str]) -> Dict[str, Any]:
+        """Deliver one webhook; failures are reported, never raised"""
+        try:
+            response = self.session.post(url, data=body, headers=headers, timeout=10)
+            return {
+                "url": url,
+                "success": response.status_code < 400,
+                "status_code": response.status_code
+            }
+        except Exception as e:
+            return {
+                "url": url,
+                "success": False,
+                "error": str(e)
+            }
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -361,7 +607,10 @@ class PushSystem:
     
     def __init__(self, config: PushConfig):
         self.config = config
-        self.verifier = IntegrityVerifier(config.hash_algorithm)
+        self.verifier = IntegrityVerifier(
+            config.hash_algorithm,
+            cache_path=Path(config.source_dir) / config.manifest_cache_file
+        )
         self.git_handler = GitPushHandler(config, self.verifier)
         self.rsync_handler = RsyncPushHandler(config, self.verifier) if config.rsync_enabled else None
         self.webhook_handler = WebhookHandler(config) if config.webhook_enabled else None
@@ -382,19 +631,33 @@ class PushSystem:
                 results['git'] = commit_result
                 return results
         
-        push_result = self.git_handler.push()
-        results['git'] = push_result
-        
-        # Rsync to additional targets
+        # Everything that hashes or writes the tree runs first, in order:
+        # verify against the commit's manifest, then rewrite it for rsync
+        verify_failure = self.git_handler.verify_before_push()
+        rsync_manifest = None
         if self.rsync_handler and self.config.rsync_targets:
-            results['rsync'] = self.rsync_handler.push_all()
-        
-        # Trigger webhooks
-        if self.webhook_handler:
-            results['webhooks'] = self.webhook_handler.trigger('push', {
-                'message': message,
-                'git_result': push_result
-            })
+            rsync_manifest = self.rsync_handler.write_manifest()
+        
+        # Network transfers overlap: rsync runs while git pushes and the
+        # webhooks (which report the git result) fire
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            rsync_future = None
+            if rsync_manifest is not None:
+                rsync_future = pool.submit(self.rsync_handler.push_all, rsync_manifest)
+            
+            push_result = verify_failure or self.git_handler.push(verify=False)
+            results['git'] = push_result
+            
+            # Trigger webhooks
+            if self.webhook_handler:
+                results['webhooks'] = self.webhook_handler.trigger('push', {
+                    'message': message,
+                    'git_result': push_result
+                })
+            
+            # Rsync to additional targets
+            if rsync_future:
+                results['rsync'] = rsync_future.result()
         
         return results
     
@@ -0,0 +1,24 @@
+"""
+Optional ahead-of-time compilation of hot pure-Python modules.
+
+Package metadata lives in pyproject.toml. Setting SANCTUARY_MYPYC=1 at
+build time compiles the modules below with mypyc (needs mypy installed);
+the resulting extension modules are imported in place of the .py files.
+
+    pip install mypy
+    SANCTUARY_MYPYC=1 pip install .
+"""
+
+import os
+
+from setuptools import setup
+
+# Dataclass-heavy serialization and integrity-hash paths
+MYPYC_MODULES = ["core/models.py"]
+
+ext_modules = []
+if os.environ.get("SANCTUARY_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(MYPYC_MODULES)
+
+setup(ext_modules=ext_modules)
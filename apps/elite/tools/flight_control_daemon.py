@@ -18,19 +18,30 @@ Changes from v1:
 
 import os
 import sys
-import time
 import signal
+import threading
 import logging
 import argparse
 import subprocess
+import contextlib
+import importlib.util
+import io
+import re
+import fnmatch
+import select
+import struct
+import ctypes
+import ctypes.util
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Optional, Callable, List
+from types import ModuleType
+from typing import Optional, Callable, List, Pattern
 from dataclasses import dataclass
 
 # Conditional import for watchdog
 try:
     from watchdog.observers import Observer
-    from watchdog.events import PatternMatchingEventHandler, FileSystemEvent
+    from watchdog.events import FileSystemEventHandler, FileSystemEvent
     WATCHDOG_AVAILABLE = True
 except ImportError:
     WATCHDOG_AVAILABLE = False
@@ -50,6 +61,8 @@ class DaemonConfig:
     patterns: List[str] = None
     ignore_patterns: List[str] = None
     debounce_seconds: float = 0.5
+    backend: str = "auto"  # "inotify", "watchdog" or "auto" (inotify on Linux)
+    isolate_sealer: bool = False  # Seal in a persistent worker process, not in-process
     
     def __post_init__(self):
         if self.sealer_cmd is None:
@@ -91,10 +104,11 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
 # LEDGER INTEGRATION
 # ═══════════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=1)
 def get_ledger_append_function() -> Optional[Callable]:
     """
     Attempt to import the ledger append function.
-    Returns None if not available.
+    Returns None if not available. Resolved once per process.
     """
     # Try multiple import paths
     import_paths = [
@@ -104,7 +118,7 @@ def get_ledger_append_function() -> Optional[Callable]:
     
     for module_path, func_name in import_paths:
         try:
-            module = __import__(module_path, fromlist=[func_name])
+            module = importlib.import_module(module_path)
             return getattr(module, func_name, None)
         except ImportError:
             continue
@@ -113,122 +127,538 @@ def get_ledger_append_function() -> Optional[Callable]:
 
 
 # ═══════════════════════════════════════════════════════════════════
-# FILE EVENT HANDLER
+# IN-PROCESS TOOL LOADING
 # ═══════════════════════════════════════════════════════════════════
 
-if WATCHDOG_AVAILABLE:
-    class FlightControlHandler(PatternMatchingEventHandler):
-        """
-        Handles file system events for the flight control daemon.
+@cache
+def load_script_module(script_path: str) -> Optional[ModuleType]:
+    """
+    Import a tool script by file path, once per path.
+    Returns None if the script is missing or fails to import.
+    """
+    if not os.path.isfile(script_path):
+        return None
+    
+    name = "_flight_control_" + Path(script_path).stem
+    try:
+        spec = importlib.util.spec_from_file_location(name, script_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except Exception:
+        return None
+    return module
+
+
+def resolve_in_process(cmd: List[str], func_name: str) -> Optional[Callable]:
+    """
+    Resolve a `python <script.py>` command to a function in that script.
+    
+    Returns None for any other command shape or if the script does not
+    provide the function; the caller then runs the command as a subprocess.
+    """
+    if len(cmd) != 2 or not os.path.basename(cmd[0]).startswith("python"):
+        return None
+    if not cmd[1].endswith(".py"):
+        return None
+    
+    module = load_script_module(cmd[1])
+    return getattr(module, func_name, None) if module else None
+
+
+# ═══════════════════════════════════════════════════════════════════
+# PERSISTENT SEALER WORKER
+# ═══════════════════════════════════════════════════════════════════
+
+class SealerWorker:
+    """
+    Sealer kept running as `<sealer_cmd> --server` between events.
+    
+    Paths go to its stdin one per line and each gets a single
+    "OK ..." / "ERR ..." line back, so interpreter startup is paid once
+    rather than per file. The worker is restarted if it exits; if a freshly
+    started worker exits without answering, the sealer does not speak the
+    protocol (or answers something else) and the worker is disabled (callers fall back to one
+    subprocess per file). Not thread-safe: callers serialize requests.
+    """
+    
+    def __init__(self, cmd: List[str], logger: logging.Logger, timeout: float = 30):
+        self.cmd = cmd + ["--server"]
+        self.logger = logger
+        self.timeout = timeout
+        self.disabled = False
+        self._proc: Optional[subprocess.Popen] = None
+    
+    def _start(self) -> None:
+        self._proc = subprocess.Popen(
+            self.cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            env=dict(os.environ, PYTHONUNBUFFERED="1")
+        )
+    
+    def _request(self, path: str) -> Optional[str]:
+        """Send one path and return the reply line, or None if the worker is gone"""
+        proc = self._proc
+        assert proc is not None and proc.stdin is not None and proc.stdout is not None
+        try:
+            proc.stdin.write(path + "\n")
+            proc.stdin.flush()
+        except (BrokenPipeError, OSError):
+            return None
         
-        Event Loop:
-        1. Detect source file change
-        2. Debounce rapid changes
-        3. Seal the changed file
-        4. Update SITREP (if not the SITREP itself)
-        5. Seal the updated SITREP
+        if os.name != "nt":
+            ready, _, _ = select.select([proc.stdout], [], [], self.timeout)
+            if not ready:
+                raise subprocess.TimeoutExpired(self.cmd, self.timeout)
+        return proc.stdout.readline() or None
+    
+    def seal(self, path: str, description: str) -> Optional[bool]:
         """
+        Seal a file through the worker.
         
-        def __init__(self, config: DaemonConfig, logger: logging.Logger):
-            super().__init__(
-                patterns=config.patterns,
-                ignore_patterns=config.ignore_patterns,
-                ignore_directories=True,
-                case_sensitive=False
-            )
-            self.config = config
-            self.logger = logger
-            self.append_event = get_ledger_append_function()
-            self._last_event_time: dict = {}
-        
-        def _should_process(self, path: str) -> bool:
-            """
-            Check if event should be processed (debouncing).
-            Prevents duplicate processing from editors that save multiple times.
-            """
-            current_time = time.time()
-            last_time = self._last_event_time.get(path, 0)
-            
-            if current_time - last_time < self.config.debounce_seconds:
-                return False
-            
-            self._last_event_time[path] = current_time
-            return True
+        Returns:
+            True/False for success/failure, or None if the worker is
+            unavailable and the caller should use a one-off subprocess
+        """
+        if self.disabled or "\n" in path:
+            return None
         
-        def _run_command(self, cmd: List[str], description: str) -> bool:
-            """
-            Run a subprocess command with error handling.
+        for _ in range(2):
+            fresh = self._proc is None or self._proc.poll() is not None
+            if fresh:
+                try:
+                    self._start()
+                except OSError as e:
+                    self.logger.warning(f"Sealer worker failed to start: {e}")
+                    self.disabled = True
+                    return None
             
-            Returns:
-                True if command succeeded, False otherwise
-            """
             try:
-                result = subprocess.run(
-                    cmd,
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                self.logger.debug(f"{description} output: {result.stdout}")
-                return True
-            except subprocess.CalledProcessError as e:
-                self.logger.error(f"{description} failed: {e.stderr}")
-                return False
+                reply = self._request(path)
             except subprocess.TimeoutExpired:
                 self.logger.error(f"{description} timed out")
+                self.stop()
                 return False
-            except FileNotFoundError as e:
-                self.logger.error(f"{description} command not found: {e}")
-                return False
-        
-        def process(self, event: FileSystemEvent) -> None:
-            """Process a file system event"""
-            changed_file = event.src_path
-            filename = os.path.basename(changed_file)
-            
-            # Debounce check
-            if not self._should_process(changed_file):
-                self.logger.debug(f"Debounced: {filename}")
-                return
             
-            self.logger.info(f"CHANGE DETECTED: {filename}")
+            status, _, output = (reply or "").rstrip("\n").partition(" ")
+            if status == "OK":
+                self.logger.debug(f"{description} output: {output}")
+                return True
+            if status == "ERR":
+                self.logger.error(f"{description} failed: {output}")
+                return False
             
-            # Step 1: Seal the changed file
-            seal_cmd = self.config.sealer_cmd + [changed_file]
-            if not self._run_command(seal_cmd, f"Seal {filename}"):
+            self.stop()
+            if fresh:
+                break
+            self.logger.debug("Sealer worker exited - restarting")
+        
+        self.logger.warning("Sealer does not support --server - using one process per file")
+        self.disabled = True
+        return None
+    
+    def stop(self) -> None:
+        """Close the worker's stdin and wait for it to exit"""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        assert proc.stdin is not None and proc.stdout is not None
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# PATH FILTERING
+# ═══════════════════════════════════════════════════════════════════
+
+def compile_patterns(patterns: List[str]) -> Pattern:
+    """Fold shell-style patterns into one case-insensitive regex"""
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns), re.IGNORECASE)
+
+
+def make_name_filter(patterns: List[str], ignore_patterns: List[str]) -> Callable[[str], bool]:
+    """
+    Predicate on file names: matches a pattern and no ignore pattern.
+    Both pattern lists are compiled once, up front.
+    """
+    match = compile_patterns(patterns).match
+    ignore = compile_patterns(ignore_patterns).match if ignore_patterns else None
+    
+    def wanted(name: str) -> bool:
+        return bool(match(name)) and not (ignore and ignore(name))
+    
+    return wanted
+
+
+# ═══════════════════════════════════════════════════════════════════
+# DEBOUNCING
+# ═══════════════════════════════════════════════════════════════════
+
+class Debouncer:
+    """
+    Trailing-edge debouncer keyed by path.
+    
+    Each event (re)starts a timer for its path; the callback runs once the
+    path has been quiet for `delay` seconds, so the last write of a burst
+    is always the one processed. Fired or cancelled timers are dropped, so
+    only paths with pending work are tracked.
+    """
+    
+    def __init__(self, delay: float, callback: Callable[[str], None]):
+        self.delay = delay
+        self.callback = callback
+        self._timers: dict = {}
+        self._lock = threading.Lock()
+    
+    def schedule(self, path: str) -> bool:
+        """Schedule the callback for path; returns True if it restarted a pending timer"""
+        timer = threading.Timer(self.delay, self._fire, args=(path,))
+        timer.daemon = True
+        with self._lock:
+            previous = self._timers.pop(path, None)
+            if previous:
+                previous.cancel()
+            self._timers[path] = timer
+            timer.start()
+        return previous is not None
+    
+    def _fire(self, path: str) -> None:
+        with self._lock:
+            if self._timers.get(path) is not threading.current_thread():
+                return  # Superseded by a newer event
+            del self._timers[path]
+        self.callback(path)
+    
+    def cancel_all(self) -> None:
+        """Drop all pending callbacks"""
+        with self._lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# FILE EVENT HANDLER
+# ═══════════════════════════════════════════════════════════════════
+
+class FlightControlProcessor:
+    """
+    Seal/SITREP pipeline for changed files, independent of the watcher.
+
+    Event Loop:
+    1. Detect source file change
+    2. Debounce rapid changes (trailing edge: the last save wins)
+    3. Seal the changed file
+    4. Update SITREP (if not the SITREP itself)
+    5. Seal the updated SITREP
+    """
+
+    def __init__(self, config: DaemonConfig, logger: logging.Logger):
+        self.config = config
+        self.logger = logger
+        self.append_event = get_ledger_append_function()
+        self.debouncer = Debouncer(config.debounce_seconds, self.process_path)
+
+        # Timers fire on their own threads; the pipeline runs one file at a time
+        self._process_lock = threading.Lock()
+
+        # Call the sealer/updater scripts in-process when they expose
+        # seal_path(path) / main(); otherwise fall back to subprocesses.
+        # An isolated sealer runs as one long-lived worker process instead.
+        self._sealer: Optional[SealerWorker] = None
+        self._seal_fn = None
+        if config.isolate_sealer:
+            self._sealer = SealerWorker(config.sealer_cmd, logger)
+        else:
+            self._seal_fn = resolve_in_process(config.sealer_cmd, "seal_path")
+        self._update_fn = resolve_in_process(config.updater_cmd, "main")
+
+    def _run_command(self, cmd: List[str], description: str) -> bool:
+        """
+        Run a subprocess command with error handling.
+
+        Returns:
+            True if command succeeded, False otherwise
+        """
+        try:
+            result = subprocess.run(
+                cmd,
+                check=True,
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+            self.logger.debug(f"{description} output: {result.stdout}")
+            return True
+        except subprocess.CalledProcessError as e:
+            self.logger.error(f"{description} failed: {e.stderr}")
+            return False
+        except subprocess.TimeoutExpired:
+            self.logger.error(f"{description} timed out")
+            return False
+        except FileNotFoundError as e:
+            self.logger.error(f"{description} command not found: {e}")
+            return False
+
+    def _call_in_process(self, func: Callable, args: List[str], description: str) -> bool:
+        """
+        Call a tool function with error handling, like _run_command.
+
+        Returns:
+            True if it returned 0 (or None), False otherwise
+        """
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                code = func(*args)
+        except Exception as e:
+            self.logger.error(f"{description} failed: {e}")
+            return False
+
+        if code:
+            self.logger.error(f"{description} failed: {output.getvalue()}")
+            return False
+        self.logger.debug(f"{description} output: {output.getvalue()}")
+        return True
+
+    def _seal(self, path: str, description: str) -> bool:
+        """Seal a file in-process or via the sealer worker if possible, else via the sealer command"""
+        if self._seal_fn:
+            return self._call_in_process(self._seal_fn, [path], description)
+        if self._sealer:
+            sealed = self._sealer.seal(path, description)
+            if sealed is not None:
+                return sealed
+        return self._run_command(self.config.sealer_cmd + [path], description)
+
+    def _update_sitrep(self) -> bool:
+        """Update the SITREP in-process if possible, else via the updater command"""
+        if self._update_fn:
+            return self._call_in_process(self._update_fn, [], "Update SITREP")
+        return self._run_command(self.config.updater_cmd, "Update SITREP")
+
+    def close(self) -> None:
+        """Drop pending work and stop the sealer worker"""
+        self.debouncer.cancel_all()
+        with self._process_lock:
+            if self._sealer:
+                self._sealer.stop()
+
+    def submit(self, path: str) -> None:
+        """Queue a changed file for processing (after the debounce delay)"""
+        if self.debouncer.schedule(path):
+            self.logger.debug(f"Debounced: {os.path.basename(path)}")
+
+    def process_path(self, changed_file: str) -> None:
+        """Seal a changed file and refresh the SITREP"""
+        with self._process_lock:
+            self._process_path(changed_file)
+
+    def _process_path(self, changed_file: str) -> None:
+        filename = os.path.basename(changed_file)
+
+        self.logger.info(f"CHANGE DETECTED: {filename}")
+
+        # Step 1: Seal the changed file
+        if not self._seal(changed_file, f"Seal {filename}"):
+            return
+        self.logger.info(f"Sealed: {filename}")
+
+        # Step 2: Update SITREP if this wasn't the SITREP itself
+        sitrep_basename = os.path.basename(self.config.sitrep_file)
+        if sitrep_basename not in filename:
+            self.logger.info("Updating SITREP...")
+
+            if self._update_sitrep():
+                # Log to ledger if available
+                if self.append_event:
+                    try:
+                        self.append_event("SITREP_UPDATED", {"triggered_by": filename})
+                    except Exception as e:
+                        self.logger.warning(f"Failed to log to ledger: {e}")
+
+                # Step 3: Seal the updated SITREP
+                if self._seal(self.config.sitrep_file, "Seal SITREP"):
+                    self.logger.info("SITREP sealed")
+
+        self.logger.info("BOARD GREEN - LISTENING...")
+
+
+if WATCHDOG_AVAILABLE:
+    class FlightControlHandler(FileSystemEventHandler):
+        """
+        Feeds watchdog file events into a FlightControlProcessor.
+        
+        File names are filtered with the precompiled pattern regexes before
+        dispatch, instead of PatternMatchingEventHandler's per-event globbing.
+        """
+        
+        def __init__(self, processor: FlightControlProcessor):
+            super().__init__()
+            config = processor.config
+            self._wanted = make_name_filter(config.patterns, config.ignore_patterns)
+            self.processor = processor
+        
+        def dispatch(self, event: FileSystemEvent) -> None:
+            """Drop directory events and unwanted names, then dispatch"""
+            if event.is_directory or not self._wanted(os.path.basename(event.src_path)):
                 return
-            self.logger.info(f"Sealed: {filename}")
-            
-            # Step 2: Update SITREP if this wasn't the SITREP itself
-            sitrep_basename = os.path.basename(self.config.sitrep_file)
-            if sitrep_basename not in filename:
-                self.logger.info("Updating SITREP...")
-                
-                if self._run_command(self.config.updater_cmd, "Update SITREP"):
-                    # Log to ledger if available
-                    if self.append_event:
-                        try:
-                            self.append_event("SITREP_UPDATED", {"triggered_by": filename})
-                        except Exception as e:
-                            self.logger.warning(f"Failed to log to ledger: {e}")
-                    
-                    # Step 3: Seal the updated SITREP
-                    sitrep_seal_cmd = self.config.sealer_cmd + [self.config.sitrep_file]
-                    if self._run_command(sitrep_seal_cmd, "Seal SITREP"):
-                        self.logger.info("SITREP sealed")
-            
-            self.logger.info("BOARD GREEN - LISTENING...")
+            super().dispatch(event)
         
         def on_modified(self, event: FileSystemEvent) -> None:
             """Handle file modification events"""
             if not event.is_directory:
-                self.process(event)
+                self.processor.submit(event.src_path)
         
         def on_created(self, event: FileSystemEvent) -> None:
             """Handle file creation events"""
             if not event.is_directory:
-                self.process(event)
+                self.processor.submit(event.src_path)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# INOTIFY OBSERVER (LINUX)
+# ═══════════════════════════════════════════════════════════════════
+
+# <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+INOTIFY_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len; then name
+
+
+def _load_libc_inotify() -> Optional[ctypes.CDLL]:
+    """libc with inotify bound, or None off Linux / without inotify"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+_libc = _load_libc_inotify()
+INOTIFY_AVAILABLE = _libc is not None
+
+
+class InotifyObserver(threading.Thread):
+    """
+    Recursive directory watcher on raw inotify.
+    
+    Blocks in poll() on the inotify fd (plus a wakeup pipe for stop()), and
+    filters names with one precompiled regex before handing matching file
+    paths to the callback. Same start/stop/join lifecycle as watchdog's
+    Observer.
+    """
+    
+    def __init__(self, watch_dir: str, callback: Callable[[str], None],
+                 patterns: List[str], ignore_patterns: List[str],
+                 logger: logging.Logger):
+        super().__init__(name="inotify-observer", daemon=True)
+        self.watch_dir = watch_dir
+        self.callback = callback
+        self.logger = logger
+        self._wanted = make_name_filter(patterns, ignore_patterns)
+        self._dirs: dict = {}  # watch descriptor -> directory path
+        
+        self._fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._wake_r, self._wake_w = os.pipe()
+        self._add_tree(watch_dir)
+    
+    def _add_watch(self, directory: str) -> None:
+        wd = _libc.inotify_add_watch(self._fd, os.fsencode(directory), INOTIFY_MASK)
+        if wd < 0:
+            self.logger.warning(f"Cannot watch {directory}: {os.strerror(ctypes.get_errno())}")
+            return
+        self._dirs[wd] = directory
+    
+    def _add_tree(self, root: str) -> None:
+        self._add_watch(root)
+        for dirpath, dirnames, _ in os.walk(root):
+            for name in dirnames:
+                self._add_watch(os.path.join(dirpath, name))
+    
+    def _handle(self, data: bytes) -> None:
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            offset += _INOTIFY_EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            
+            if mask & IN_Q_OVERFLOW:
+                self.logger.warning("inotify queue overflowed; some changes were missed")
+                continue
+            if mask & IN_IGNORED:  # Watched directory removed
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            
+            path = os.path.join(directory, name)
+            if mask & IN_ISDIR:
+                # New subdirectory (created or moved in): watch it and
+                # everything already inside it
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self._add_tree(path)
+                    for dirpath, _, filenames in os.walk(path):
+                        for filename in filenames:
+                            if self._wanted(filename):
+                                self.callback(os.path.join(dirpath, filename))
+            elif self._wanted(name):
+                self.callback(path)
+    
+    def run(self) -> None:
+        poller = select.poll()
+        poller.register(self._fd, select.POLLIN)
+        poller.register(self._wake_r, select.POLLIN)
+        try:
+            while True:
+                ready = {fd for fd, _ in poller.poll()}
+                if self._wake_r in ready:
+                    return
+                try:
+                    data = os.read(self._fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                self._handle(data)
+        finally:
+            os.close(self._fd)
+            os.close(self._wake_r)
+    
+    def stop(self) -> None:
+        """Wake the watcher thread and let it exit"""
+        try:
+            os.write(self._wake_w, b"\0")
+            os.close(self._wake_w)
+        except OSError:
+            pass
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -246,8 +676,9 @@ class FlightControlDaemon:
         self.config = config
         self.logger = setup_logging(verbose)
         self.ide_mode = ide_mode
-        self._running = True
-        self._observer: Optional[Observer] = None
+        self._stop_event = threading.Event()
+        self._observer: Optional[threading.Thread] = None
+        self._processor: Optional[FlightControlProcessor] = None
         
         # Register signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -256,7 +687,7 @@ class FlightControlDaemon:
     def _signal_handler(self, signum: int, frame) -> None:
         """Handle shutdown signals"""
         self.logger.info(f"Received signal {signum}, shutting down...")
-        self._running = False
+        self._stop_event.set()
     
     def _validate_environment(self) -> bool:
         """Validate that required directories and tools exist"""
@@ -272,33 +703,57 @@ class FlightControlDaemon:
         
         return True
     
-    def run(self) -> None:
-        """Start the daemon"""
+    def _select_backend(self) -> Optional[str]:
+        """Resolve the configured watcher backend to one that can run here"""
+        if self.config.backend in ("auto", "inotify"):
+            if INOTIFY_AVAILABLE:
+                return "inotify"
+            if self.config.backend == "inotify":
+                self.logger.warning("inotify backend needs Linux - falling back to watchdog")
+        
         if not WATCHDOG_AVAILABLE:
             self.logger.error("watchdog package not installed. Run: pip install watchdog")
+            return None
+        return "watchdog"
+    
+    def run(self) -> None:
+        """Start the daemon"""
+        backend = self._select_backend()
+        if not backend:
             return
         
         if not self._validate_environment():
             return
         
         # Print banner
-        self._print_banner()
+        self._print_banner(backend)
         
         # Create and start observer
-        handler = FlightControlHandler(self.config, self.logger)
-        self._observer = Observer()
-        self._observer.schedule(handler, path=self.config.watch_dir, recursive=True)
+        self._processor = FlightControlProcessor(self.config, self.logger)
+        if backend == "inotify":
+            self._observer = InotifyObserver(
+                self.config.watch_dir, self._processor.submit,
+                self.config.patterns, self.config.ignore_patterns, self.logger
+            )
+        else:
+            handler = FlightControlHandler(self._processor)
+            self._observer = Observer()
+            self._observer.schedule(handler, path=self.config.watch_dir, recursive=True)
         self._observer.start()
         
         self.logger.info("LISTENING for changes...")
         
         try:
-            while self._running:
-                time.sleep(1)
+            if os.name == "nt":
+                # Lock waits are not interruptible by signals on Windows
+                while not self._stop_event.wait(timeout=60):
+                    pass
+            else:
+                self._stop_event.wait()
         finally:
             self._shutdown()
     
-    def _print_banner(self) -> None:
+    def _print_banner(self, backend: str) -> None:
         """Print startup banner"""
         print("=" * 60)
         print("FLIGHT CONTROL DAEMON - SOVEREIGN SANCTUARY ELITE")
@@ -306,6 +761,9 @@ class FlightControlDaemon:
         print(f"Watching:  {os.path.abspath(self.config.watch_dir)}")
         print(f"Patterns:  {', '.join(self.config.patterns)}")
         print(f"Ignored:   {', '.join(self.config.ignore_patterns)}")
+        print(f"Backend:   {backend}")
+        if self.config.isolate_sealer:
+            print("Sealer:    persistent worker process")
         if self.ide_mode:
             print("IDE Mode:  ENABLED (optimized for IDE integration)")
         print("-" * 60)
@@ -318,6 +776,9 @@ class FlightControlDaemon:
             self._observer.stop()
             self._observer.join(timeout=5)
         
+        if self._processor:
+            self._processor.close()
+        
         self.logger.info("Flight Control Daemon terminated")
 
 
@@ -335,6 +796,8 @@ Examples:
   python flight_control_daemon.py
   python flight_control_daemon.py --verbose
   python flight_control_daemon.py --ide-mode --watch-dir ./evidence
+  python flight_control_daemon.py --backend watchdog
+  python flight_control_daemon.py --isolate-sealer
         """
     )
     parser.add_argument(
@@ -353,6 +816,17 @@ Examples:
         action="store_true",
         help="Enable IDE optimization mode"
     )
+    parser.add_argument(
+        "--backend",
+        choices=["auto", "inotify", "watchdog"],
+        default="auto",
+        help="File watcher backend (default: auto - inotify on Linux, else watchdog)"
+    )
+    parser.add_argument(
+        "--isolate-sealer",
+        action="store_true",
+        help="Run the sealer in a persistent worker process instead of in-process"
+    )
     parser.add_argument(
         "--no-stop",
         action="store_true",
@@ -361,7 +835,11 @@ Examples:
     
     args = parser.parse_args()
     
-    config = DaemonConfig(watch_dir=args.watch_dir)
+    config = DaemonConfig(
+        watch_dir=args.watch_dir,
+        backend=args.backend,
+        isolate_sealer=args.isolate_sealer
+    )
     daemon = FlightControlDaemon(config, verbose=args.verbose, ide_mode=args.ide_mode)
     daemon.run()
 
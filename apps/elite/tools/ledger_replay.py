@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Ledger Replay - Sovereign Sanctuary Elite
+
+Read ledger entries back from either ledger encoding:
+- evidence/ledger.jsonl: one JSON object per line
+- evidence/ledger.msgpack: 4-byte little-endian length + MessagePack entry
+
+Version: 2.0.0
+
+The MessagePack ledger is walked over a read-only mmap by length
+prefix, without splitting or copying the file.
+"""
+
+import json
+import mmap
+import struct
+import sys
+import argparse
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# ═══════════════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════════════
+
+LEDGER_PATH = Path("evidence/ledger.jsonl")
+
+_LENGTH = struct.Struct("<I")
+
+# ═══════════════════════════════════════════════════════════════════
+# CORE FUNCTIONS
+# ═══════════════════════════════════════════════════════════════════
+
+def iter_msgpack_ledger(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield entries from a length-prefixed MessagePack ledger.
+    
+    Raises:
+        ValueError: If the file ends inside a record
+    """
+    with path.open("rb") as f:
+        if not path.stat().st_size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                offset, end = 0, len(mm)
+                while offset < end:
+                    if offset + _LENGTH.size > end:
+                        raise ValueError(f"Truncated record header at byte {offset}")
+                    (length,) = _LENGTH.unpack_from(mm, offset)
+                    offset += _LENGTH.size
+                    if offset + length > end:
+                        raise ValueError(f"Truncated record at byte {offset - _LENGTH.size}")
+                    yield msgpack.unpackb(view[offset:offset + length], raw=False)
+                    offset += length
+            finally:
+                view.release()
+
+
+def iter_json_ledger(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield entries from a JSON-lines ledger, skipping blank lines"""
+    with path.open("rb") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_ledger(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield entries from a ledger, choosing the decoder by file suffix"""
+    if path.suffix == ".msgpack":
+        return iter_msgpack_ledger(path)
+    return iter_json_ledger(path)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════════════════
+
+def main() -> int:
+    """
+    Print every ledger entry as a JSON line.
+    
+    Returns:
+        0 on success, 1 on failure
+    """
+    parser = argparse.ArgumentParser(
+        description="Replay a ledger (.jsonl or length-prefixed .msgpack) as JSON lines"
+    )
+    parser.add_argument(
+        "ledger",
+        nargs="?",
+        default=str(LEDGER_PATH),
+        help=f"Ledger file to read (default: {LEDGER_PATH})"
+    )
+    parser.add_argument(
+        "--event",
+        help="Only print entries with this event type"
+    )
+    args = parser.parse_args()
+    path = Path(args.ledger)
+    
+    if not path.exists():
+        print(f"❌ Ledger not found: {path}", file=sys.stderr)
+        return 1
+    if path.suffix == ".msgpack" and not MSGPACK_AVAILABLE:
+        print("❌ Reading a MessagePack ledger requires msgpack. Run: pip install msgpack",
+              file=sys.stderr)
+        return 1
+    
+    try:
+        for entry in iter_ledger(path):
+            if args.event and entry.get("event") != args.event:
+                continue
+            sys.stdout.write(json.dumps(entry) + "\n")
+    except ValueError as e:
+        print(f"❌ Corrupt ledger: {e}", file=sys.stderr)
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,18 +10,45 @@ Author: Manus AI for Architect
 
 SAFETY GUARANTEES:
 - Never overwrites existing restore points
-- All files hashed with SHA-256
+- All files hashed (SHA-256, or BLAKE3 with --hash-algorithm blake3)
 - Manifest is cryptographically sealed
 - Only files in allowlist are included
 """
 
 import json
+import os
 import hashlib
 import shutil
+import stat
 import sys
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import liburing
+    LIBURING_AVAILABLE = True
+except ImportError:
+    LIBURING_AVAILABLE = False
+
+try:
+    from tools.restore import restore_io
+except ImportError:  # run as a script from tools/restore
+    import restore_io  # type: ignore[no-redef]
 
 # ═══════════════════════════════════════════════════════════════════
 # CONFIGURATION
@@ -29,24 +56,117 @@ from typing import List, Dict, Any, Optional
 
 ALLOWLIST_PATH = Path("tools/restore/restore_allowlist.txt")
 OUTPUT_DIR = Path("RESTORE_POINTS")
-LEDGER_PATH = Path("evidence/ledger.jsonl")
+
+# Digests of allowlisted sources keyed by (size, mtime_ns), reused across
+# restore points so unchanged files are copied without being re-hashed
+HASH_CACHE_PATH = OUTPUT_DIR / ".hash_cache.json"
+
+# --hash-algorithm choices -> manifest "hash_algorithm" label. Each file
+# entry stores its digest under the choice name ("sha256" / "blake3").
+HASH_ALGORITHMS = {"sha256": "SHA-256", "blake3": "BLAKE3"}
+
+# Block size for copy_and_hash reads and HashingWriter flushes
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# Allowlist entries copied and hashed concurrently (I/O bound, GIL released)
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# --io-uring: files up to this size are copied in batches of linked
+# read/write pairs, IO_URING_BATCH files per submission; larger files
+# go through the thread pool
+IO_URING_MAX_FILE_SIZE = 1024 * 1024
+IO_URING_BATCH = 64
 
 # ═══════════════════════════════════════════════════════════════════
 # CORE FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════
 
-def sha256_file(path: Path) -> str:
-    """Calculate SHA-256 hash of a file"""
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for block in iter(lambda: f.read(8192), b""):
-            h.update(block)
-    return h.hexdigest()
+def new_hash(algorithm: str = "sha256") -> Any:
+    """Fresh hash object for a file digest algorithm ("sha256" or "blake3")"""
+    if algorithm == "blake3":
+        return blake3.blake3()
+    return hashlib.sha256()
+
+
+class HashingWriter:
+    """
+    Text sink that UTF-8 encodes, hashes and writes in one pass
+    
+    json.dump emits many small fragments; they are batched into blocks of
+    about HASH_BLOCK_SIZE characters before encoding.
+    """
+    
+    def __init__(self, fp):
+        self.fp = fp
+        self.h = hashlib.sha256()
+        self._parts: List[str] = []
+        self._pending = 0
+    
+    def write(self, s: str) -> None:
+        self._parts.append(s)
+        self._pending += len(s)
+        if self._pending >= HASH_BLOCK_SIZE:
+            self.flush()
+    
+    def flush(self) -> None:
+        data = "".join(self._parts).encode("utf-8")
+        self._parts.clear()
+        self._pending = 0
+        self.h.update(data)
+        self.fp.write(data)
+    
+    def hexdigest(self) -> str:
+        self.flush()
+        return self.h.hexdigest()
+
+
+def apply_source_stat(dest: Path, st: os.stat_result) -> None:
+    """
+    Give a copy the source's permission bits and timestamps
+    
+    This is the part of copystat that restores depend on: restore_from_point
+    copies a file back with the restore point copy's mode. Ownership and
+    extended attributes are not copied (shutil.copy2 skips ownership too).
+    """
+    os.chmod(dest, stat.S_IMODE(st.st_mode))
+    os.utime(dest, ns=(st.st_atime_ns, st.st_mtime_ns))
 
 
-def sha256_string(data: str) -> str:
-    """Calculate SHA-256 hash of a string"""
-    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+def copy_file(source: Path, dest: Path, st: os.stat_result) -> None:
+    """Copy file contents (kernel sendfile path), mode and timestamps"""
+    shutil.copyfile(source, dest)
+    apply_source_stat(dest, st)
+
+
+def copy_and_hash(
+    source: Path, dest: Path, st: os.stat_result, algorithm: str = "sha256"
+) -> Tuple[str, int]:
+    """
+    Copy a file and hash it in the same pass
+    
+    Each block is hashed as it is written, so the copy is never read back.
+    One buffer is reused for the whole file. The source's mode and
+    timestamps are applied to the copy.
+    
+    Returns:
+        (hex digest, bytes copied)
+    """
+    h = new_hash(algorithm)
+    buf = bytearray(HASH_BLOCK_SIZE)
+    view = memoryview(buf)
+    size = 0
+    with source.open("rb", buffering=0) as rf, dest.open("wb", buffering=0) as wf:
+        while True:
+            n = rf.readinto(buf)
+            if not n:
+                break
+            chunk = view[:n]
+            h.update(chunk)
+            while chunk:  # unbuffered writes may be partial
+                chunk = chunk[wf.write(chunk):]
+            size += n
+    apply_source_stat(dest, st)
+    return h.hexdigest(), size
 
 
 def load_allowlist() -> List[tuple[str, bool]]:
@@ -103,10 +223,236 @@ tools/flight_control_daemon.py
     print(f"   Created: {ALLOWLIST_PATH}")
 
 
-def log_restore_point(restore_id: str, manifest_hash: str, file_count: int) -> None:
-    """Log the restore point creation to the ledger"""
-    LEDGER_PATH.parent.mkdir(parents=True, exist_ok=True)
+def load_hash_cache(algorithm: str = "sha256") -> Dict[str, Tuple[int, int, str]]:
+    """Read the persisted digest cache, ignoring it if unusable or for another algorithm"""
+    try:
+        data = json.loads(HASH_CACHE_PATH.read_text(encoding="utf-8"))
+        if data.get("algorithm", "sha256") != algorithm:
+            return {}
+        return {path: tuple(entry) for path, entry in data["files"].items()}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def save_hash_cache(cache: Dict[str, Tuple[int, int, str]], algorithm: str = "sha256") -> None:
+    """Persist the digest cache atomically"""
+    tmp_path = HASH_CACHE_PATH.with_name(f"{HASH_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        data = {"algorithm": algorithm, "files": cache}
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, HASH_CACHE_PATH)
+    except OSError:
+        pass  # The cache is an optimization only
+
+
+def write_manifest(manifest_path: Path, manifest: Dict[str, Any]) -> str:
+    """
+    Write the manifest as sorted, 2-space indented JSON and hash it
+    
+    orjson produces the bytes directly when available; otherwise the
+    stdlib encoder streams through a HashingWriter.
+    
+    Returns:
+        SHA-256 hex digest of the bytes written
+    """
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(manifest, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+        manifest_path.write_bytes(data)
+        return hashlib.sha256(data).hexdigest()
+    
+    with manifest_path.open("wb") as fp:
+        writer = HashingWriter(fp)
+        json.dump(manifest, writer, indent=2, sort_keys=True)
+        return writer.hexdigest()
+
+
+def stat_source(path_str: str) -> Optional[os.stat_result]:
+    """Stat an allowlisted source; None if it does not exist"""
+    try:
+        return os.stat(path_str)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def file_entry(
+    path_str: str, file_hash: str, size: int, st: os.stat_result, algorithm: str = "sha256"
+) -> Dict[str, Any]:
+    """Manifest entry for one copied file; the digest is keyed by algorithm"""
+    return {
+        "path": path_str,
+        algorithm: file_hash,
+        "size": size,
+        "mtime": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).isoformat()
+    }
+
+
+def copy_entry(
+    restore_dir: Path,
+    path_str: str,
+    st: os.stat_result,
+    hash_cache: Dict[str, Tuple[int, int, str]],
+    new_cache: Dict[str, Tuple[int, int, str]],
+    reflink: bool = True,
+    algorithm: str = "sha256"
+) -> Dict[str, Any]:
+    """
+    Copy one allowlisted file into the restore point and record it.
+    
+    Size and mtime come from the source's single up-front stat (st).
+    With reflink, the copy is a copy-on-write clone where the filesystem
+    supports it. Sources whose size and mtime match hash_cache are not
+    hashed; the digest of every copied file is recorded in new_cache.
+    
+    Returns:
+        Manifest file entry
+    """
+    # Copy and hash file (parent directories are created up front by main)
+    source = Path(path_str)
+    dest = restore_dir / path_str
+    key = os.path.abspath(path_str)
+    cached = hash_cache.get(key)
+    if not (cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns):
+        cached = None
+    
+    if reflink and restore_io.reflink_file(source, dest):
+        apply_source_stat(dest, st)
+        file_hash = cached[2] if cached else restore_io.hash_file(source, algorithm)
+        size = st.st_size
+    elif cached:
+        copy_file(source, dest, st)
+        file_hash, size = cached[2], st.st_size
+    else:
+        file_hash, size = copy_and_hash(source, dest, st, algorithm)
+    new_cache[key] = (size, st.st_mtime_ns, file_hash)
+    
+    # Record file info
+    return file_entry(path_str, file_hash, size, st, algorithm)
+
+
+def uring_copy_batch(
+    ring: Any,
+    restore_dir: Path,
+    batch: List[Tuple[str, os.stat_result]]
+) -> List[Optional[bytearray]]:
+    """
+    Copy a batch of small files with a single io_uring submission
+    
+    Each file is one read SQE linked to a write SQE of the same buffer, so
+    the kernel only writes after a complete read (a short read cancels the
+    write). Empty files need no I/O beyond creating the copy.
+    
+    Returns:
+        File contents per batch entry, or None where the copy failed and
+        must be redone normally
+    """
+    fds: List[int] = []
+    contents: List[Optional[bytearray]] = [None] * len(batch)
+    expected = 0
+    try:
+        for i, (path_str, st) in enumerate(batch):
+            try:
+                src = os.open(path_str, os.O_RDONLY)
+                fds.append(src)
+                dst = os.open(restore_dir / path_str, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                fds.append(dst)
+            except OSError:
+                continue
+            
+            buf = contents[i] = bytearray(st.st_size)
+            if not buf:
+                continue
+            
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_read(sqe, src, buf, 0)
+            liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_LINK)
+            liburing.io_uring_sqe_set_data64(sqe, 2 * i)
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_write(sqe, dst, buf, 0)
+            liburing.io_uring_sqe_set_data64(sqe, 2 * i + 1)
+            expected += 2
+        
+        if expected:
+            liburing.io_uring_submit_and_wait(ring, expected)
+        
+        # Reap completions one at a time: wait_cqe yields the CQE at the
+        # ring's head, and advancing by one marks it seen. Indexing past
+        # cqe[0] would assume the ready CQEs are contiguous, which breaks
+        # once the completion ring wraps. A failed op's res raises (e.g.
+        # ECANCELED).
+        cqe = liburing.Cqe()
+        for _ in range(expected):
+            liburing.io_uring_wait_cqe(ring, cqe)
+            entry = cqe[0]
+            i = entry.user_data // 2
+            try:
+                done = entry.res
+            except OSError:
+                done = -1
+            liburing.io_uring_cq_advance(ring, 1)
+            if contents[i] is not None and done != len(contents[i]):
+                contents[i] = None
+    finally:
+        for fd in fds:
+            os.close(fd)
+    
+    return contents
+
+
+def uring_copy_entries(
+    restore_dir: Path,
+    entries: List[Tuple[str, os.stat_result]],
+    hash_cache: Dict[str, Tuple[int, int, str]],
+    new_cache: Dict[str, Tuple[int, int, str]],
+    algorithm: str = "sha256"
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Copy small files through io_uring and record them like copy_entry.
+    
+    Files are hashed from the buffer that was written, unless size and
+    mtime match hash_cache. Files whose batched copy failed are left out,
+    as is everything if the ring cannot be set up (e.g. io_uring disabled
+    by seccomp); the caller copies those through the thread pool.
     
+    Returns:
+        Manifest file entries keyed by path
+    """
+    # Any failure here (ENOSYS, EPERM under seccomp, a binding error, ...)
+    # just means this run copies through the thread pool
+    try:
+        ring = liburing.Ring()
+        liburing.io_uring_queue_init(2 * IO_URING_BATCH, ring)
+    except Exception as e:
+        print(f"  ⚠️  io_uring unavailable ({e}) - using the thread pool")
+        return {}
+    
+    copied: Dict[str, Dict[str, Any]] = {}
+    try:
+        for start in range(0, len(entries), IO_URING_BATCH):
+            batch = entries[start:start + IO_URING_BATCH]
+            for (path_str, st), data in zip(batch, uring_copy_batch(ring, restore_dir, batch)):
+                if data is None:
+                    continue
+                apply_source_stat(restore_dir / path_str, st)
+                key = os.path.abspath(path_str)
+                cached = hash_cache.get(key)
+                if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+                    file_hash = cached[2]
+                else:
+                    h = new_hash(algorithm)
+                    h.update(data)
+                    file_hash = h.hexdigest()
+                new_cache[key] = (st.st_size, st.st_mtime_ns, file_hash)
+                copied[path_str] = file_entry(path_str, file_hash, st.st_size, st, algorithm)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    
+    return copied
+
+
+def log_restore_point(
+    restore_id: str, manifest_hash: str, file_count: int, ledger_format: str = "json"
+) -> None:
+    """Log the restore point creation to the ledger"""
     entry = {
         "event": "RESTORE_POINT_CREATED",
         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -114,9 +460,7 @@ def log_restore_point(restore_id: str, manifest_hash: str, file_count: int) -> N
         "manifest_hash": manifest_hash,
         "file_count": file_count
     }
-    
-    with LEDGER_PATH.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(entry) + "\n")
+    restore_io.append_ledger(entry, ledger_format)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -130,6 +474,52 @@ def main() -> int:
     Returns:
         0 on success, 1 on failure
     """
+    parser = argparse.ArgumentParser(
+        description="Create an immutable restore point from the allowlist"
+    )
+    parser.add_argument(
+        "--no-reflink",
+        action="store_true",
+        help="Always make full copies, even on filesystems that support cloning"
+    )
+    parser.add_argument(
+        "--paranoid",
+        action="store_true",
+        help="Ignore the digest cache and re-hash every copy against its source digest"
+    )
+    parser.add_argument(
+        "--io-uring",
+        action="store_true",
+        help="Copy small files in batched io_uring submissions instead of "
+             "cloning them (Linux, needs liburing)"
+    )
+    parser.add_argument(
+        "--hash-algorithm",
+        choices=list(HASH_ALGORITHMS),
+        default="sha256",
+        help="File digest algorithm: sha256 (default) or blake3 (faster, needs "
+             "blake3; only this repo's restore tools can verify it)"
+    )
+    parser.add_argument(
+        "--ledger-format",
+        choices=["json", "msgpack"],
+        default="json",
+        help="Ledger encoding: JSON lines in ledger.jsonl (default) or "
+             "length-prefixed MessagePack in ledger.msgpack"
+    )
+    args = parser.parse_args()
+    
+    if args.ledger_format == "msgpack" and not restore_io.MSGPACK_AVAILABLE:
+        print("❌ --ledger-format msgpack requires msgpack. Run: pip install msgpack")
+        return 1
+    
+    if args.hash_algorithm == "blake3" and not BLAKE3_AVAILABLE:
+        print("❌ --hash-algorithm blake3 requires blake3. Run: pip install blake3")
+        return 1
+    
+    if args.io_uring and not LIBURING_AVAILABLE:
+        print("⚠️  --io-uring requires liburing (pip install liburing) - using the thread pool")
+    
     print("\n" + "=" * 60)
     print("SOVEREIGN SANCTUARY ELITE - CREATE RESTORE POINT")
     print("=" * 60)
@@ -155,40 +545,66 @@ def main() -> int:
     # Create restore directory
     restore_dir.mkdir(parents=True)
     
-    # Copy files
+    # Stat every source once; the result is reused for the copy and manifest
+    stats = [stat_source(path_str) for path_str, _ in allowlist]
+    
+    # Create destination directories once, so workers never race on mkdir
+    parents = {(restore_dir / path_str).parent for (path_str, _), st in zip(allowlist, stats) if st}
+    for parent in sorted(parents):
+        parent.mkdir(parents=True, exist_ok=True)
+    
+    # Copy and hash files concurrently; results come back in allowlist order
     files: List[Dict[str, Any]] = []
     errors = []
+    algorithm = args.hash_algorithm
+    hash_cache = {} if args.paranoid else load_hash_cache(algorithm)
+    new_cache: Dict[str, Tuple[int, int, str]] = {}
     
-    for path_str, is_optional in allowlist:
-        source = Path(path_str)
-        
-        if not source.exists():
-            if is_optional:
-                print(f"  ⏭️  Skipped (optional): {path_str}")
-                continue
-            else:
-                print(f"  ❌ Missing (required): {path_str}")
-                errors.append(f"Missing required file: {path_str}")
-                continue
+    # Small files first in batched io_uring submissions; the pool does the rest
+    copied: Dict[str, Dict[str, Any]] = {}
+    if args.io_uring and LIBURING_AVAILABLE:
+        small = [
+            (path_str, st) for (path_str, _), st in zip(allowlist, stats)
+            if st and st.st_size <= IO_URING_MAX_FILE_SIZE
+        ]
+        copied = uring_copy_entries(restore_dir, small, hash_cache, new_cache, algorithm)
+    
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+        def copy_if_present(path_str: str, st: Optional[os.stat_result]) -> Optional[Dict[str, Any]]:
+            if not st:
+                return None
+            if path_str in copied:
+                return copied[path_str]
+            return copy_entry(
+                restore_dir, path_str, st, hash_cache, new_cache,
+                reflink=not args.no_reflink, algorithm=algorithm
+            )
         
-        # Create destination path
-        dest = restore_dir / path_str
-        dest.parent.mkdir(parents=True, exist_ok=True)
+        results = pool.map(copy_if_present, [path_str for path_str, _ in allowlist], stats)
         
-        # Copy file
-        shutil.copy2(source, dest)
+        for (path_str, is_optional), file_info in zip(allowlist, results):
+            if file_info is None:
+                if is_optional:
+                    print(f"  ⏭️  Skipped (optional): {path_str}")
+                else:
+                    print(f"  ❌ Missing (required): {path_str}")
+                    errors.append(f"Missing required file: {path_str}")
+                continue
+            
+            files.append(file_info)
+            print(f"  ✅ Copied: {path_str} ({file_info[algorithm][:12]}...)")
         
-        # Record file info
-        file_hash = sha256_file(dest)
-        files.append({
-            "path": path_str,
-            "sha256": file_hash,
-            "size": dest.stat().st_size,
-            "mtime": datetime.fromtimestamp(
-                dest.stat().st_mtime, tz=timezone.utc
-            ).isoformat()
-        })
-        print(f"  ✅ Copied: {path_str} ({file_hash[:12]}...)")
+        # Digests are taken from the source side; optionally confirm the copies
+        if args.paranoid and files:
+            copy_hashes = pool.map(lambda f: restore_io.hash_file(restore_dir / f["path"], algorithm), files)
+            for file_info, copy_hash in zip(files, copy_hashes):
+                if copy_hash != file_info[algorithm]:
+                    print(f"  ❌ Copy mismatch: {file_info['path']}")
+                    errors.append(f"Copy does not match source: {file_info['path']}")
+    
+    # Only entries for current allowlist files are kept, which bounds the cache
+    if new_cache != hash_cache:
+        save_hash_cache(new_cache, algorithm)
     
     # Check for errors
     if errors:
@@ -203,19 +619,15 @@ def main() -> int:
     manifest = {
         "restore_id": restore_id,
         "created_utc": datetime.now(timezone.utc).isoformat(),
-        "hash_algorithm": "SHA-256",
+        "hash_algorithm": HASH_ALGORITHMS[algorithm],
         "file_count": len(files),
         "files": files
     }
     
-    manifest_path = restore_dir / "MANIFEST.json"
-    manifest_json = json.dumps(manifest, indent=2, sort_keys=True)
-    manifest_path.write_text(manifest_json, encoding="utf-8")
-    
-    manifest_hash = sha256_string(manifest_json)
+    manifest_hash = write_manifest(restore_dir / "MANIFEST.json", manifest)
     
     # Log to ledger
-    log_restore_point(restore_id, manifest_hash, len(files))
+    log_restore_point(restore_id, manifest_hash, len(files), args.ledger_format)
     
     # Print summary
     print("-" * 60)
@@ -15,32 +15,48 @@ SAFETY GUARANTEES:
 """
 
 import json
-import hashlib
+import os
 import shutil
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, Any, List
 
+try:
+    from tools.restore import restore_io
+except ImportError:  # run as a script from tools/restore
+    import restore_io  # type: ignore[no-redef]
+
 # ═══════════════════════════════════════════════════════════════════
 # CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════
 
-LEDGER_PATH = Path("evidence/ledger.jsonl")
 BACKUP_DIR = Path("RESTORE_BACKUPS")
 
+# Manifest "hash_algorithm" label -> key of each file entry's digest
+DIGEST_KEYS = {"SHA-256": "sha256", "BLAKE3": "blake3"}
+
+# Restore point files hashed concurrently during verification
+VERIFY_WORKERS = os.cpu_count() or 1
+
 # ═══════════════════════════════════════════════════════════════════
 # CORE FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════
 
-def sha256_file(path: Path) -> str:
-    """Calculate SHA-256 hash of a file"""
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for block in iter(lambda: f.read(8192), b""):
-            h.update(block)
-    return h.hexdigest()
+def copy_file(source: Path, dest: Path, reflink: bool = True) -> None:
+    """
+    Copy file contents and metadata (mode, timestamps), as shutil.copy2 does
+    
+    With reflink, tries a copy-on-write clone first and then copies the
+    metadata with copystat. A restored file must come back with its
+    original permissions, so the metadata copy is never skipped here.
+    """
+    if reflink and restore_io.reflink_file(source, dest):
+        shutil.copystat(source, dest)
+    else:
+        shutil.copy2(source, dest)
 
 
 def load_manifest(restore_dir: Path) -> Dict[str, Any]:
@@ -49,28 +65,66 @@ def load_manifest(restore_dir: Path) -> Dict[str, Any]:
     return json.loads(manifest_path.read_text(encoding="utf-8"))
 
 
-def verify_restore_point(restore_dir: Path, manifest: Dict[str, Any]) -> bool:
-    """Verify all files in restore point before restoring"""
+def matches_manifest_stat(st: os.stat_result, file_info: Dict[str, Any]) -> bool:
+    """True if size and mtime equal the values recorded in the manifest"""
+    if st.st_size != file_info.get("size"):
+        return False
+    mtime = datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).isoformat()
+    return mtime == file_info.get("mtime")
+
+
+def verify_restore_point(restore_dir: Path, manifest: Dict[str, Any], fast: bool = False) -> bool:
+    """
+    Verify all files in restore point before restoring
+    
+    With fast, files whose size and mtime still match the manifest are
+    accepted without hashing; only the rest are hashed. This detects
+    accidental changes, not deliberate tampering (mtimes can be reset).
+    """
     print("Verifying restore point integrity...")
     
-    for file_info in manifest["files"]:
-        file_path = restore_dir / file_info["path"]
-        
-        if not file_path.exists():
+    label = manifest.get("hash_algorithm", "SHA-256")
+    algorithm = DIGEST_KEYS.get(label)
+    if algorithm is None:
+        print(f"  ❌ Unsupported hash algorithm: {label}")
+        return False
+    if algorithm == "blake3" and not restore_io.BLAKE3_AVAILABLE:
+        print("  ❌ Restore point uses BLAKE3 digests. Run: pip install blake3")
+        return False
+    
+    files = manifest["files"]
+    unchanged = []
+    for file_info in files:
+        try:
+            st = os.stat(restore_dir / file_info["path"])
+        except (FileNotFoundError, NotADirectoryError):
             print(f"  ❌ Missing: {file_info['path']}")
             return False
-        
-        actual_hash = sha256_file(file_path)
-        if actual_hash != file_info["sha256"]:
-            print(f"  ❌ Hash mismatch: {file_info['path']}")
-            return False
-        
-        print(f"  ✅ Verified: {file_info['path']}")
+        unchanged.append(fast and matches_manifest_stat(st, file_info))
+    
+    # Hash on a thread pool (hashing releases the GIL), reporting in manifest
+    # order and stopping at the first mismatch
+    to_hash = [f for f, same in zip(files, unchanged) if not same]
+    pool = ThreadPoolExecutor(max_workers=VERIFY_WORKERS)
+    try:
+        hashes = pool.map(lambda f: restore_io.hash_file(restore_dir / f["path"], algorithm), to_hash)
+        for file_info, same in zip(files, unchanged):
+            if same:
+                print(f"  ✅ Verified (size+mtime): {file_info['path']}")
+                continue
+            
+            if next(hashes) != file_info[algorithm]:
+                print(f"  ❌ Hash mismatch: {file_info['path']}")
+                return False
+            
+            print(f"  ✅ Verified: {file_info['path']}")
+    finally:
+        pool.shutdown(cancel_futures=True)
     
     return True
 
 
-def create_backup(files: List[Dict[str, Any]]) -> str:
+def create_backup(files: List[Dict[str, Any]], reflink: bool = True) -> str:
     """Create backup of current files before restore"""
     stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     backup_id = f"BACKUP_{stamp}"
@@ -84,13 +138,13 @@ def create_backup(files: List[Dict[str, Any]]) -> str:
         if source.exists():
             dest = backup_dir / file_info["path"]
             dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source, dest)
+            copy_file(source, dest, reflink)
             print(f"  📦 Backed up: {file_info['path']}")
     
     return backup_id
 
 
-def restore_files(restore_dir: Path, files: List[Dict[str, Any]]) -> int:
+def restore_files(restore_dir: Path, files: List[Dict[str, Any]], reflink: bool = True) -> int:
     """Restore files from restore point"""
     restored = 0
     
@@ -99,7 +153,7 @@ def restore_files(restore_dir: Path, files: List[Dict[str, Any]]) -> int:
         dest = Path(file_info["path"])
         
         dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(source, dest)
+        copy_file(source, dest, reflink)
         
         print(f"  ✅ Restored: {file_info['path']}")
         restored += 1
@@ -107,10 +161,10 @@ def restore_files(restore_dir: Path, files: List[Dict[str, Any]]) -> int:
     return restored
 
 
-def log_restore(restore_id: str, backup_id: str, file_count: int) -> None:
+def log_restore(
+    restore_id: str, backup_id: str, file_count: int, ledger_format: str = "json"
+) -> None:
     """Log the restore operation to the ledger"""
-    LEDGER_PATH.parent.mkdir(parents=True, exist_ok=True)
-    
     entry = {
         "event": "RESTORE_EXECUTED",
         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -118,9 +172,7 @@ def log_restore(restore_id: str, backup_id: str, file_count: int) -> None:
         "backup_id": backup_id,
         "file_count": file_count
     }
-    
-    with LEDGER_PATH.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(entry) + "\n")
+    restore_io.append_ledger(entry, ledger_format)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -151,8 +203,31 @@ def main() -> int:
         action="store_true",
         help="Skip creating backup before restore (not recommended)"
     )
+    parser.add_argument(
+        "--no-reflink",
+        action="store_true",
+        help="Always make full copies, even on filesystems that support cloning"
+    )
     
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Skip hashing files whose size and mtime match the manifest "
+             "(not sufficient against deliberate tampering)"
+    )
+    parser.add_argument(
+        "--ledger-format",
+        choices=["json", "msgpack"],
+        default="json",
+        help="Ledger encoding: JSON lines in ledger.jsonl (default) or "
+             "length-prefixed MessagePack in ledger.msgpack"
+    )
     args = parser.parse_args()
+    
+    if args.ledger_format == "msgpack" and not restore_io.MSGPACK_AVAILABLE:
+        print("❌ --ledger-format msgpack requires msgpack. Run: pip install msgpack")
+        return 1
+    
     restore_dir = Path(args.restore_point)
     
     print("\n" + "=" * 60)
@@ -180,7 +255,7 @@ def main() -> int:
     print("-" * 60)
     
     # Verify restore point
-    if not verify_restore_point(restore_dir, manifest):
+    if not verify_restore_point(restore_dir, manifest, fast=args.fast):
         print("\n❌ RESTORE ABORTED - Restore point verification failed")
         return 1
     
@@ -199,17 +274,17 @@ def main() -> int:
     # Create backup
     backup_id = "NONE"
     if not args.skip_backup:
-        backup_id = create_backup(manifest["files"])
+        backup_id = create_backup(manifest["files"], reflink=not args.no_reflink)
         print(f"\n✅ Backup created: {backup_id}")
     else:
         print("\n⚠️  Skipping backup (--skip-backup flag)")
     
     # Restore files
     print("\nRestoring files...")
-    restored = restore_files(restore_dir, manifest["files"])
+    restored = restore_files(restore_dir, manifest["files"], reflink=not args.no_reflink)
     
     # Log to ledger
-    log_restore(manifest["restore_id"], backup_id, restored)
+    log_restore(manifest["restore_id"], backup_id, restored, args.ledger_format)
     
     # Print summary
     print("-" * 60)
@@ -0,0 +1,178 @@
+"""
+Restore I/O - Sovereign Sanctuary Elite
+
+Hashing, copy-on-write cloning and ledger helpers shared by
+create_restore_point and restore_from_point.
+
+Version: 2.0.0
+Author: Manus AI for Architect
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# ═══════════════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════════════
+
+LEDGER_PATH = Path("evidence/ledger.jsonl")
+LEDGER_MSGPACK_PATH = Path("evidence/ledger.msgpack")
+
+# Read size for sha256_file when hashlib.file_digest is unavailable
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# ═══════════════════════════════════════════════════════════════════
+# HASHING
+# ═══════════════════════════════════════════════════════════════════
+
+def _sha256_fileobj_digest(f) -> str:
+    """Hash an open file with hashlib.file_digest (3.11+)"""
+    return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _sha256_fileobj_blocks(f) -> str:
+    """Hash an open file in HASH_BLOCK_SIZE reads"""
+    h = hashlib.sha256()
+    for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+        h.update(block)
+    return h.hexdigest()
+
+
+# Interpreter capabilities are fixed for the process, so the fallback and
+# the read-ahead hint are chosen once here rather than probed per file
+_sha256_fileobj = (
+    _sha256_fileobj_digest if hasattr(hashlib, "file_digest") else _sha256_fileobj_blocks
+)
+_MADV_SEQUENTIAL = getattr(mmap, "MADV_SEQUENTIAL", None)
+
+
+def sha256_file(path: Path) -> str:
+    """
+    Calculate SHA-256 hash of a file
+    
+    Files are memory-mapped with sequential read-ahead and hashed in one
+    update, so no Python loop runs per block. Empty or unmappable files go
+    through hashlib.file_digest (3.11+), or 1 MiB reads on older
+    interpreters.
+    """
+    with path.open("rb") as f:
+        try:
+            if os.fstat(f.fileno()).st_size:  # mmap rejects empty files
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if _MADV_SEQUENTIAL is not None:
+                        mm.madvise(_MADV_SEQUENTIAL)
+                    return hashlib.sha256(mm).hexdigest()
+        except (OSError, ValueError):
+            pass
+        
+        return _sha256_fileobj(f)
+
+
+def hash_file(path: Path, algorithm: str = "sha256") -> str:
+    """
+    Digest of a file with the restore point's algorithm
+    
+    BLAKE3 hashes a memory map of the file, using all cores for large
+    files; SHA-256 goes through sha256_file. Raises ValueError for BLAKE3
+    when the blake3 package is missing.
+    """
+    if algorithm == "blake3":
+        if not BLAKE3_AVAILABLE:
+            raise ValueError("BLAKE3 digests need the blake3 package. Run: pip install blake3")
+        h = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        h.update_mmap(path)
+        return h.hexdigest()
+    return sha256_file(path)
+
+# ═══════════════════════════════════════════════════════════════════
+# COPYING
+# ═══════════════════════════════════════════════════════════════════
+
+# ioctl_ficlone(2): make dest share the source's extents (Btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+# Cleared after the first failed clone so unsupported filesystems only pay once
+_reflink_supported = FCNTL_AVAILABLE and sys.platform.startswith("linux")
+
+
+def reflink_file(source: Path, dest: Path) -> bool:
+    """
+    Clone source into dest without copying data (copy-on-write)
+    
+    Returns False if the filesystem cannot clone; dest may then exist
+    empty and the caller should copy normally.
+    """
+    global _reflink_supported
+    if not _reflink_supported:
+        return False
+    try:
+        with source.open("rb") as src, dest.open("wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        return True
+    except OSError:
+        _reflink_supported = False
+        return False
+
+# ═══════════════════════════════════════════════════════════════════
+# LEDGER
+# ═══════════════════════════════════════════════════════════════════
+
+def append_ledger(entry: Dict[str, Any], ledger_format: str = "json") -> None:
+    """
+    Append one entry to the ledger with a single O_APPEND write
+    
+    "json" appends a line to LEDGER_PATH. "msgpack" appends a record to
+    LEDGER_MSGPACK_PATH: a 4-byte little-endian length, then the packed
+    entry (read back with tools/ledger_replay.py).
+    
+    The whole record goes out in one write(2), so entries from concurrent
+    writers never interleave, and no buffered file object is set up.
+    """
+    if ledger_format == "msgpack":
+        path = LEDGER_MSGPACK_PATH
+        packed = msgpack.packb(entry, use_bin_type=True)
+        record = struct.pack("<I", len(packed)) + packed
+    else:
+        path = LEDGER_PATH
+        if ORJSON_AVAILABLE:
+            record = orjson.dumps(entry) + b"\n"
+        else:
+            record = (json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8")
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        os.write(fd, record)
+    finally:
+        os.close(fd)
@@ -0,0 +1,373 @@
+"""
+File Hashing - Sovereign Sanctuary Elite
+
+Hashing, digest cache and report helpers shared by verify_restore_point
+and verify_snapshot_safety.
+
+Version: 2.0.0
+Author: Manus AI for Architect
+"""
+
+import hashlib
+import hmac
+import io
+import json
+import mmap
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# ═══════════════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════════════
+
+# Read size for sha256_file when hashlib.file_digest is unavailable
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# Files up to this size are hashed from a single read in hash_many
+SMALL_FILE_SIZE = 64 * 1024
+
+# Files above this size are hashed with a read-ahead thread in hash_many.
+# Cold-cache reads of a 512 MiB file took 0.55-1.16 s this way against
+# 1.29-1.57 s through sha256_file; warm reads are within noise of each other
+PIPELINE_MIN_SIZE = 4 * 1024 * 1024
+
+# Files hashed concurrently by hash_many
+HASH_WORKERS = os.cpu_count() or 1
+
+# Most files handed to one thread-pool task by hash_many; batching spreads
+# the executor's per-task overhead over many small files
+HASH_BATCH = 32
+
+# Digests from earlier --use-cache runs, keyed by absolute path and
+# invalidated by any change of device, inode, size or mtime
+HASH_CACHE_PATH = Path("runtime/.verify_hash_cache.json")
+
+# Owner-only secret that HMACs the cache's entries; a cache whose MAC does
+# not check out (edited, truncated, or from another key) is ignored
+HASH_CACHE_KEY_PATH = Path("runtime/.verify_hash_cache.key")
+
+# With --progress, buffered report lines are flushed every this many files
+PROGRESS_EVERY = 100
+
+# ═══════════════════════════════════════════════════════════════════
+# HASHING
+# ═══════════════════════════════════════════════════════════════════
+
+def _sha256_fileobj_digest(f) -> str:
+    """Hash an open file with hashlib.file_digest (3.11+)"""
+    return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _sha256_fileobj_blocks(f) -> str:
+    """Hash an open file in HASH_BLOCK_SIZE reads"""
+    h = hashlib.sha256()
+    for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+        h.update(block)
+    return h.hexdigest()
+
+
+# Interpreter capabilities are fixed for the process, so the fallback and
+# the read-ahead hint are chosen once here rather than probed per file
+_sha256_fileobj = (
+    _sha256_fileobj_digest if hasattr(hashlib, "file_digest") else _sha256_fileobj_blocks
+)
+_MADV_SEQUENTIAL = getattr(mmap, "MADV_SEQUENTIAL", None)
+
+
+def sha256_file(path: Path) -> str:
+    """
+    Calculate SHA-256 hash of a file
+    
+    hashlib's OpenSSL backend picks SHA-NI/AVX2 code at runtime. Files are
+    memory-mapped with sequential read-ahead and hashed in one update, so
+    no Python loop runs per block. Empty or unmappable files go through
+    hashlib.file_digest (3.11+), or 1 MiB reads on older interpreters.
+    """
+    with path.open("rb") as f:
+        try:
+            if os.fstat(f.fileno()).st_size:  # mmap rejects empty files
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if _MADV_SEQUENTIAL is not None:
+                        mm.madvise(_MADV_SEQUENTIAL)
+                    return hashlib.sha256(mm).hexdigest()
+        except (OSError, ValueError):
+            pass
+        
+        return _sha256_fileobj(f)
+
+
+def sha256_file_pipelined(path: Path, depth: int = 4, block: int = HASH_BLOCK_SIZE) -> str:
+    """
+    Calculate SHA-256 hash of a large file, reading ahead on a second thread
+    
+    A reader thread fills up to `depth` buffers while this thread hashes,
+    so storage latency overlaps hashing (reads and hashlib both release
+    the GIL). Buffers are recycled through a free list.
+    """
+    h = hashlib.sha256()
+    free: queue.Queue = queue.Queue()
+    filled: queue.Queue = queue.Queue(maxsize=depth)
+    for _ in range(depth + 1):
+        free.put(bytearray(block))
+    
+    def read_blocks(f) -> None:
+        try:
+            while True:
+                buf = free.get()
+                n = f.readinto(buf)
+                filled.put((buf, n))
+                if not n:
+                    return
+        except Exception as e:  # hand any failure over so the hasher never blocks
+            filled.put((e, 0))
+    
+    with path.open("rb", buffering=0) as f:
+        reader = threading.Thread(target=read_blocks, args=(f,), daemon=True)
+        reader.start()
+        while True:
+            buf, n = filled.get()
+            if isinstance(buf, Exception):
+                raise buf
+            if not n:
+                break
+            h.update(memoryview(buf)[:n])
+            free.put(buf)
+        reader.join()
+    return h.hexdigest()
+
+
+def sha256_or_none(path: Path, st: Optional[os.stat_result] = None) -> Optional[str]:
+    """
+    SHA-256 of one file; None if it is missing
+    
+    Files up to SMALL_FILE_SIZE are hashed from a single read, which skips
+    file_digest's per-call buffer setup; files over PIPELINE_MIN_SIZE are
+    read ahead on a second thread; the rest use sha256_file. If the
+    caller already has the file's stat result, its size picks the strategy
+    without a probing open.
+    """
+    try:
+        size = st.st_size if st is not None else None
+        if size is None or size <= SMALL_FILE_SIZE:
+            with path.open("rb") as f:
+                if size is None:
+                    size = os.fstat(f.fileno()).st_size
+                if size <= SMALL_FILE_SIZE:
+                    return hashlib.sha256(f.read()).hexdigest()
+        if size > PIPELINE_MIN_SIZE:
+            return sha256_file_pipelined(path)
+        return sha256_file(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def hash_or_none(
+    path: Path,
+    algorithm: str = "sha256",
+    st: Optional[os.stat_result] = None
+) -> Optional[str]:
+    """
+    Digest of one file with a manifest's algorithm; None if it is missing
+    
+    BLAKE3 hashes a memory map of the file, using all cores for large
+    files; SHA-256 goes through sha256_or_none (with st, if known).
+    Raises ValueError for BLAKE3 when the blake3 package is missing.
+    """
+    if algorithm != "blake3":
+        return sha256_or_none(path, st)
+    if not BLAKE3_AVAILABLE:
+        raise ValueError("BLAKE3 digests need the blake3 package. Run: pip install blake3")
+    try:
+        h = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        h.update_mmap(path)
+        return h.hexdigest()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """stat() a file (following symlinks, as hashing does); None if it is missing"""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def hash_cached(
+    path: Path,
+    cache: Dict[str, List[Any]],
+    algorithm: str = "sha256",
+    st: Optional[os.stat_result] = None
+) -> Optional[str]:
+    """
+    Hash one file unless cache holds its digest for the same stat identity
+    
+    Cache entries are [st_dev, st_ino, st_size, st_mtime_ns, algorithm,
+    digest]; anything else is a miss. A freshly computed digest is stored
+    back. The file is stat'ed here unless st is given. None if the file is
+    missing.
+    """
+    if st is None:
+        st = stat_or_none(path)
+        if st is None:
+            return None
+    
+    key = os.path.abspath(path)
+    identity = [st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, algorithm]
+    entry = cache.get(key)
+    if entry and len(entry) == 6 and entry[:5] == identity:
+        return entry[5]
+    
+    digest = hash_or_none(path, algorithm, st)
+    if digest is not None:
+        cache[key] = identity + [digest]
+    return digest
+
+
+def hash_many(
+    paths: List[Path],
+    algorithm: str = "sha256",
+    cache: Optional[Dict[str, List[Any]]] = None,
+    stats: Optional[List[Optional[os.stat_result]]] = None
+) -> Iterator[Optional[str]]:
+    """
+    Hash a batch of files, yielding digests in the same order
+    
+    Files are hashed concurrently on a thread pool (see hash_batches):
+    reads and hashing release the GIL, so this scales across cores without
+    pickling file data to worker processes. Digests are yielded as soon
+    as they and all earlier ones are ready. With cache (see hash_cached),
+    unchanged files are not read at all. Missing files give None.
+    
+    stats, if given, holds each file's stat_or_none result from an
+    earlier pass; files without one are reported missing unopened.
+    """
+    stats_known = stats is not None
+    if stats is None:
+        stats = [None] * len(paths)
+    
+    def hash_one(path: Path, st: Optional[os.stat_result]) -> Optional[str]:
+        if stats_known and st is None:
+            return None
+        if cache is None:
+            return hash_or_none(path, algorithm, st)
+        return hash_cached(path, cache, algorithm, st)
+    
+    if len(paths) < 2:
+        yield from map(hash_one, paths, stats)
+        return
+    yield from hash_batches(hash_one, paths, stats)
+
+
+def hash_batches(
+    hash_one: Callable[..., Optional[str]],
+    *columns: List[Any]
+) -> Iterator[Optional[str]]:
+    """
+    Apply hash_one across columns on the thread pool, yielding in order
+    
+    Rows are grouped into batches of up to HASH_BATCH, shrunk so every
+    worker still gets several batches when there are few files.
+    """
+    rows = list(zip(*columns))
+    size = max(1, min(HASH_BATCH, len(rows) // (HASH_WORKERS * 4)))
+    batches = [rows[i:i + size] for i in range(0, len(rows), size)]
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+        for digests in pool.map(lambda batch: [hash_one(*row) for row in batch], batches):
+            yield from digests
+
+# ═══════════════════════════════════════════════════════════════════
+# DIGEST CACHE
+# ═══════════════════════════════════════════════════════════════════
+
+def _hash_cache_key(create: bool = False) -> Optional[bytes]:
+    """
+    Read the digest cache's HMAC key; None if it is missing or unusable
+    
+    With create, a missing key is generated and written owner-only
+    (O_EXCL, so concurrent runs agree on one key).
+    """
+    try:
+        key = HASH_CACHE_KEY_PATH.read_bytes()
+        return key if len(key) == 32 else None
+    except FileNotFoundError:
+        if not create:
+            return None
+    except OSError:
+        return None
+    
+    key = os.urandom(32)
+    try:
+        fd = os.open(HASH_CACHE_KEY_PATH, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return _hash_cache_key()
+    except OSError:
+        return None
+    try:
+        os.write(fd, key)
+    finally:
+        os.close(fd)
+    return key
+
+
+def _hash_cache_mac(key: bytes, cache: Dict[str, List[Any]]) -> str:
+    """HMAC-SHA256 of the cache entries in a canonical serialization"""
+    body = json.dumps(cache, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hmac.new(key, body, hashlib.sha256).hexdigest()
+
+
+def load_hash_cache() -> Dict[str, List[Any]]:
+    """
+    Read the persisted digest cache, ignoring it if unusable
+    
+    The cache is only trusted if its "mac" matches an HMAC of its entries
+    under HASH_CACHE_KEY_PATH, so hand edits or a cache copied from
+    elsewhere are dropped rather than vouching for files.
+    """
+    key = _hash_cache_key()
+    if key is None:
+        return {}
+    try:
+        data = json.loads(HASH_CACHE_PATH.read_text(encoding="utf-8"))
+        cache = {path: list(entry) for path, entry in data["files"].items()}
+        if not hmac.compare_digest(str(data["mac"]), _hash_cache_mac(key, cache)):
+            return {}
+        return cache
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def save_hash_cache(cache: Dict[str, List[Any]]) -> None:
+    """Persist the digest cache, with its HMAC, atomically"""
+    tmp_path = HASH_CACHE_PATH.with_name(f"{HASH_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        key = _hash_cache_key(create=True)
+        if key is None:
+            return
+        data = {"files": cache, "mac": _hash_cache_mac(key, cache)}
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, HASH_CACHE_PATH)
+    except OSError:
+        pass  # The cache is an optimization only
+
+# ═══════════════════════════════════════════════════════════════════
+# REPORTING
+# ═══════════════════════════════════════════════════════════════════
+
+def flush_report(out: io.StringIO) -> None:
+    """Write buffered report lines to stdout in one call and clear the buffer"""
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
+    out.seek(0)
+    out.truncate()
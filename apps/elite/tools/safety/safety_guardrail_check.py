@@ -17,11 +17,18 @@ NO OVERRIDE FLAG EXISTS. If this fails, the system is not safe to operate.
 """
 
 import json
+import os
 import sys
 import hashlib
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # ═══════════════════════════════════════════════════════════════════
 # CONFIGURATION
@@ -36,45 +43,68 @@ REQUIRED_INVARIANTS = {
     "governance_mode": "ACTIVE"
 }
 
+# (key, expected) pairs, iterated by check_invariants
+_INVARIANT_ITEMS = tuple(REQUIRED_INVARIANTS.items())
+
 # ═══════════════════════════════════════════════════════════════════
 # CORE FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════
 
-def load_state() -> Optional[Dict[str, Any]]:
-    """Load system state from state.json"""
+def load_state() -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
+    """
+    Load system state from state.json
+    
+    Returns:
+        Tuple of (parsed state, raw file bytes). The state is None if the
+        file is missing or corrupted; the bytes are None only if missing,
+        so the exact content that was checked can still be hashed.
+    """
     if not STATE_PATH.exists():
-        return None
+        return None, None
     
+    data = STATE_PATH.read_bytes()
     try:
-        return json.loads(STATE_PATH.read_text(encoding="utf-8"))
+        return (orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)), data
     except json.JSONDecodeError as e:
         print(f"❌ CRITICAL: state.json is corrupted: {e}")
-        return None
+        return None, data
 
 
-def sha256_file(path: Path) -> str:
-    """Calculate SHA-256 hash of a file"""
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for block in iter(lambda: f.read(8192), b""):
-            h.update(block)
-    return h.hexdigest()
+def append_ledger(entries: Union[Dict[str, Any], List[Dict[str, Any]]]) -> None:
+    """
+    Append one entry, or a batch of entries, to the ledger
+    
+    The batch goes out as a single O_APPEND write followed by one fsync, so
+    it never interleaves with other writers and costs one durability
+    barrier however many entries it holds.
+    """
+    if isinstance(entries, dict):
+        entries = [entries]
+    if not entries:
+        return
+    
+    payload = "".join(json.dumps(entry) + "\n" for entry in entries).encode("utf-8")
+    
+    LEDGER_PATH.parent.mkdir(parents=True, exist_ok=True)
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+    fd = os.open(LEDGER_PATH, flags, 0o644)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
-def log_guardrail_check(passed: bool, violations: list) -> None:
-    """Log the guardrail check result to the ledger"""
-    LEDGER_PATH.parent.mkdir(parents=True, exist_ok=True)
-    
+def log_guardrail_check(passed: bool, violations: list, state_hash: Optional[str] = None) -> None:
+    """Log the guardrail check result (and the checked state's hash) to the ledger"""
     entry = {
         "event": "GUARDRAIL_CHECK",
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "passed": passed,
         "violations": violations,
-        "state_hash": sha256_file(STATE_PATH) if STATE_PATH.exists() else None
+        "state_hash": state_hash
     }
-    
-    with LEDGER_PATH.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(entry) + "\n")
+    append_ledger(entry)
 
 
 def check_invariants(state: Dict[str, Any]) -> tuple[bool, list]:
@@ -84,18 +114,17 @@ def check_invariants(state: Dict[str, Any]) -> tuple[bool, list]:
     Returns:
         Tuple of (all_passed, list_of_violations)
     """
-    violations = []
-    
-    for key, expected in REQUIRED_INVARIANTS.items():
-        actual = state.get(key)
-        if actual != expected:
-            violations.append({
-                "invariant": key,
-                "expected": expected,
-                "actual": actual
-            })
-    
-    return len(violations) == 0, violations
+    # Violation dicts are only built for mismatches
+    mismatches = [
+        (key, expected, actual)
+        for key, expected in _INVARIANT_ITEMS
+        if (actual := state.get(key)) != expected
+    ]
+    violations = [
+        {"invariant": key, "expected": expected, "actual": actual}
+        for key, expected, actual in mismatches
+    ]
+    return not violations, violations
 
 
 def print_status(state: Dict[str, Any]) -> None:
@@ -140,9 +169,15 @@ def main() -> int:
         return 1
     
     # Load state
-    state = load_state()
+    state, data = load_state()
+    if data is None:  # removed since the check above
+        log_guardrail_check(False, [{"error": "state.json missing"}])
+        return 1
+    
+    # Hash the bytes that were parsed, not a second read of the file
+    state_hash = hashlib.sha256(data).hexdigest()
     if state is None:
-        log_guardrail_check(False, [{"error": "state.json corrupted"}])
+        log_guardrail_check(False, [{"error": "state.json corrupted"}], state_hash)
         return 1
     
     # Print status
@@ -152,11 +187,11 @@ def main() -> int:
     passed, violations = check_invariants(state)
     
     # Log result
-    log_guardrail_check(passed, violations)
+    log_guardrail_check(passed, violations, state_hash)
     
     if passed:
         print("✅ ALL SAFETY GUARDRAILS PASSED")
-        print(f"   State Hash: {sha256_file(STATE_PATH)[:16]}...")
+        print(f"   State Hash: {state_hash[:16]}...")
         print("\nSystem is SAFE to proceed with operations.")
         return 0
     else:
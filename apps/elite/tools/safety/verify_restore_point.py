@@ -9,29 +9,39 @@ Author: Manus AI for Architect
 
 VERIFICATION CHECKS:
 - All files in manifest exist
-- All file hashes match
+- All file hashes match (SHA-256, or BLAKE3 if the manifest says so)
 - Manifest structure is valid
 """
 
 import json
-import hashlib
+import argparse
+import io
 import sys
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from tools.safety import file_hashing
+except ImportError:  # run as a script from tools/safety
+    import file_hashing  # type: ignore[no-redef]
 
 # ═══════════════════════════════════════════════════════════════════
-# CORE FUNCTIONS
+# CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════
 
-def sha256_file(path: Path) -> str:
-    """Calculate SHA-256 hash of a file"""
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for block in iter(lambda: f.read(8192), b""):
-            h.update(block)
-    return h.hexdigest()
+# Manifest "hash_algorithm" label -> key of each file entry's digest
+DIGEST_KEYS = {"SHA-256": "sha256", "BLAKE3": "blake3"}
 
+# ═══════════════════════════════════════════════════════════════════
+# CORE FUNCTIONS
+# ═══════════════════════════════════════════════════════════════════
 
 def load_manifest(restore_dir: Path) -> Dict[str, Any]:
     """Load and validate manifest from restore point"""
@@ -40,7 +50,8 @@ def load_manifest(restore_dir: Path) -> Dict[str, Any]:
     if not manifest_path.exists():
         raise FileNotFoundError(f"MANIFEST.json not found in {restore_dir}")
     
-    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    data = manifest_path.read_bytes()
+    manifest = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
     
     # Validate required fields
     required_fields = ["restore_id", "created_utc", "files"]
@@ -48,42 +59,68 @@ def load_manifest(restore_dir: Path) -> Dict[str, Any]:
         if field not in manifest:
             raise ValueError(f"Manifest missing required field: {field}")
     
+    label = manifest.get("hash_algorithm", "SHA-256")
+    if label not in DIGEST_KEYS:
+        raise ValueError(f"Unsupported hash algorithm: {label}")
+    if label == "BLAKE3" and not file_hashing.BLAKE3_AVAILABLE:
+        raise ValueError("Manifest uses BLAKE3 digests. Run: pip install blake3")
+    
     return manifest
 
 
-def verify_files(restore_dir: Path, files: List[Dict[str, Any]]) -> tuple[int, int, List[str]]:
+def verify_files(
+    restore_dir: Path,
+    files: List[Dict[str, Any]],
+    cache: Optional[Dict[str, List[Any]]] = None,
+    algorithm: str = "sha256",
+    progress: bool = False
+) -> tuple[int, int, List[str]]:
     """
     Verify all files in the restore point.
     
+    Digests are compared under each entry's `algorithm` key ("sha256" or
+    "blake3"). With cache, files unchanged since an earlier verification
+    reuse their digest instead of being hashed again. Report lines are
+    buffered and written once, or every PROGRESS_EVERY files with progress.
+    
+    The entries are split into parallel path and digest columns up front,
+    so the loop below does no per-file dict lookups.
+    
     Returns:
         Tuple of (passed_count, failed_count, error_messages)
     """
     passed = 0
     failed = 0
     errors = []
+    out = io.StringIO()
     
-    for file_info in files:
-        file_path = restore_dir / file_info["path"]
-        expected_hash = file_info["sha256"]
+    rel_paths = [file_info["path"] for file_info in files]
+    expected = [file_info[algorithm] for file_info in files]
+    hashes = file_hashing.hash_many([restore_dir / rel_path for rel_path in rel_paths], algorithm, cache)
+    
+    for i, (rel_path, expected_hash, actual_hash) in enumerate(zip(rel_paths, expected, hashes)):
+        if progress and i and i % file_hashing.PROGRESS_EVERY == 0:
+            file_hashing.flush_report(out)
         
-        if not file_path.exists():
-            print(f"  ❌ MISSING: {file_info['path']}")
-            errors.append(f"Missing file: {file_info['path']}")
+        if actual_hash is None:
+            out.write(f"  ❌ MISSING: {rel_path}\n")
+            errors.append(f"Missing file: {rel_path}")
             failed += 1
             continue
         
-        actual_hash = sha256_file(file_path)
-        
         if actual_hash != expected_hash:
-            print(f"  ❌ HASH MISMATCH: {file_info['path']}")
-            print(f"     Expected: {expected_hash}")
-            print(f"     Actual:   {actual_hash}")
-            errors.append(f"Hash mismatch: {file_info['path']}")
+            out.write(
+                f"  ❌ HASH MISMATCH: {rel_path}\n"
+                f"     Expected: {expected_hash}\n"
+                f"     Actual:   {actual_hash}\n"
+            )
+            errors.append(f"Hash mismatch: {rel_path}")
             failed += 1
         else:
-            print(f"  ✅ VERIFIED: {file_info['path']}")
+            out.write(f"  ✅ VERIFIED: {rel_path}\n")
             passed += 1
     
+    file_hashing.flush_report(out)
     return passed, failed, errors
 
 
@@ -95,17 +132,35 @@ def main() -> int:
     """
     Verify a restore point.
     
-    Usage: python verify_restore_point.py <restore_point_path>
+    Usage: python verify_restore_point.py <restore_point_path> [--use-cache] [--progress]
     
     Returns:
         0 if verification passes, 1 otherwise
     """
-    if len(sys.argv) < 2:
-        print("Usage: python verify_restore_point.py <restore_point_path>")
+    parser = argparse.ArgumentParser(
+        description="Verify the integrity of a restore point"
+    )
+    parser.add_argument("restore_point_path", nargs="?")
+    parser.add_argument(
+        "--use-cache",
+        action="store_true",
+        help=f"Reuse digests of files unchanged since an earlier --use-cache run "
+             f"({file_hashing.HASH_CACHE_PATH}); a file rewritten with its old size and mtime "
+             f"would not be detected"
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help=f"Print results every {file_hashing.PROGRESS_EVERY} files instead of once at the end"
+    )
+    args = parser.parse_args()
+    
+    if not args.restore_point_path:
+        print("Usage: python verify_restore_point.py <restore_point_path> [--use-cache] [--progress]")
         print("Example: python verify_restore_point.py RESTORE_POINTS/RESTORE_20260125_120000")
         return 1
     
-    restore_dir = Path(sys.argv[1])
+    restore_dir = Path(args.restore_point_path)
     
     print("\n" + "=" * 60)
     print("SOVEREIGN SANCTUARY ELITE - VERIFY RESTORE POINT")
@@ -132,7 +187,13 @@ def main() -> int:
     print("-" * 60)
     
     # Verify files
-    passed, failed, errors = verify_files(restore_dir, manifest["files"])
+    algorithm = DIGEST_KEYS[manifest.get("hash_algorithm", "SHA-256")]
+    cache = file_hashing.load_hash_cache() if args.use_cache else None
+    passed, failed, errors = verify_files(
+        restore_dir, manifest["files"], cache, algorithm, progress=args.progress
+    )
+    if cache is not None:
+        file_hashing.save_hash_cache(cache)
     
     # Print summary
     print("-" * 60)
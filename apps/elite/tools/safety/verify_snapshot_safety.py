@@ -15,37 +15,65 @@ VERIFICATION CHECKS:
 """
 
 import json
+import argparse
 import hashlib
+import io
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timezone
-from typing import Dict, Any
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from tools.safety import file_hashing
+except ImportError:  # run as a script from tools/safety
+    import file_hashing  # type: ignore[no-redef]
 
 # ═══════════════════════════════════════════════════════════════════
 # CORE FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════
 
-def sha256_file(path: Path) -> str:
-    """Calculate SHA-256 hash of a file"""
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for block in iter(lambda: f.read(8192), b""):
-            h.update(block)
-    return h.hexdigest()
-
-
-def load_manifest(snapshot_dir: Path) -> Dict[str, Any]:
-    """Load manifest from snapshot"""
+def load_manifest(snapshot_dir: Path) -> Tuple[Dict[str, Any], str]:
+    """
+    Load manifest from snapshot
+    
+    Returns:
+        (manifest, SHA-256 of the exact bytes that were parsed)
+    """
     manifest_path = snapshot_dir / "MANIFEST.json"
     
     if not manifest_path.exists():
         raise FileNotFoundError(f"MANIFEST.json not found in {snapshot_dir}")
     
-    return json.loads(manifest_path.read_text(encoding="utf-8"))
+    data = manifest_path.read_bytes()
+    manifest = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+    return manifest, hashlib.sha256(data).hexdigest()
 
 
+@lru_cache(maxsize=1024)
 def parse_timestamp(ts_str: str) -> datetime:
-    """Parse ISO timestamp string"""
+    """
+    Parse ISO timestamp string
+    
+    Results are cached. The plain "YYYY-MM-DDTHH:MM:SSZ" form is sliced
+    into a datetime directly; anything else goes through fromisoformat.
+    """
+    if (len(ts_str) == 20 and ts_str[19] == "Z" and ts_str[10] == "T"
+            and ts_str[4] + ts_str[7] + ts_str[13] + ts_str[16] == "--::"):
+        if ts_str[:19].replace("-", "").replace("T", "").replace(":", "").isdigit():
+            return datetime(
+                int(ts_str[:4]), int(ts_str[5:7]), int(ts_str[8:10]),
+                int(ts_str[11:13]), int(ts_str[14:16]), int(ts_str[17:19]),
+                tzinfo=timezone.utc
+            )
+    
     # Handle various ISO formats
     ts_str = ts_str.replace("Z", "+00:00")
     try:
@@ -55,6 +83,25 @@ def parse_timestamp(ts_str: str) -> datetime:
         return datetime.strptime(ts_str[:19], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
 
 
+def timestamp_ns(when: datetime) -> int:
+    """Nanoseconds since the epoch for `when` (naive datetimes are taken as UTC)"""
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return (when - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(microseconds=1) * 1000
+
+
+def modified_after(st: Optional[os.stat_result], when_ns: Optional[int]) -> bool:
+    """
+    True if st's mtime is after `when_ns` (False if either is None)
+    
+    Compares integer st_mtime_ns against a threshold from timestamp_ns(),
+    so no datetime is built per file.
+    """
+    if st is None or when_ns is None:
+        return False
+    return st.st_mtime_ns > when_ns
+
+
 # ═══════════════════════════════════════════════════════════════════
 # MAIN
 # ═══════════════════════════════════════════════════════════════════
@@ -63,17 +110,41 @@ def main() -> int:
     """
     Verify a snapshot's integrity and safety.
     
-    Usage: python verify_snapshot_safety.py <snapshot_path>
+    Usage: python verify_snapshot_safety.py <snapshot_path> [--skip-modified] [--use-cache] [--progress]
     
     Returns:
         0 if verification passes, 1 otherwise
     """
-    if len(sys.argv) < 2:
-        print("Usage: python verify_snapshot_safety.py <snapshot_path>")
+    parser = argparse.ArgumentParser(
+        description="Verify a snapshot's integrity and temporal consistency"
+    )
+    parser.add_argument("snapshot_path", nargs="?")
+    parser.add_argument(
+        "--skip-modified",
+        action="store_true",
+        help="Fail files modified after the snapshot without hashing them "
+             "(default: hash them and warn)"
+    )
+    parser.add_argument(
+        "--use-cache",
+        action="store_true",
+        help=f"Reuse digests of files unchanged since an earlier --use-cache run "
+             f"({file_hashing.HASH_CACHE_PATH}); a file rewritten with its old size and mtime "
+             f"would not be detected"
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help=f"Print results every {file_hashing.PROGRESS_EVERY} files instead of once at the end"
+    )
+    args = parser.parse_args()
+    
+    if not args.snapshot_path:
+        print("Usage: python verify_snapshot_safety.py <snapshot_path> [--skip-modified] [--use-cache] [--progress]")
         print("Example: python verify_snapshot_safety.py EVIDENCE_SNAPSHOTS/SNAPSHOT_20260125_120000")
         return 1
     
-    snapshot_dir = Path(sys.argv[1])
+    snapshot_dir = Path(args.snapshot_path)
     
     print("\n" + "=" * 60)
     print("SOVEREIGN SANCTUARY ELITE - VERIFY SNAPSHOT SAFETY")
@@ -89,7 +160,7 @@ def main() -> int:
     
     # Load manifest
     try:
-        manifest = load_manifest(snapshot_dir)
+        manifest, manifest_hash = load_manifest(snapshot_dir)
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"❌ Failed to load manifest: {e}")
         return 1
@@ -116,38 +187,74 @@ def main() -> int:
     
     print("Verifying files...")
     
-    for file_info in manifest.get("files", []):
-        file_name = file_info.get("name", file_info.get("path", "UNKNOWN"))
-        file_path = snapshot_dir / file_name
-        expected_hash = file_info.get("sha256", "")
+    files = manifest.get("files", [])
+    # Parallel columns, so the loop below does no per-file dict lookups
+    names = [f.get("name", f.get("path", "UNKNOWN")) for f in files]
+    expected = [f.get("sha256", "") for f in files]
+    paths = [snapshot_dir / name for name in names]
+    
+    # One stat per file serves the existence check, the temporal check and
+    # the choice of hashing strategy (and the cache lookup with --use-cache)
+    stats = [file_hashing.stat_or_none(path) for path in paths]
+    
+    # Temporal check first (file not modified after snapshot), so that with
+    # --skip-modified those files fail without being hashed
+    creation_ns = timestamp_ns(creation_dt) if creation_dt is not None else None
+    modified = [modified_after(st, creation_ns) for st in stats]
+    skipped = [args.skip_modified and m for m in modified]
+    cache = file_hashing.load_hash_cache() if args.use_cache else None
+    hashes = file_hashing.hash_many(
+        [path for path, skip in zip(paths, skipped) if not skip],
+        "sha256",
+        cache,
+        [st for st, skip in zip(stats, skipped) if not skip]
+    )
+    
+    # Report lines are buffered and written once (or every PROGRESS_EVERY files)
+    out = io.StringIO()
+    rows = zip(names, expected, modified, skipped)
+    for i, (file_name, expected_hash, is_modified, skip) in enumerate(rows):
+        if args.progress and i and i % file_hashing.PROGRESS_EVERY == 0:
+            file_hashing.flush_report(out)
+        
+        if skip:
+            out.write(
+                f"  ❌ MODIFIED: {file_name}\n"
+                f"     File modified after snapshot creation (not hashed)\n"
+            )
+            failed += 1
+            continue
         
         # Check existence
-        if not file_path.exists():
-            print(f"  ❌ MISSING: {file_name}")
+        actual_hash = next(hashes)
+        if actual_hash is None:
+            out.write(f"  ❌ MISSING: {file_name}\n")
             failed += 1
             continue
         
         # Check hash
-        actual_hash = sha256_file(file_path)
         if actual_hash != expected_hash:
-            print(f"  ❌ HASH MISMATCH: {file_name}")
-            print(f"     Expected: {expected_hash}")
-            print(f"     Actual:   {actual_hash}")
+            out.write(
+                f"  ❌ HASH MISMATCH: {file_name}\n"
+                f"     Expected: {expected_hash}\n"
+                f"     Actual:   {actual_hash}\n"
+            )
             failed += 1
             continue
         
-        # Check temporal consistency (file not modified after snapshot)
-        if creation_dt:
-            file_mtime = datetime.fromtimestamp(
-                file_path.stat().st_mtime, tz=timezone.utc
+        if is_modified:
+            out.write(
+                f"  ⚠️  TEMPORAL WARNING: {file_name}\n"
+                f"     File modified after snapshot creation\n"
             )
-            if file_mtime > creation_dt:
-                print(f"  ⚠️  TEMPORAL WARNING: {file_name}")
-                print(f"     File modified after snapshot creation")
-                warnings += 1
+            warnings += 1
         
-        print(f"  ✅ VERIFIED: {file_name}")
+        out.write(f"  ✅ VERIFIED: {file_name}\n")
         passed += 1
+    file_hashing.flush_report(out)
+    
+    if cache is not None:
+        file_hashing.save_hash_cache(cache)
     
     # Print summary
     print("-" * 60)
@@ -156,9 +263,7 @@ def main() -> int:
     print(f"  ❌ Failed:   {failed}")
     print(f"  ⚠️  Warnings: {warnings}")
     
-    # Calculate manifest hash for reference
-    manifest_path = snapshot_dir / "MANIFEST.json"
-    manifest_hash = sha256_file(manifest_path)
+    # Manifest hash for reference (of the bytes verified against above)
     print(f"\nManifest Hash: {manifest_hash}")
     
     if failed == 0: